@@ -1,26 +1,37 @@
-from PyQt5.QtWidgets import QApplication
+from utilities.startup_trace import get_startup_trace
 
-from utilities.essential_main_menu_window import MainMenuOfEssential
+startup_trace = get_startup_trace()
+startup_trace.start()
+
+with startup_trace.phase("import PyQt5.QtWidgets"):
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import QTimer
+
+with startup_trace.phase("import main menu"):
+    from utilities.essential_main_menu_window import MainMenuOfEssential
+
+from utilities.logging_pipeline import configure_logging
 
 import sys
-import os
 
-import logging
 
-logging.basicConfig(
-    level=logging.ERROR, 
-    format="%(levelname)s on %(asctime)s in %(filename)s; %(message)s", 
-    datefmt="%d/%m/%Y, %I:%M:%S %p"
-)
+def report_first_window_shown():
+    startup_trace.mark("first window shown")
+    startup_trace.report()
 
 
 def main():
-    os.system("cls")
+    configure_logging()
+
+    with startup_trace.phase("create QApplication"):
+        application = QApplication(sys.argv)
 
-    application = QApplication(sys.argv)
+    with startup_trace.phase("create main menu"):
+        window_to_be_shown_first = MainMenuOfEssential()
+        window_to_be_shown_first.show()
 
-    window_to_be_shown_first = MainMenuOfEssential()
-    window_to_be_shown_first.show()
+    # Runs once the event loop has painted the first window.
+    QTimer.singleShot(0, report_first_window_shown)
 
     sys.exit(application.exec())
 
@@ -0,0 +1,38 @@
+"""The baselines the benchmarks compare against, kept free of `PyQt5`."""
+
+from pathlib import Path
+
+import json
+import math
+import platform
+
+
+def get_machine() -> str:
+    """Timings only compare between runs on the same kind of machine and interpreter."""
+
+    return f"{platform.system()} {platform.machine()} {platform.python_implementation()} {platform.python_version()}"
+
+
+def get_percentile(values, percentile: float) -> float:
+    """Returns the nearest-rank `percentile` (0 to 100) of `values`."""
+
+    ordered_values = sorted(values)
+
+    rank = max(math.ceil(percentile / 100 * len(ordered_values)), 1)
+
+    return ordered_values[rank - 1]
+
+
+def read_baseline(path: Path):
+    """Returns the machine and the results of a recorded baseline, or `None` if there is none."""
+
+    try:
+        baseline = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+
+    return baseline["machine"], baseline["results"]
+
+
+def write_baseline(path: Path, results: dict) -> None:
+    path.write_text(json.dumps({"machine": get_machine(), "results": results}, indent=4) + "\n", encoding="utf-8")
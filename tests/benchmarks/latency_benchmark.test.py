@@ -0,0 +1,458 @@
+"""
+Measures what typing feels like: an offscreen `utilities.ide.EssentialIDE` replays the recorded sessions of
+`editing_sessions.json` through `PyQt5.QtTest.QTest`, timing every input event until the visible lines are
+styled and repainted. \\
+Every session is replayed several times, and the median of its per-run p50 latencies is tracked per document size
+in `latency_baseline.json`: a regression past the tolerance fails the run, as does a checkout without a baseline. \\
+Only sessions with enough events are compared, and only by their p50, the p99 and max of a few dozen events
+are their single slowest ones and only reported. Latencies are only compared against a baseline recorded
+on the same kind of machine, on any other they are just reported. \\
+Sessions still left once the run outlasts `PYSEE_BENCHMARK_TIMEOUT_SECONDS` are skipped. \\
+Run from the root of the repository with `PYTHONPATH=. python3 tests/benchmarks/latency_benchmark.test.py`;
+`PYSEE_BENCHMARK_LINE_COUNTS=1000,10000` sets the sizes, as for the lexer benchmark, `PYSEE_BENCHMARK_SESSIONS` replays other
+recorded sessions and `PYSEE_BENCHMARK_UPDATE_BASELINE=1` records a new baseline.
+"""
+
+import os
+import tempfile
+
+# Must be set before the `QApplication` exists.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Journals, caches and warm interpreters go to a throwaway home, never the user's,
+# and no recovery prompt from a previous session can block the run.
+BENCHMARK_HOME = tempfile.mkdtemp(prefix="pysee_benchmark_")
+
+os.environ["HOME"] = os.environ["USERPROFILE"] = BENCHMARK_HOME
+
+import unittest
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QKeyEvent, QWheelEvent
+from PyQt5.QtCore import QObject, QEvent, QPoint, QPointF, QTimer, Qt, pyqtSlot
+from PyQt5.QtTest import QTest
+from PyQt5.Qsci import QsciScintilla
+
+from utilities.ide import EssentialIDE
+from utilities.document_loader import DocumentLoader
+from utilities.scintilla_buffer import get_position_from_line
+
+from tests.benchmarks.synthetic_corpus import generate_corpus
+from tests.benchmarks.benchmark_results import get_machine, get_percentile, read_baseline, write_baseline
+
+from pathlib import Path
+
+import sys
+import json
+import time
+import shutil
+import statistics
+
+BASELINE_PATH = Path(__file__).with_name("latency_baseline.json")
+
+SESSIONS_PATH = Path(os.environ.get("PYSEE_BENCHMARK_SESSIONS", Path(__file__).with_name("editing_sessions.json")))
+
+LINE_COUNTS = tuple(
+    int(count) for count in os.environ.get("PYSEE_BENCHMARK_LINE_COUNTS", "1000,10000,100000").split(",")
+)
+
+UPDATE_BASELINE = bool(os.environ.get("PYSEE_BENCHMARK_UPDATE_BASELINE"))
+
+# Latencies are noisier than throughput, so they get more slack.
+LATENCY_TOLERANCE = 1.0
+
+# Added to every compared latency, a frame of a few milliseconds is easily doubled by one scheduler tick.
+LATENCY_SLACK_SECONDS = 0.002
+
+# Replays of every session, for the baseline and for the run compared against it alike.
+REPLAYS = 3
+
+# Sessions with fewer events, like pasting or scrolling, are only reported.
+MINIMUM_COMPARED_EVENTS = 20
+
+STEP_TIMEOUT_SECONDS = 5
+SETTLING_TIMEOUT_SECONDS = 120
+
+# The whole run, a hung or pathologically slow editor must not keep it going indefinitely.
+BENCHMARK_TIMEOUT_SECONDS = float(os.environ.get("PYSEE_BENCHMARK_TIMEOUT_SECONDS", 600))
+
+# Wheel notches, as `QWheelEvent` counts them.
+ANGLE_OF_A_NOTCH = 120
+
+
+def get_visible_lines(editor: QsciScintilla) -> tuple:
+    """Returns the first and the last document line shown in the viewport."""
+
+    first_visible_line = editor.SendScintilla(QsciScintilla.SCI_GETFIRSTVISIBLELINE)
+    lines_on_screen = editor.SendScintilla(QsciScintilla.SCI_LINESONSCREEN)
+
+    return (
+        editor.SendScintilla(QsciScintilla.SCI_DOCLINEFROMVISIBLE, first_visible_line),
+        editor.SendScintilla(QsciScintilla.SCI_DOCLINEFROMVISIBLE, first_visible_line + lines_on_screen)
+    )
+
+
+class PaintProbe(QObject):
+    """
+    Watches the paints of the editor's viewport, and the styles the lexing worker applies to it between them. \\
+    Styles that change nothing on screen are never repainted, so a frame is final by its last paint
+    or its last styling of the viewport, whichever came later. \\
+    Inherits `PyQt5.QtCore.QObject`.
+    """
+    def __init__(self, editor: QsciScintilla, lexer) -> None:
+        super(PaintProbe, self).__init__(editor)
+
+        self.editor = editor
+
+        self.painted = False
+        self.last_paint_time = 0.0
+        self.last_styling_time = 0.0
+
+        # Requests for lines off screen, like those of the background fill, don't hold a frame back.
+        self.is_viewport_requested = False
+
+        editor.viewport().installEventFilter(self)
+        lexer.style_runs_requested.connect(self.record_request)
+        lexer.style_runs_applied.connect(self.record_styling)
+
+    def reset(self) -> None:
+        self.painted = False
+        self.last_paint_time = 0.0
+        self.last_styling_time = 0.0
+
+    def get_frame_time(self) -> float:
+        return max(self.last_paint_time, self.last_styling_time)
+
+    def eventFilter(self, watched, event):
+        # The paint itself runs right after the filter, before control returns to `processEvents`.
+        if event.type() == QEvent.Paint:
+            self.painted = True
+            self.last_paint_time = time.perf_counter()
+
+        return False
+
+    @pyqtSlot(int, int, object, object, int)
+    def record_request(self, revision, first_line, text, line_ends, state):
+        first_visible_line, last_visible_line = get_visible_lines(self.editor)
+
+        self.is_viewport_requested = first_line <= last_visible_line \
+        and first_line + len(line_ends) > first_visible_line
+
+    @pyqtSlot()
+    def record_styling(self):
+        if self.is_viewport_requested:
+            self.is_viewport_requested = False
+            self.last_styling_time = time.perf_counter()
+
+
+class TestLatencyBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.application = QApplication.instance() or QApplication(sys.argv)
+
+        cls.sessions = json.loads(SESSIONS_PATH.read_text(encoding="utf-8"))["sessions"]
+
+        cls.ide = EssentialIDE("benchmark.py")
+        cls.ide.show()
+
+        cls.paint_probe = PaintProbe(cls.ide.document, cls.ide.lexer)
+
+        cls.wait_for_autocompletion_apis()
+
+        cls.results = {}
+
+        cls.deadline = time.perf_counter() + BENCHMARK_TIMEOUT_SECONDS
+
+    @classmethod
+    def tearDownClass(cls):
+        print(cls.get_report(), file=sys.stderr)
+
+        if UPDATE_BASELINE:
+            write_baseline(BASELINE_PATH, cls.results)
+
+            print(f"Baseline written to {BASELINE_PATH}", file=sys.stderr)
+
+        cls.ide.store_current_tab()
+
+        for tab in cls.ide.tabs:
+            tab.edit_journal.close(keep_edits=False)
+
+        cls.ide.journal_writer.stop()
+
+        cls.ide.hide()
+
+        # Quitting through the event loop lets `aboutToQuit` stop every worker thread and pool.
+        QTimer.singleShot(0, cls.application.quit)
+        cls.application.exec()
+
+        shutil.rmtree(BENCHMARK_HOME, ignore_errors=True)
+
+    @classmethod
+    def process_events_until(cls, is_done, timeout_seconds: float) -> bool:
+        deadline = time.perf_counter() + timeout_seconds
+
+        while True:
+            cls.application.processEvents()
+
+            if is_done():
+                return True
+
+            if time.perf_counter() > deadline:
+                return False
+
+    @classmethod
+    def wait_for_autocompletion_apis(cls):
+        """The module index and the completion APIs are built once, in the background, before anything is timed."""
+
+        preparations = []
+
+        cls.ide.api.apiPreparationStarted.connect(lambda: preparations.append("started"))
+        cls.ide.api_preparation.ready.connect(lambda: preparations.append("ready"))
+
+        module_index = cls.ide.module_index
+
+        # A refresh of the module index prepares the APIs again once it is announced.
+        if module_index.refresh_thread is not None:
+            module_index.refresh_thread.join()
+
+        cls.process_events_until(
+            lambda: "ready" in preparations and preparations.count("ready") >= preparations.count("started"),
+            SETTLING_TIMEOUT_SECONDS
+        )
+
+    @classmethod
+    def get_report(cls) -> str:
+        lines = [f"LATENCY BENCHMARK ({get_machine()})", "lines     session          events   p50 (ms)   p99 (ms)   max (ms)"]
+
+        for key, result in cls.results.items():
+            number_of_lines, session = key.split("/")
+
+            lines.append(
+                f"{number_of_lines:<9} {session:<16} {result['events']:>6} {result['p50'] * 1000:>10.1f} "
+                f"{result['p99'] * 1000:>10.1f} {result['max'] * 1000:>10.1f}"
+            )
+
+        return "\n".join(lines)
+
+    def is_viewport_styled(self) -> bool:
+        editor = self.ide.document
+
+        _, last_visible_line = get_visible_lines(editor)
+
+        end_of_viewport = get_position_from_line(editor, last_visible_line + 1)
+
+        return editor.SendScintilla(QsciScintilla.SCI_GETENDSTYLED) >= end_of_viewport
+
+    def is_frame_final(self) -> bool:
+        paint_probe = self.paint_probe
+
+        if not paint_probe.painted or paint_probe.is_viewport_requested or not self.is_viewport_styled():
+            return False
+
+        # Styling the rest of a long document in the background keeps the event loop busy for seconds,
+        # a repaint after the viewport's own styles already shows the final frame.
+        if paint_probe.last_paint_time > paint_probe.last_styling_time:
+            return True
+
+        # Nothing left queued, the repaint of styles that changed what is shown would be.
+        return self.ide.lexer.pending_style_request is None and not self.application.hasPendingEvents()
+
+    def time_input(self, send_input, with_completion_list: bool = False) -> float:
+        """Returns the seconds from sending an input event until its frame is styled and painted."""
+
+        self.skip_past_deadline()
+
+        self.paint_probe.reset()
+
+        start = time.perf_counter()
+
+        send_input()
+
+        if with_completion_list:
+            is_done = lambda: self.ide.document.isListActive() and self.is_frame_final()
+        else:
+            is_done = self.is_frame_final
+
+        self.assertTrue(
+            self.process_events_until(is_done, STEP_TIMEOUT_SECONDS),
+            "An input event was never followed by a styled paint"
+        )
+
+        return self.paint_probe.get_frame_time() - start
+
+    def open_document(self, number_of_lines: int) -> None:
+        """Loads a generated document into a new tab, the way `EssentialIDE.load` does."""
+
+        file_name = os.path.join(BENCHMARK_HOME, f"benchmark_{number_of_lines}.py")
+
+        with open(file_name, "w", encoding="utf-8", newline="") as file:
+            file.write(generate_corpus(number_of_lines))
+
+        self.ide.new_application()
+        self.ide.edit_journal.pause()
+
+        loaded = []
+
+        document_loader = DocumentLoader(self.ide.document, file_name)
+        document_loader.finished.connect(self.ide.finish_loading)
+        document_loader.finished.connect(lambda *_: loaded.append(True))
+
+        self.ide.tab_bar.setEnabled(False)
+
+        document_loader.start()
+
+        self.assertTrue(self.process_events_until(lambda: loaded, SETTLING_TIMEOUT_SECONDS), "The document never loaded")
+
+        self.settle()
+
+    def settle(self) -> None:
+        """Lets the lazy styler finish, so a session starts from an idle editor."""
+
+        lazy_styler = getattr(self.ide, "lazy_styler", None)
+
+        self.process_events_until(
+            lambda: (lazy_styler is None or not lazy_styler.fill_timer.isActive()) \
+            and self.ide.lexer.pending_style_request is None,
+            SETTLING_TIMEOUT_SECONDS
+        )
+
+    def move_to_line(self, line: int) -> None:
+        editor = self.ide.document
+
+        editor.setCursorPosition(line, 0)
+        editor.SendScintilla(QsciScintilla.SCI_SETFIRSTVISIBLELINE, max(line - 10, 0))
+
+        self.settle()
+
+    def type_character(self, character: str) -> None:
+        """Types a character no key of the keyboard has, `QTest` only maps ASCII ones to keys."""
+
+        editor = self.ide.document
+
+        QApplication.sendEvent(editor, QKeyEvent(QEvent.KeyPress, 0, Qt.NoModifier, character))
+        QApplication.sendEvent(editor, QKeyEvent(QEvent.KeyRelease, 0, Qt.NoModifier, character))
+
+    def type_text(self, text: str) -> list:
+        latencies = []
+
+        for character in text:
+            if character == "\n":
+                send_input = lambda: QTest.keyClick(self.ide.document, Qt.Key_Return)
+            elif character.isascii():
+                send_input = lambda character=character: QTest.keyClicks(self.ide.document, character)
+            else:
+                send_input = lambda character=character: self.type_character(character)
+
+            latencies.append(self.time_input(send_input))
+
+        return latencies
+
+    def replay_step(self, step: dict) -> list:
+        editor = self.ide.document
+
+        if "type" in step:
+            return self.type_text(step["type"])
+
+        if "key" in step:
+            key = getattr(Qt, f"Key_{step['key']}")
+
+            return [self.time_input(lambda: QTest.keyClick(editor, key))]
+
+        if "paste" in step:
+            QApplication.clipboard().setText(step["paste"])
+
+            return [self.time_input(lambda: QTest.keyClick(editor, Qt.Key_V, Qt.ControlModifier))]
+
+        if "scroll" in step:
+            viewport = editor.viewport()
+            position = QPointF(viewport.rect().center())
+
+            wheel_event = QWheelEvent(
+                position, QPointF(viewport.mapToGlobal(position.toPoint())), QPoint(),
+                QPoint(0, -ANGLE_OF_A_NOTCH * step["scroll"]), Qt.NoButton, Qt.NoModifier, Qt.NoScrollPhase, False
+            )
+
+            return [self.time_input(lambda: QApplication.sendEvent(viewport, wheel_event))]
+
+        if "complete" in step:
+            # Every character of the prefix is timed, the last one until the list shows, then the choice is accepted.
+            latencies = self.type_text(step["complete"][:-1])
+
+            latencies.append(self.time_input(
+                lambda: QTest.keyClicks(editor, step["complete"][-1]), with_completion_list=True
+            ))
+            latencies.append(self.time_input(lambda: QTest.keyClick(editor, Qt.Key_Return)))
+
+            return latencies
+
+        raise ValueError(f"Unknown session step: {step}")
+
+    def replay_session(self, session: dict) -> list:
+        self.move_to_line(int(self.ide.document.lines() * session["start_line"]))
+
+        latencies = []
+
+        for step in session["steps"]:
+            latencies += self.replay_step(step)
+
+        return latencies
+
+    def skip_past_deadline(self) -> None:
+        if time.perf_counter() > self.deadline:
+            self.skipTest(f"The benchmark ran past {BENCHMARK_TIMEOUT_SECONDS:.0f} s")
+
+    def test_latency(self):
+        # A checkout without a baseline would otherwise pass whatever it measures.
+        if not UPDATE_BASELINE and not BASELINE_PATH.exists():
+            self.fail(f"{BASELINE_PATH.name} is missing, record it with PYSEE_BENCHMARK_UPDATE_BASELINE=1")
+
+        baseline = None if UPDATE_BASELINE else read_baseline(BASELINE_PATH)
+
+        if baseline is not None and baseline[0] != get_machine():
+            print(f"The baseline was recorded on {baseline[0]}, latencies are not compared", file=sys.stderr)
+
+            baseline = None
+
+        expected_results = baseline[1] if baseline is not None else {}
+
+        for number_of_lines in LINE_COUNTS:
+            with self.subTest(lines=number_of_lines):
+                self.skip_past_deadline()
+
+                self.open_document(number_of_lines)
+
+            for session in self.sessions:
+                key = f"{number_of_lines}/{session['name']}"
+
+                with self.subTest(session=key):
+                    self.skip_past_deadline()
+
+                    replays = [self.replay_session(session) for _ in range(REPLAYS)]
+                    latencies = [latency for replay in replays for latency in replay]
+
+                    result = self.results[key] = {
+                        "events": len(replays[0]),
+                        "p50": statistics.median(get_percentile(replay, 50) for replay in replays),
+                        "p99": get_percentile(latencies, 99),
+                        "max": max(latencies)
+                    }
+
+                    expected = expected_results.get(key)
+
+                    if expected is None or result["events"] < MINIMUM_COMPARED_EVENTS:
+                        continue
+
+                    self.assertLessEqual(
+                        result["p50"], expected["p50"] * (1 + LATENCY_TOLERANCE) + LATENCY_SLACK_SECONDS,
+                        f"The p50 latency of {key} regressed"
+                    )
+
+        # Against a baseline of another machine no latency was compared, and any regression passed.
+        if baseline is None and not UPDATE_BASELINE:
+            self.skipTest(
+                f"{BASELINE_PATH.name} was not recorded on {get_machine()}, latencies were only reported; "
+                "record one with PYSEE_BENCHMARK_UPDATE_BASELINE=1"
+            )
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,236 @@
+"""
+Benchmarks `utilities.lexers.lexer_ide.PythonLexer.styleText` on generated documents under the offscreen Qt platform,
+styling them from scratch and restyling them after a one-line edit. \\
+Results are compared against `lexer_baseline.json`, and a regression past the tolerance fails the run. \\
+Allocations don't depend on the machine and are always compared. Timings are only compared when the baseline
+was recorded on the same kind of machine, with tolerances wide enough for a busy one:
+they catch a lexer that got several times slower, not a few percent. \\
+Run with `PYTHONPATH=. python3 tests/benchmarks/lexer_benchmark.test.py`;
+`PYSEE_BENCHMARK_LINE_COUNTS=1000,10000` limits the sizes and `PYSEE_BENCHMARK_UPDATE_BASELINE=1` records a new baseline.
+"""
+
+import os
+
+# Must be set before the `QApplication` exists.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import unittest
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.Qsci import QsciScintilla
+
+from utilities.lexers.lexer_ide import PythonLexer
+from utilities.lexers.outline import Outline
+from utilities.scintilla_buffer import get_position_from_line
+from utilities.instrumentation import Instrumentation
+
+from tests.benchmarks.synthetic_corpus import generate_corpus
+from tests.benchmarks.benchmark_results import get_machine, read_baseline, write_baseline
+
+from pathlib import Path
+
+import gc
+import sys
+import time
+import statistics
+import tracemalloc
+
+BASELINE_PATH = Path(__file__).with_name("lexer_baseline.json")
+
+LINE_COUNTS = tuple(
+    int(count) for count in os.environ.get("PYSEE_BENCHMARK_LINE_COUNTS", "1000,10000,100000,1000000").split(",")
+)
+
+UPDATE_BASELINE = bool(os.environ.get("PYSEE_BENCHMARK_UPDATE_BASELINE"))
+
+# The median of several passes is reported, single passes of the small documents are mostly noise.
+REPEATS = 7
+
+# How much more memory than the baseline a run may allocate, allocations don't depend on the machine's speed.
+ALLOCATION_TOLERANCE = 0.25
+
+# How much lower than the baseline's the throughput of a full pass may fall.
+THROUGHPUT_TOLERANCE = 0.5
+
+# A one-line restyle takes well under a millisecond, where a stray scheduler tick is already a large share.
+EDIT_TOLERANCE = 2.0
+
+# One-line edits timed per document, each on its own line.
+NUMBER_OF_EDITS = 51
+
+# Scintilla asks for the lines up to the end of the viewport after an edit, not the rest of the document.
+LINES_ON_SCREEN = 60
+
+
+class TestLexerBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.application = QApplication.instance() or QApplication(sys.argv)
+
+        cls.editor = QsciScintilla()
+        cls.lexer = PythonLexer(cls.editor)
+
+        # `styleText` is measured on its own: no lexing worker, no viewport-first styling.
+        cls.lexer.stop_lexing_worker()
+        cls.lexer.lexing_worker_enabled = False
+        cls.lexer.lazy_styling_enabled = False
+
+        cls.editor.setLexer(cls.lexer)
+
+        cls.results = {}
+        cls.baseline = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        print(cls.get_report(), file=sys.stderr)
+
+        if UPDATE_BASELINE:
+            write_baseline(BASELINE_PATH, cls.results)
+
+            print(f"Baseline written to {BASELINE_PATH}", file=sys.stderr)
+
+    @classmethod
+    def get_report(cls) -> str:
+        lines = [
+            f"LEXER BENCHMARK ({get_machine()})",
+            "lines         lines/s       MB/s   peak allocated (KB)   baseline lines/s   edit (ms)   baseline edit (ms)"
+        ]
+
+        for number_of_lines, result in cls.results.items():
+            expected = cls.baseline.get(number_of_lines, {})
+
+            lines.append(
+                f"{number_of_lines:<9} {result['lines_per_second']:>11.0f} {result['megabytes_per_second']:>10.2f} "
+                f"{result['peak_allocated_bytes'] / 1024:>21.1f} {expected.get('lines_per_second', 0):>18.0f} "
+                f"{result['edit_seconds'] * 1000:>11.3f} {expected.get('edit_seconds', 0) * 1000:>20.3f}"
+            )
+
+        return "\n".join(lines)
+
+    def restyle_from_scratch(self) -> float:
+        """Forgets every lexed line and styles the whole document in one `styleText` call."""
+
+        self.lexer.set_document_state((0, 0, Outline()))
+
+        start = time.perf_counter()
+        self.lexer.styleText(0, self.editor.length())
+
+        return time.perf_counter() - start
+
+    def restyle_edited_line(self, line: int) -> tuple:
+        """
+        Inserts a character at the start of `line` of the styled document and restyles it the way Scintilla
+        asks for it, from the first unstyled position to the end of the viewport. \\
+        Returns the seconds it took and the number of lines styled.
+        """
+
+        self.editor.insertAt("x", line, 0)
+
+        self.lexer.instrumentation = Instrumentation()
+
+        end_styled = self.editor.SendScintilla(QsciScintilla.SCI_GETENDSTYLED)
+        end_of_viewport = get_position_from_line(self.editor, line + LINES_ON_SCREEN)
+
+        start = time.perf_counter()
+        self.lexer.styleText(end_styled, end_of_viewport)
+        seconds = time.perf_counter() - start
+
+        return seconds, self.lexer.instrumentation.get_snapshot()["counters"]["lexer.lines_styled"]
+
+    def measure(self, number_of_lines: int) -> dict:
+        self.editor.setText(generate_corpus(number_of_lines))
+
+        length = self.editor.length()
+
+        gc.collect()
+        gc.disable()
+
+        try:
+            seconds = statistics.median(self.restyle_from_scratch() for _ in range(REPEATS))
+        finally:
+            gc.enable()
+
+        # Traced separately, since tracing slows every allocation down.
+        # Scintilla's own memory is not seen by `tracemalloc`, only what the lexer allocates in Python.
+        tracemalloc.start()
+
+        try:
+            self.restyle_from_scratch()
+            _, peak_allocated_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # Edits start in the middle of the document, where a restyle running to its end would cost the most.
+        first_edited_line = number_of_lines // 2
+
+        gc.collect()
+        gc.disable()
+
+        try:
+            edits = [self.restyle_edited_line(first_edited_line + edit) for edit in range(NUMBER_OF_EDITS)]
+        finally:
+            gc.enable()
+
+        return {
+            "seconds": seconds,
+            "lines_per_second": number_of_lines / seconds,
+            "megabytes_per_second": length / seconds / (1 << 20),
+            "peak_allocated_bytes": peak_allocated_bytes,
+            "edit_seconds": statistics.median(seconds for seconds, _ in edits),
+            "edit_lines_styled": max(lines_styled for _, lines_styled in edits)
+        }
+
+    def test_style_text(self):
+        # A checkout without a baseline would otherwise pass whatever it measures.
+        if not UPDATE_BASELINE and not BASELINE_PATH.exists():
+            self.fail(f"{BASELINE_PATH.name} is missing, record it with PYSEE_BENCHMARK_UPDATE_BASELINE=1")
+
+        baseline = None if UPDATE_BASELINE else read_baseline(BASELINE_PATH)
+
+        is_same_machine = False
+
+        if baseline is not None:
+            machine, type(self).baseline = baseline
+
+            is_same_machine = machine == get_machine()
+
+            if not is_same_machine:
+                print(f"The baseline was recorded on {machine}, timings are not compared", file=sys.stderr)
+
+        for number_of_lines in LINE_COUNTS:
+            with self.subTest(lines=number_of_lines):
+                result = self.measure(number_of_lines)
+
+                # JSON keys are strings.
+                self.results[str(number_of_lines)] = result
+
+                expected = self.baseline.get(str(number_of_lines))
+
+                if expected is None:
+                    continue
+
+                self.assertLessEqual(
+                    result["peak_allocated_bytes"], expected["peak_allocated_bytes"] * (1 + ALLOCATION_TOLERANCE),
+                    f"Styling {number_of_lines} lines allocates more than the baseline"
+                )
+
+                self.assertLessEqual(
+                    result["edit_lines_styled"], expected["edit_lines_styled"],
+                    f"A one-line edit of {number_of_lines} lines restyles more lines than the baseline"
+                )
+
+                if not is_same_machine:
+                    continue
+
+                self.assertGreaterEqual(
+                    result["lines_per_second"], expected["lines_per_second"] * (1 - THROUGHPUT_TOLERANCE),
+                    f"Styling {number_of_lines} lines is slower than the baseline"
+                )
+
+                self.assertLessEqual(
+                    result["edit_seconds"], expected["edit_seconds"] * (1 + EDIT_TOLERANCE),
+                    f"Restyling a one-line edit of {number_of_lines} lines is slower than the baseline"
+                )
+
+if __name__ == "__main__":
+    unittest.main()
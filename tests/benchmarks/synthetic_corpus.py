@@ -0,0 +1,87 @@
+"""
+Generated Python documents for the benchmarks, mixing code, comments, strings and Unicode. \\
+Kept free of `PyQt5`, and deterministic for a given seed so runs can be compared.
+"""
+
+import random
+
+NAMES = (
+    "value", "total", "index", "buffer", "handler", "résumé", "σ", "数据", "naïve_count", "_cache"
+)
+
+COMMENTS = (
+    "# TODO: check the edge cases",
+    "# Ünïcödé comment — with punctuation…",
+    "# 注释：这里需要处理",
+    "# a comment with \"quotes\" and 'apostrophes' # and a second hash",
+    "#!/usr/bin/env python3",
+)
+
+STRINGS = (
+    "\"plain string\"",
+    "'single quoted \\' escape'",
+    "f\"{{value}} formatted {{total!r:>10}}\"",
+    "rb'\\d+\\s*raw bytes'",
+    "\"emoji 🐍 and ✓ inside\"",
+)
+
+# Each template is formatted with `name`, `other`, `comment`, `string` and `number`.
+TEMPLATES = (
+    "import os\nimport sys\nfrom collections import OrderedDict\n",
+    "{comment}\n",
+    "{name} = {string}  {comment}\n",
+    # A statement of its own, inside brackets it would leave them open for the rest of the document.
+    "{name} = 'unterminated on purpose\n",
+    "{name} = [{number}, {number} * 2, ({other} + {number}) // 3]\n",
+    "def {name}_function({other}, *args, key=None, **kwargs):\n"
+    "    \"\"\"\n"
+    "    Docstring of {name}, spanning lines with 'quotes' and \"quotes\"\n"
+    "    unicode: ünïcode, 漢字, 🐍.\n"
+    "    \"\"\"\n"
+    "    if {other} is not None and len(args) > {number}:\n"
+    "        return {other} ** 2\n"
+    "    return print({string}, sep='')\n",
+    "class {name}_class(object):\n"
+    "    def __init__(self) -> None:\n"
+    "        self.{name} = {{{string}: {number}}}\n"
+    "\n"
+    "    def __repr__(self):\n"
+    "        return f\"<{{type(self).__name__}} {{self.{name}!r}}>\"\n",
+    "result = call({name},\n"
+    "              {other},  {comment}\n"
+    "              {number})\n",
+    "long_{name} = {number} + \\\n"
+    "    {other} - \\\n"
+    "    {number}\n",
+    "query = '''\n"
+    "SELECT * FROM table WHERE name = \"{name}\" -- ünïcode\n"
+    "'''\n",
+    "for {name} in range({number}):\n"
+    "    {other} += {name} if {name} % 2 else -{name}\n"
+    "else:\n"
+    "    pass\n",
+    "\n",
+)
+
+
+def generate_corpus(number_of_lines: int, seed: int = 0) -> str:
+    """Returns a Python document of exactly `number_of_lines` lines, each ending with a line feed."""
+
+    generator = random.Random(seed)
+
+    lines = []
+
+    while len(lines) < number_of_lines:
+        template = generator.choice(TEMPLATES)
+
+        text = template.format(
+            name=generator.choice(NAMES),
+            other=generator.choice(NAMES),
+            comment=generator.choice(COMMENTS),
+            string=generator.choice(STRINGS),
+            number=generator.randrange(1 << 16)
+        )
+
+        lines += text.splitlines(keepends=True)
+
+    return "".join(lines[:number_of_lines])
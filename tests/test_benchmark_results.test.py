@@ -0,0 +1,30 @@
+import unittest
+
+from tests.benchmarks.benchmark_results import get_machine, get_percentile, read_baseline, write_baseline
+
+from pathlib import Path
+
+import tempfile
+
+
+class TestBenchmarkResults(unittest.TestCase):
+    def test_percentiles_are_nearest_rank(self):
+        values = [5, 1, 4, 2, 3]
+
+        self.assertEqual(get_percentile(values, 50), 3)
+        self.assertEqual(get_percentile(values, 99), 5)
+        self.assertEqual(get_percentile(values, 0), 1)
+        self.assertEqual(get_percentile(range(1, 101), 99), 99)
+
+    def test_baseline_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "baseline.json"
+
+            self.assertIsNone(read_baseline(path))
+
+            write_baseline(path, {"1000/typing": {"p50": 0.002, "p99": 0.01}})
+
+            self.assertEqual(read_baseline(path), (get_machine(), {"1000/typing": {"p50": 0.002, "p99": 0.01}}))
+
+if __name__ == "__main__":
+    unittest.main()
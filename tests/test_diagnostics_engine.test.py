@@ -0,0 +1,92 @@
+import os
+
+# Must be set before the `QApplication` exists.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import unittest
+from unittest import mock
+
+from PyQt5.QtCore import QCoreApplication
+
+from utilities.diagnostics import diagnostics_engine
+from utilities.diagnostics.diagnostics_engine import DiagnosticsPool, DiagnosticsWorker, UNCHECKED_ANALYSIS
+from utilities.diagnostics.python_checks import get_block_hash
+
+import sys
+import tempfile
+import importlib
+
+application = QCoreApplication.instance() or QCoreApplication([])
+
+# Analyses like the real checks, but never returns from a block that asks it to.
+HANGING_CHECKS = """
+import time
+
+from utilities.diagnostics.python_checks import analyse_blocks as analyse_checked_blocks
+
+
+def analyse_blocks(sources):
+    if any(b"hang" in source for source in sources):
+        time.sleep(600)
+
+    return analyse_checked_blocks(sources)
+"""
+
+
+class TestDiagnosticsWorker(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+
+        with open(os.path.join(self.temporary_directory.name, "hanging_checks.py"), "w") as file:
+            file.write(HANGING_CHECKS)
+
+        # Spawned workers start from the editor's `sys.path`.
+        sys.path.insert(0, self.temporary_directory.name)
+        self.addCleanup(sys.path.remove, self.temporary_directory.name)
+
+        patcher = mock.patch.object(
+            diagnostics_engine, "analyse_blocks", importlib.import_module("hanging_checks").analyse_blocks
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.pool = DiagnosticsPool()
+        self.addCleanup(self.pool.shut_down)
+
+        self.worker = DiagnosticsWorker(self.pool)
+
+        self.results = []
+        self.worker.diagnostics_ready.connect(lambda revision, diagnostics: self.results.append(diagnostics))
+
+    def test_workers_are_spawned(self):
+        self.assertEqual(self.pool.executor._mp_context.get_start_method(), "spawn")
+
+    def test_hanging_batch_is_left_unchecked_and_its_worker_killed(self):
+        self.worker.TIMEOUT_MILLISECONDS = 1000
+
+        # One block per batch, the blocks after the hanging one are analysed by the new workers.
+        self.worker.BATCH_BYTES = 1
+
+        # Started before the hanging check, so its deadline isn't spent spawning the workers.
+        self.worker.check_snapshot(0, b"first = 1\n")
+
+        executor = self.pool.executor
+        processes = list(self.pool.worker_context.processes)
+        self.assertTrue(processes)
+
+        self.worker.check_snapshot(0, b"hang = 1\nprint(undefined)\ndef function(:\n")
+
+        for process in processes:
+            process.join(10)
+
+            self.assertFalse(process.is_alive())
+
+        self.assertIsNot(self.pool.executor, executor)
+        self.assertIs(self.worker.analyses[get_block_hash(b"hang = 1\n")], UNCHECKED_ANALYSIS)
+
+        # The blocks after it were still checked.
+        self.assertEqual([diagnostic.line for diagnostic in self.results[-1]], [2])
+
+if __name__ == "__main__":
+    unittest.main()
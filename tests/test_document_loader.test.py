@@ -0,0 +1,155 @@
+import os
+
+# Must be set before the `QApplication` exists.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import unittest
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.Qsci import QsciScintilla
+
+from utilities.document_loader import DocumentLoader, detect_encoding
+
+import codecs
+import tempfile
+
+application = QApplication.instance() or QApplication([])
+
+
+class TestDetectEncoding(unittest.TestCase):
+    def test_declared_encodings(self):
+        self.assertEqual(detect_encoding(codecs.BOM_UTF16_LE + "x".encode("utf-16-le")), ("utf-16", True))
+        self.assertEqual(detect_encoding(codecs.BOM_UTF8 + b"x = 1\n"), ("utf-8-sig", True))
+        self.assertEqual(detect_encoding(b"# -*- coding: cp1252 -*-\nx = 1\n"), ("cp1252", True))
+        self.assertEqual(detect_encoding(b"#!/usr/bin/env python3\n# coding=utf-8\n"), ("utf-8", True))
+
+    def test_undeclared_encodings_default_to_utf_8(self):
+        self.assertEqual(detect_encoding(b"x = 1\n"), ("utf-8", False))
+        self.assertEqual(detect_encoding(b"name = 'caf\xe9'\n"), ("utf-8", False))
+
+
+class TestDocumentLoader(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+
+        self.editor = QsciScintilla()
+        self.addCleanup(self.editor.deleteLater)
+
+        self.results = []
+
+    def write_file(self, name: str, data: bytes) -> str:
+        file_name = os.path.join(self.temporary_directory.name, name)
+
+        with open(file_name, "wb") as file:
+            file.write(data)
+
+        return file_name
+
+    def load(self, file_name: str, chunk_bytes: int = None) -> None:
+        loader = DocumentLoader(self.editor, file_name)
+
+        if chunk_bytes is not None:
+            loader.CHUNK_BYTES = chunk_bytes
+
+        loader.finished.connect(lambda *arguments: self.results.append(("finished", *arguments)))
+        loader.cancelled.connect(lambda: self.results.append(("cancelled",)))
+        loader.failed.connect(lambda *arguments: self.results.append(("failed", *arguments)))
+
+        loader.start()
+
+        while not self.results:
+            application.processEvents()
+
+    def set_edited_text(self) -> None:
+        self.editor.setText("saved text\n")
+        self.editor.SendScintilla(QsciScintilla.SCI_EMPTYUNDOBUFFER)
+        self.editor.setModified(False)
+
+        self.editor.insertAt("edited ", 0, 0)
+
+    def assert_edited_text_untouched(self) -> None:
+        self.assertEqual(self.editor.text(), "edited saved text\n")
+        self.assertTrue(self.editor.isModified())
+        self.assertTrue(self.editor.isUndoAvailable())
+        self.assertFalse(self.editor.isReadOnly())
+
+        self.editor.undo()
+
+        self.assertEqual(self.editor.text(), "saved text\n")
+
+    def test_unopenable_file_leaves_the_document_untouched(self):
+        self.set_edited_text()
+
+        self.load(os.path.join(self.temporary_directory.name, "missing.py"))
+
+        (kind, _), = self.results
+
+        self.assertEqual(kind, "failed")
+        self.assert_edited_text_untouched()
+
+    def test_cancelled_load_leaves_the_document_untouched(self):
+        self.set_edited_text()
+
+        file_name = self.write_file("module.py", b"x = 1\n" * 100)
+
+        loader = DocumentLoader(self.editor, file_name)
+        loader.CHUNK_BYTES = 64
+        loader.cancelled.connect(lambda: self.results.append(("cancelled",)))
+
+        loader.start()
+
+        # Part way through the file.
+        self.assertTrue(loader.chunk_timer.isActive())
+
+        loader.cancel()
+
+        self.assertEqual(self.results, [("cancelled",)])
+        self.assert_edited_text_untouched()
+
+    def test_line_endings_of_utf_16_files_are_detected(self):
+        text = "x = 1\r\ny = 2\r\n"
+        file_name = self.write_file("wide.py", text.encode("utf-16"))
+
+        self.editor.setEolMode(QsciScintilla.EolUnix)
+
+        self.load(file_name)
+
+        self.assertEqual(self.results, [("finished", file_name, "utf-16")])
+        self.assertEqual(self.editor.text(), text)
+        self.assertEqual(self.editor.eolMode(), QsciScintilla.EolWindows)
+
+    def test_utf_8_file_is_loaded_in_chunks(self):
+        text = "".join(f"print('ligne {index} été ✓')\n" for index in range(200))
+        file_name = self.write_file("module.py", text.encode("utf-8"))
+
+        # Chunks that cut through multibyte characters.
+        self.load(file_name, chunk_bytes=7)
+
+        self.assertEqual(self.results, [("finished", file_name, "utf-8")])
+        self.assertEqual(self.editor.text(), text)
+        self.assertFalse(self.editor.isUndoAvailable())
+
+    def test_undeclared_non_utf_8_file_falls_back_losslessly(self):
+        data = b"# \x93quoted\x94 in cp1252\nname = 'caf\xe9'\n" * 50
+        file_name = self.write_file("legacy.py", data)
+
+        self.load(file_name, chunk_bytes=64)
+
+        self.assertEqual(self.results, [("finished", file_name, "latin-1")])
+        self.assertEqual(self.editor.text().encode("latin-1"), data)
+
+    def test_file_not_in_its_declared_encoding_fails(self):
+        self.set_edited_text()
+
+        file_name = self.write_file("wrong.py", b"# coding: utf-8\nname = 'caf\xe9'\n")
+
+        self.load(file_name)
+
+        (kind, _), = self.results
+
+        self.assertEqual(kind, "failed")
+        self.assert_edited_text_untouched()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import os
+
+# Must be set before the `QApplication` exists.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import unittest
+from unittest import mock
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.Qsci import QsciScintilla
+
+from utilities import document_saver
+from utilities.document_saver import save_document, sync_directory, get_new_file_mode
+
+import codecs
+import stat
+import tempfile
+
+application = QApplication.instance() or QApplication([])
+
+# Multi-byte characters straddle the chunk boundaries of the streamed writes.
+LARGE_TEXT = "".join(f"name_{number} = 'ünïcode ✓ {number}'\n" for number in range(50000))
+
+
+class TestSaveDocument(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+
+        self.editor = QsciScintilla()
+        self.editor.setUtf8(True)
+        self.addCleanup(self.editor.deleteLater)
+
+    def get_path(self, name: str) -> str:
+        return os.path.join(self.temporary_directory.name, name)
+
+    def read_file(self, name: str) -> bytes:
+        with open(self.get_path(name), "rb") as file:
+            return file.read()
+
+    def write_file(self, name: str, data: bytes) -> None:
+        with open(self.get_path(name), "wb") as file:
+            file.write(data)
+
+    def test_large_document_is_streamed_in_chunks(self):
+        self.editor.setText(LARGE_TEXT)
+
+        with mock.patch.object(document_saver, "DOCUMENT_SAVING_CHUNK_BYTES", 4099):
+            save_document(self.editor, self.get_path("large.py"))
+
+        self.assertEqual(self.read_file("large.py"), LARGE_TEXT.encode("utf-8"))
+        self.assertEqual(os.listdir(self.temporary_directory.name), ["large.py"])
+
+    def test_other_encodings_are_encoded_across_chunks(self):
+        self.editor.setText(LARGE_TEXT)
+
+        with mock.patch.object(document_saver, "DOCUMENT_SAVING_CHUNK_BYTES", 4099):
+            save_document(self.editor, self.get_path("utf16.py"), "utf-16")
+            save_document(self.editor, self.get_path("bom.py"), "utf-8-sig")
+
+        self.assertEqual(self.read_file("utf16.py"), LARGE_TEXT.encode("utf-16"))
+        self.assertEqual(self.read_file("bom.py"), codecs.BOM_UTF8 + LARGE_TEXT.encode("utf-8"))
+
+    def test_failed_save_leaves_the_old_file_and_no_temporary_file(self):
+        self.write_file("latin.py", b"name = 'caf\xe9'\n")
+        self.editor.setText("name = '漢字'\n")
+
+        with self.assertRaises(UnicodeEncodeError):
+            save_document(self.editor, self.get_path("latin.py"), "latin-1")
+
+        self.assertEqual(self.read_file("latin.py"), b"name = 'caf\xe9'\n")
+        self.assertEqual(os.listdir(self.temporary_directory.name), ["latin.py"])
+
+    @unittest.skipUnless(hasattr(os, "symlink") and os.name == "posix", "Needs symbolic links")
+    def test_symbolic_link_is_saved_through(self):
+        self.write_file("target.py", b"old = 1\n")
+        os.symlink(self.get_path("target.py"), self.get_path("link.py"))
+
+        self.editor.setText("new = 2\n")
+        save_document(self.editor, self.get_path("link.py"))
+
+        self.assertTrue(os.path.islink(self.get_path("link.py")))
+        self.assertEqual(self.read_file("target.py"), b"new = 2\n")
+
+    @unittest.skipUnless(os.name == "posix", "Needs POSIX permissions")
+    def test_permissions(self):
+        self.write_file("script.py", b"")
+        os.chmod(self.get_path("script.py"), 0o754)
+
+        self.editor.setText("x = 1\n")
+
+        save_document(self.editor, self.get_path("script.py"))
+        save_document(self.editor, self.get_path("new.py"))
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.get_path("script.py")).st_mode), 0o754)
+        self.assertEqual(stat.S_IMODE(os.stat(self.get_path("new.py")).st_mode), get_new_file_mode())
+
+    def test_new_file_mode_follows_the_umask(self):
+        umask = os.umask(0o027)
+
+        try:
+            self.assertEqual(get_new_file_mode(), 0o640 if os.path.exists("/proc/self/status") else 0o666 & ~umask)
+        finally:
+            os.umask(umask)
+
+    def test_sync_failure_after_the_rename_is_not_raised(self):
+        with self.assertLogs("pysee.documents", "WARNING"):
+            sync_directory(self.get_path("missing directory"))
+
+if __name__ == "__main__":
+    unittest.main()
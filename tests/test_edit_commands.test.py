@@ -0,0 +1,118 @@
+import os
+
+# Must be set before the `QApplication` exists.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import unittest
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.Qsci import QsciScintilla
+
+from utilities.edit_commands import EditCommands
+from utilities.lexers.lexer_ide import PythonLexer
+from utilities.instrumentation import Instrumentation
+
+application = QApplication.instance() or QApplication([])
+
+TEXT = "first = 1\nsecond = 2\nthird = 3\n"
+
+
+class TestEditCommands(unittest.TestCase):
+    def setUp(self):
+        self.editor = QsciScintilla()
+        self.editor.setUtf8(True)
+        self.editor.setEolMode(QsciScintilla.EolUnix)
+        self.addCleanup(self.editor.deleteLater)
+
+        self.editor.setText(TEXT)
+        self.editor.SendScintilla(QsciScintilla.SCI_EMPTYUNDOBUFFER)
+
+        self.clipboard = QApplication.clipboard()
+        self.edit_commands = EditCommands(self.editor, self.clipboard)
+
+    def test_each_command_is_one_undo_step(self):
+        self.edit_commands.insert_text(0, "zeroth = 0\n")
+        self.edit_commands.delete_range(0, len("zeroth = 0\n"))
+        self.edit_commands.replace_range(0, len("first"), "première")
+
+        self.assertEqual(self.editor.text(), "première = 1\nsecond = 2\nthird = 3\n")
+
+        for text in (TEXT, "zeroth = 0\n" + TEXT, TEXT):
+            self.editor.undo()
+            self.assertEqual(self.editor.text(), text)
+
+        self.assertFalse(self.editor.isUndoAvailable())
+
+    def test_apply_edits_uses_the_ranges_before_any_edit(self):
+        second = TEXT.index("second")
+        third = TEXT.index("third")
+
+        # In document order: applied first to last, each edit would move the ranges of the ones after it.
+        self.edit_commands.apply_edits([
+            (0, len("first"), "one"),
+            (second, second + len("second"), "two"),
+            (third, third + len("third"), "three_and_more"),
+            (len(TEXT), len(TEXT), "fourth = 4\n")
+        ])
+
+        self.assertEqual(self.editor.text(), "one = 1\ntwo = 2\nthree_and_more = 3\nfourth = 4\n")
+
+        self.editor.undo()
+
+        self.assertEqual(self.editor.text(), TEXT)
+        self.assertFalse(self.editor.isUndoAvailable())
+
+    def test_transactions_group_commands_into_one_undo_step(self):
+        with self.edit_commands.transaction():
+            self.edit_commands.insert_text(0, "# Header.\n")
+
+            with self.edit_commands.transaction():
+                self.edit_commands.delete_range(len("# Header.\n"), len("# Header.\nfirst = 1\n"))
+
+        self.assertEqual(self.editor.text(), "# Header.\nsecond = 2\nthird = 3\n")
+
+        self.editor.undo()
+
+        self.assertEqual(self.editor.text(), TEXT)
+        self.assertFalse(self.editor.isUndoAvailable())
+
+    def test_paste_converts_line_endings_and_replaces_the_selection(self):
+        self.clipboard.setText("pasted = 0\r\nmore = 1")
+
+        self.editor.setSelection(1, 0, 1, len("second"))
+        self.edit_commands.paste()
+
+        self.assertEqual(self.editor.text(), "first = 1\npasted = 0\nmore = 1 = 2\nthird = 3\n")
+        self.assertEqual(self.editor.getCursorPosition(), (2, len("more = 1")))
+
+        self.editor.undo()
+
+        self.assertEqual(self.editor.text(), TEXT)
+
+    def test_paste_restyles_only_the_pasted_lines(self):
+        lexer = PythonLexer(self.editor)
+
+        # Styled synchronously, every pass is done by the time `SCI_COLOURISE` returns.
+        lexer.stop_lexing_worker()
+        lexer.lexing_worker_enabled = False
+        lexer.lazy_styling_enabled = False
+
+        self.editor.setLexer(lexer)
+        self.editor.setText("".join(f"value_{number} = {number}\n" for number in range(10000)))
+        self.editor.SendScintilla(QsciScintilla.SCI_COLOURISE, 0, -1)
+
+        self.clipboard.setText("pasted = 0\nmore = 1\n")
+
+        self.editor.setCursorPosition(5000, 0)
+        self.edit_commands.paste()
+
+        lexer.instrumentation = Instrumentation()
+
+        end_styled = self.editor.SendScintilla(QsciScintilla.SCI_GETENDSTYLED)
+        self.editor.SendScintilla(QsciScintilla.SCI_COLOURISE, end_styled, -1)
+
+        # The two pasted lines, and the line they were inserted in front of.
+        self.assertEqual(lexer.instrumentation.get_snapshot()["counters"]["lexer.lines_styled"], 3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import os
+import tempfile
+
+# Must be set before the `QApplication` exists.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Journals and caches go to a throwaway home, never the user's,
+# and no recovery prompt from a previous session can block the run.
+TEST_HOME = tempfile.mkdtemp(prefix="pysee_tabs_")
+
+os.environ["HOME"] = os.environ["USERPROFILE"] = TEST_HOME
+
+import unittest
+from unittest import mock
+
+from PyQt5.QtWidgets import QApplication, QMessageBox
+from PyQt5.QtCore import QTimer
+
+from utilities.ide import EssentialIDE
+
+import time
+import shutil
+import threading
+
+application = QApplication.instance() or QApplication([])
+
+
+class TestIDETabs(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ide = EssentialIDE("first.py")
+
+    @classmethod
+    def tearDownClass(cls):
+        # Exits the way a confirmed Exit does, through the event loop, so every worker thread is stopped.
+        with mock.patch.object(QMessageBox, "question", return_value=QMessageBox.Yes):
+            QTimer.singleShot(0, cls.ide.close)
+
+            application.exec()
+
+        shutil.rmtree(TEST_HOME, ignore_errors=True)
+
+    def tearDown(self):
+        # Every test starts from a single blank tab.
+        with mock.patch.object(QMessageBox, "question", return_value=QMessageBox.Yes):
+            while len(self.ide.tabs) > 1:
+                self.ide.close_tab(len(self.ide.tabs) - 1)
+
+        self.ide.document.setText("")
+
+    def open_tab(self, text: str) -> None:
+        self.ide.new_application()
+        self.ide.document.setText(text)
+
+    def wait_for_journals(self, condition) -> None:
+        """Flushes the journals of every tab, and waits for the writer thread to leave them as `condition` expects."""
+
+        for tab in self.ide.tabs:
+            tab.edit_journal.flush()
+
+        deadline = time.monotonic() + 10
+
+        while not condition():
+            self.assertLess(time.monotonic(), deadline, "The journal writer never caught up")
+
+            time.sleep(0.01)
+
+    def test_switching_tabs_swaps_documents_and_their_state(self):
+        self.ide.document.setText("first = 1\n")
+        self.ide.rename_current_tab("first.py")
+
+        first_tab = self.ide.current_tab
+        first_symbol_index = self.ide.symbol_index
+
+        self.open_tab("second = 2\n")
+        self.ide.rename_current_tab("second.py")
+
+        self.assertEqual(len(self.ide.tabs), 2)
+        self.assertIsNot(self.ide.symbol_index, first_symbol_index)
+        self.assertIsNot(self.ide.edit_journal, first_tab.edit_journal)
+
+        self.ide.tab_bar.setCurrentIndex(0)
+
+        self.assertIs(self.ide.current_tab, first_tab)
+        self.assertEqual(self.ide.document.text(), "first = 1\n")
+        self.assertEqual(self.ide.name_of_document, "first.py")
+        self.assertIs(self.ide.symbol_index, first_symbol_index)
+        self.assertIs(self.ide.edit_journal, first_tab.edit_journal)
+        self.assertIs(self.ide.api.symbol_index, first_symbol_index)
+
+        self.ide.tab_bar.setCurrentIndex(1)
+
+        self.assertEqual(self.ide.document.text(), "second = 2\n")
+        self.assertEqual(self.ide.name_of_document, "second.py")
+
+    def test_tabs_share_one_journal_writer_thread(self):
+        self.open_tab("warm_up = 0\n")
+
+        number_of_threads = threading.active_count()
+
+        for number in range(10):
+            self.open_tab(f"tab_{number} = {number}\n")
+
+        self.assertEqual(threading.active_count(), number_of_threads)
+
+        for tab in self.ide.tabs:
+            self.assertIs(tab.edit_journal.writer, self.ide.journal_writer)
+
+    def test_journals_are_written_per_tab_and_removed_when_closed(self):
+        self.open_tab("kept = 1\n")
+        self.open_tab("closed = 2\n")
+
+        kept_journal_path, closed_journal_path = (tab.edit_journal.journal_path for tab in self.ide.tabs[-2:])
+
+        self.wait_for_journals(lambda: os.path.exists(kept_journal_path) and os.path.exists(closed_journal_path))
+
+        with mock.patch.object(QMessageBox, "question", return_value=QMessageBox.Yes):
+            self.ide.close_tab(len(self.ide.tabs) - 1)
+
+        self.wait_for_journals(lambda: not os.path.exists(closed_journal_path))
+
+        self.assertTrue(os.path.exists(kept_journal_path))
+
+    def test_closing_the_shown_tab_shows_its_neighbour(self):
+        self.ide.document.setText("kept = 1\n")
+        self.open_tab("closed = 2\n")
+
+        with mock.patch.object(QMessageBox, "question", return_value=QMessageBox.Yes) as question:
+            self.ide.close_tab(1)
+
+        question.assert_called_once()
+
+        self.assertEqual(len(self.ide.tabs), 1)
+        self.assertEqual(self.ide.tab_bar.count(), 1)
+        self.assertEqual(self.ide.document.text(), "kept = 1\n")
+
+    def test_closing_the_last_tab_leaves_a_blank_one(self):
+        self.ide.document.setModified(False)
+
+        self.ide.close_tab(0)
+
+        self.assertEqual(len(self.ide.tabs), 1)
+        self.assertEqual(self.ide.document.text(), "")
+        self.assertFalse(self.ide.file_has_been_saved)
+
+if __name__ == "__main__":
+    unittest.main()
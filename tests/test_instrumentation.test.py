@@ -0,0 +1,75 @@
+import unittest
+
+from utilities.instrumentation import Instrumentation, NullInstrumentation, Histogram, NULL_SPAN
+
+from pathlib import Path
+
+import json
+import tempfile
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_disabled_instrumentation_records_nothing(self):
+        instrumentation = NullInstrumentation()
+
+        self.assertIs(instrumentation.span("lexer.style_lines", lines=10), NULL_SPAN)
+
+        with instrumentation.span("lexer.style_lines"):
+            instrumentation.count("lexer.lines_styled", 10)
+            instrumentation.observe("document.load.seconds", 1.0)
+
+    def test_spans_counters_and_histograms(self):
+        instrumentation = Instrumentation()
+
+        for _ in range(3):
+            with instrumentation.span("lexer.style_lines", lines=10):
+                instrumentation.count("lexer.lines_styled", 10)
+
+        snapshot = instrumentation.get_snapshot()
+
+        self.assertEqual(snapshot["counters"], {"lexer.lines_styled": 30})
+        self.assertEqual(snapshot["histograms"]["lexer.style_lines.seconds"]["count"], 3)
+
+        events = instrumentation.get_chrome_trace()["traceEvents"]
+
+        self.assertEqual(len(events), 3)
+        self.assertEqual(events[0]["ph"], "X")
+        self.assertEqual(events[0]["cat"], "lexer")
+        self.assertEqual(events[0]["args"], {"lines": 10})
+
+    def test_only_the_latest_spans_are_kept(self):
+        instrumentation = Instrumentation(maximum_spans=2)
+
+        for _ in range(5):
+            with instrumentation.span("document.save"):
+                pass
+
+        self.assertEqual(len(instrumentation.get_chrome_trace()["traceEvents"]), 2)
+        self.assertEqual(instrumentation.get_snapshot()["histograms"]["document.save.seconds"]["count"], 5)
+
+    def test_histogram_percentiles_are_bucket_bounds(self):
+        histogram = Histogram()
+
+        for value in (0, 1, 3, 3, 100):
+            histogram.observe(value)
+
+        self.assertEqual(histogram.get_percentile(20), 0.0)
+        self.assertEqual(histogram.get_percentile(40), 2.0)
+        self.assertEqual(histogram.get_percentile(80), 4.0)
+        self.assertEqual(histogram.get_percentile(100), 100)
+
+    def test_export_writes_trace_and_snapshot(self):
+        instrumentation = Instrumentation()
+        instrumentation.count("introspection.cache_hits")
+
+        with tempfile.TemporaryDirectory() as directory:
+            instrumentation.export(Path(directory))
+
+            trace_path, = Path(directory).glob("trace_*.json")
+            metrics_path, = Path(directory).glob("metrics_*.json")
+
+            self.assertEqual(json.loads(trace_path.read_text())["traceEvents"], [])
+            self.assertEqual(json.loads(metrics_path.read_text())["counters"], {"introspection.cache_hits": 1})
+
+if __name__ == "__main__":
+    unittest.main()
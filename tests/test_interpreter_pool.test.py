@@ -0,0 +1,46 @@
+import os
+
+# Must be set before the `QApplication` exists.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import unittest
+
+from PyQt5.QtCore import QCoreApplication, QObject
+
+from utilities.interpreter_pool import InterpreterPool
+
+import tempfile
+
+application = QCoreApplication.instance() or QCoreApplication([])
+
+
+class TestInterpreterPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = InterpreterPool()
+        self.addCleanup(self.pool.shut_down)
+
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+
+        self.file_name = os.path.join(temporary_directory.name, "program.py")
+
+        with open(self.file_name, "w") as file:
+            file.write("print('ran')\n")
+
+        self.parent = QObject()
+
+    def test_interpreters_start_at_the_first_run(self):
+        self.assertFalse(self.pool.idle_processes)
+
+        # The first run starts cold, and has the pool filled for the next ones.
+        self.assertIsNone(self.pool.take(self.file_name, os.path.dirname(self.file_name), None, self.parent))
+        self.assertEqual(len(self.pool.idle_processes), self.pool.SIZE)
+
+        process = self.pool.take(self.file_name, os.path.dirname(self.file_name), None, self.parent)
+
+        self.assertIsNotNone(process)
+        self.assertTrue(process.waitForFinished(30000))
+        self.assertEqual(bytes(process.readAllStandardOutput()).strip(), b"ran")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+
+# Must be set before the `QApplication` exists.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import unittest
+from unittest import mock
+
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from utilities.completion.introspection import IntrospectionPool
+
+import sys
+import tempfile
+import importlib.util
+
+application = QCoreApplication.instance() or QCoreApplication([])
+
+
+class TestIntrospectionPool(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+
+        with open(os.path.join(self.temporary_directory.name, "hanging_module.py"), "w") as file:
+            file.write("import time\ntime.sleep(600)\n")
+
+        # Spawned workers start from the editor's `sys.path`.
+        sys.path.insert(0, self.temporary_directory.name)
+        self.addCleanup(sys.path.remove, self.temporary_directory.name)
+
+        self.pool = IntrospectionPool()
+        self.addCleanup(self.pool.shut_down)
+
+    def wait_for_members(self, module_name: str, timeout_milliseconds: int = 60000):
+        loop = QEventLoop()
+
+        self.pool.members_ready.connect(lambda name: name == module_name and loop.quit())
+        QTimer.singleShot(timeout_milliseconds, loop.quit)
+
+        members = self.pool.get_members(module_name)
+
+        if members is None:
+            loop.exec()
+
+            members = self.pool.get_members(module_name)
+
+        return members
+
+    def test_members_are_introspected_and_cached(self):
+        members = self.wait_for_members("os.path")
+
+        self.assertIn("join", members)
+        self.assertIs(self.pool.get_members("os.path"), members)
+
+    def test_hanging_import_kills_its_worker(self):
+        self.pool.TIMEOUT_MILLISECONDS = 1000
+
+        # Started before the hanging lookup, so its deadline isn't spent spawning the workers.
+        self.wait_for_members("os.path")
+
+        processes = list(self.pool.worker_context.processes)
+        self.assertTrue(processes)
+
+        self.assertEqual(self.wait_for_members("hanging_module"), {})
+
+        for process in processes:
+            process.join(10)
+
+            self.assertFalse(process.is_alive())
+
+        self.assertIn("join", self.wait_for_members("posixpath" if os.name == "posix" else "ntpath"))
+
+    def test_module_versions_are_looked_up_once_per_module_index(self):
+        with mock.patch.object(importlib.util, "find_spec", wraps=importlib.util.find_spec) as find_spec:
+            version = self.pool.get_module_version("os.path")
+
+            self.assertEqual(self.pool.get_module_version("os"), version)
+            self.assertEqual(find_spec.call_count, 1)
+
+            with mock.patch.object(self.pool.module_index, "fingerprint", "refreshed"):
+                self.assertEqual(self.pool.get_module_version("os"), version)
+
+            self.assertEqual(find_spec.call_count, 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+import unittest
+
+from utilities.completion.introspection_worker import (
+    introspect_module, FUNCTION_MEMBER, MODULE_MEMBER, VALUE_MEMBER
+)
+
+
+class TestIntrospectModule(unittest.TestCase):
+    def test_members_and_signatures(self):
+        members = introspect_module("os.path")
+
+        self.assertEqual(members["join"][0], FUNCTION_MEMBER)
+        self.assertTrue(members["join"][1].startswith("(a"))
+        self.assertEqual(members["os"], (MODULE_MEMBER, None))
+        self.assertEqual(members["sep"], (VALUE_MEMBER, None))
+        self.assertNotIn("__name__", members)
+
+    def test_missing_module_raises(self):
+        with self.assertRaises(ImportError):
+            introspect_module("no_such_module_for_introspection")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import io
+import unittest
+import tempfile
+
+from utilities.journal_records import (
+    INSERT_RECORD, DELETE_RECORD, SNAPSHOT_RECORD, RECORD_FIELDS,
+    encode_header, encode_record, read_journal, get_records_to_replay
+)
+
+
+class TestJournalRecords(unittest.TestCase):
+    def test_round_trip(self):
+        journal = encode_header({"path": None}) \
+            + encode_record(INSERT_RECORD, 0, 5, b"hello") \
+            + encode_record(DELETE_RECORD, 1, 2)
+
+        base, records = read_journal(io.BytesIO(journal))
+
+        self.assertEqual(base, {"path": None})
+        self.assertEqual(records, [(INSERT_RECORD, 0, 5, b"hello"), (DELETE_RECORD, 1, 2, b"")])
+
+    def test_torn_and_corrupt_records_are_dropped(self):
+        header = encode_header({"path": None})
+        first_record = encode_record(INSERT_RECORD, 0, 3, b"abc")
+        second_record = encode_record(INSERT_RECORD, 3, 3, b"def")
+
+        _, records = read_journal(io.BytesIO(header + first_record + second_record[:-1]))
+        self.assertEqual(len(records), 1)
+
+        corrupt_record = second_record[:-1] + b"x"
+
+        _, records = read_journal(io.BytesIO(header + first_record + corrupt_record))
+        self.assertEqual(len(records), 1)
+
+    def test_corrupt_lengths_and_kinds_are_dropped_without_reading_them(self):
+        header = encode_header({"path": None})
+        first_record = encode_record(INSERT_RECORD, 0, 3, b"abc")
+
+        for kind, length in ((INSERT_RECORD, 1 << 62), (SNAPSHOT_RECORD, 4), (0xFF, 1 << 62)):
+            corrupt_record = RECORD_FIELDS.pack(kind, 0, length) + b"\0" * 4 + b"abc"
+
+            # Unlike `io.BytesIO`, a real file allocates the whole length it is asked to read.
+            with tempfile.TemporaryFile() as file:
+                file.write(header + first_record + corrupt_record)
+                file.seek(0)
+
+                _, records = read_journal(file)
+
+            self.assertEqual(records, [(INSERT_RECORD, 0, 3, b"abc")])
+
+    def test_not_a_journal(self):
+        with self.assertRaises(ValueError):
+            read_journal(io.BytesIO(b"print('hello')\n"))
+
+    def test_replay_starts_at_last_snapshot(self):
+        records = [
+            (INSERT_RECORD, 0, 1, b"a"), (SNAPSHOT_RECORD, 0, 2, b"bc"), (DELETE_RECORD, 0, 1, b"")
+        ]
+
+        self.assertEqual(get_records_to_replay(records), records[1:])
+        self.assertEqual(get_records_to_replay(records[:1]), records[:1])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from utilities.logging_pipeline import configure_logging, stop_logging
+
+from pathlib import Path
+
+import logging
+import tempfile
+
+
+class TestLoggingPipeline(unittest.TestCase):
+    def test_records_are_formatted_and_written_by_the_listener(self):
+        with tempfile.TemporaryDirectory() as directory:
+            configure_logging(Path(directory))
+
+            try:
+                logging.getLogger("pysee.documents").warning("COULD NOT LOAD %s: %s", "a.py", "denied")
+            finally:
+                stop_logging()
+
+            log = (Path(directory) / "pysee.log").read_text(encoding="utf-8")
+
+            self.assertIn("WARNING", log)
+            self.assertIn("pysee.documents", log)
+            self.assertIn("COULD NOT LOAD a.py: denied", log)
+
+    def test_configuring_twice_adds_no_handlers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            configure_logging(Path(directory))
+            configure_logging(Path(directory))
+
+            try:
+                self.assertEqual(len(logging.getLogger("pysee").handlers), 1)
+            finally:
+                stop_logging()
+
+        self.assertEqual(logging.getLogger("pysee").handlers, [])
+
+if __name__ == "__main__":
+    unittest.main()
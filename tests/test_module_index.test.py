@@ -0,0 +1,112 @@
+import unittest
+from unittest import mock
+
+from utilities.module_index import ModuleIndex
+
+from pathlib import Path
+
+import os
+import sys
+import tempfile
+
+
+def touch_directory(path: Path) -> None:
+    # Coarse file system clocks could otherwise leave the modification time unchanged.
+    modification_time = os.stat(path).st_mtime_ns + 10 ** 9
+
+    os.utime(path, ns=(modification_time, modification_time))
+
+
+class Listener:
+    def __init__(self, module_index: ModuleIndex) -> None:
+        self.module_index = module_index
+        self.calls = []
+
+    def record_modules(self) -> None:
+        self.calls.append(sorted(self.module_index.modules))
+
+
+class TestModuleIndex(unittest.TestCase):
+    def setUp(self):
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+
+        self.directory = Path(temporary_directory.name)
+
+        self.script_directory = self.directory / "script"
+        self.packages_directory = self.directory / "packages"
+
+        self.script_directory.mkdir()
+        self.packages_directory.mkdir()
+
+        (self.packages_directory / "alpha.py").write_text("")
+
+        self.cache_path = self.directory / "module_index.json"
+
+        sys_path = mock.patch.object(sys, "path", [str(self.script_directory), str(self.packages_directory)])
+        sys_path.start()
+        self.addCleanup(sys_path.stop)
+
+    def test_fingerprint_follows_installed_packages_but_not_the_script_directory(self):
+        module_index = ModuleIndex(self.cache_path)
+
+        fingerprint = module_index.get_sys_path_fingerprint()
+
+        (self.script_directory / "edited.py").write_text("")
+        touch_directory(self.script_directory)
+
+        self.assertEqual(module_index.get_sys_path_fingerprint(), fingerprint)
+
+        (self.packages_directory / "beta.py").write_text("")
+        touch_directory(self.packages_directory)
+
+        self.assertNotEqual(module_index.get_sys_path_fingerprint(), fingerprint)
+
+    def test_cache_is_reused_until_sys_path_changes(self):
+        ModuleIndex(self.cache_path).refresh()
+
+        module_index = ModuleIndex(self.cache_path)
+
+        self.assertTrue(module_index.load())
+        self.assertIn("alpha", module_index.modules)
+
+        touch_directory(self.packages_directory)
+
+        stale_module_index = ModuleIndex(self.cache_path)
+
+        # A stale cache is still loaded, to be used until the refresh is done.
+        self.assertFalse(stale_module_index.load())
+        self.assertIn("alpha", stale_module_index.modules)
+
+    def test_missing_cache_is_not_loaded(self):
+        self.assertFalse(ModuleIndex(self.cache_path).load())
+
+    def test_listeners_hear_only_of_changed_modules(self):
+        module_index = ModuleIndex(self.cache_path)
+
+        listener = Listener(module_index)
+        module_index.add_listener(listener.record_modules)
+
+        module_index.refresh()
+        module_index.refresh()
+
+        (self.packages_directory / "beta.py").write_text("")
+        touch_directory(self.packages_directory)
+
+        module_index.refresh()
+
+        self.assertEqual(len(listener.calls), 2)
+        self.assertIn("beta", listener.calls[-1])
+
+    def test_listeners_are_not_kept_alive(self):
+        module_index = ModuleIndex(self.cache_path)
+
+        module_index.add_listener(Listener(module_index).record_modules)
+
+        self.assertEqual(module_index.listeners, [])
+
+        # Refreshing with the listener gone is harmless.
+        module_index.refresh()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+from utilities.lexers.outline import Outline, METHOD_DEFINITION
+from utilities.lexers.python_tokenizer import (
+    PythonTokenizer, DEFAULT_LINE_STATE, CLASS_DEFINITION, FUNCTION_DEFINITION
+)
+
+
+def get_outline(text: bytes) -> Outline:
+    line_ends = []
+    position = 0
+
+    for line in text.splitlines(keepends=True):
+        position += len(line)
+        line_ends.append(position)
+
+    outline = Outline()
+
+    for line, (_, _, indentation, definition) in enumerate(
+        PythonTokenizer().tokenize_lines(text, line_ends, DEFAULT_LINE_STATE)
+    ):
+        outline.set_line(line, indentation, definition)
+
+    return outline
+
+
+class TestOutline(unittest.TestCase):
+    def test_symbols_are_nested_by_indentation(self):
+        outline = get_outline(
+            b"class A:\n    def method(self):\n        def inner():\n            pass\n\n"
+            b'    text = """\ndef not_a_function():\n"""\n\ndef function():\n    pass\n'
+        )
+
+        self.assertEqual(
+            [(entry.name, depth, kind) for entry, depth, kind in outline.get_symbols()],
+            [
+                ("A", 0, CLASS_DEFINITION), ("method", 1, METHOD_DEFINITION),
+                ("inner", 2, FUNCTION_DEFINITION), ("function", 0, FUNCTION_DEFINITION)
+            ]
+        )
+
+    def test_entries_follow_inserted_and_deleted_lines(self):
+        outline = get_outline(b"x = 1\ndef f():\n    pass\n")
+        entry = outline.entry_of_line[1]
+
+        outline.shift_lines(0, 3)
+        self.assertEqual(outline.get_line(entry), 4)
+
+        revision = outline.revision
+
+        outline.shift_lines(0, -2)
+        self.assertEqual(outline.get_line(entry), 2)
+        self.assertEqual(outline.revision, revision)
+
+        outline.shift_lines(1, -1)
+        self.assertEqual(outline.get_line(entry), -1)
+        self.assertGreater(outline.revision, revision)
+
+    def test_unchanged_definitions_keep_their_entry(self):
+        outline = get_outline(b"def f():\n    pass\n")
+        entry = outline.entry_of_line[0]
+        revision = outline.revision
+
+        outline.set_line(0, 0, (FUNCTION_DEFINITION, "f"))
+
+        self.assertIs(outline.entry_of_line[0], entry)
+        self.assertEqual(outline.revision, revision)
+
+        outline.set_line(0, 0, (FUNCTION_DEFINITION, "g"))
+
+        self.assertIsNot(outline.entry_of_line[0], entry)
+        self.assertGreater(outline.revision, revision)
+
+    def test_statements_around_a_line_skip_strings_and_blank_lines(self):
+        outline = get_outline(b'def f():\n    """\n    text\n    """\n\n    return 1\n')
+
+        self.assertEqual(outline.find_previous_statement(4), 1)
+        self.assertEqual(outline.find_previous_statement(1), 0)
+        self.assertEqual(outline.find_previous_statement(0), -1)
+        self.assertEqual(outline.find_next_statement(1), 5)
+
+        # Inserted lines are boundaries until they are styled.
+        outline.shift_lines(2, 1)
+        self.assertEqual(outline.find_next_statement(1), 3)
+
+        self.assertEqual(outline.find_next_statement(6), 7)
+        self.assertEqual(outline.find_next_statement(100), 101)
+
+if __name__ == "__main__":
+    unittest.main()
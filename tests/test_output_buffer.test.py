@@ -0,0 +1,28 @@
+import unittest
+
+from utilities.output_buffer import OutputBuffer
+
+
+class TestOutputBuffer(unittest.TestCase):
+    def test_runs_are_coalesced_by_stream(self):
+        buffer = OutputBuffer(10)
+
+        buffer.append("a\nb\n", False)
+        buffer.append("c\n", False)
+        buffer.append("error\n", True)
+
+        self.assertEqual(buffer.take(), (0, [("a\nb\nc\n", False), ("error\n", True)]))
+        self.assertEqual(buffer.take(), (0, []))
+
+    def test_oldest_lines_are_dropped(self):
+        buffer = OutputBuffer(3)
+
+        buffer.append("1\n2\n", False)
+        buffer.append("3\n4\n", False)
+        self.assertEqual(buffer.take(), (1, [("2\n3\n4\n", False)]))
+
+        buffer.append("".join(f"{number}\n" for number in range(100)), False)
+        self.assertEqual(buffer.take(), (97, [("97\n98\n99\n", False)]))
+
+if __name__ == "__main__":
+    unittest.main()
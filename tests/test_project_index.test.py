@@ -0,0 +1,138 @@
+import unittest
+
+from utilities.project_index import FileSearchTable, ProjectIndex
+
+from pathlib import Path
+
+import os
+import tempfile
+
+
+def create_files(root: Path, relative_paths) -> None:
+    for relative_path in relative_paths:
+        path = root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+
+
+def touch_directory(path: Path) -> None:
+    # Coarse file system clocks could otherwise leave the modification time unchanged.
+    modification_time = os.stat(path).st_mtime_ns + 10 ** 9
+
+    os.utime(path, ns=(modification_time, modification_time))
+
+
+class TestFileSearchTable(unittest.TestCase):
+    def setUp(self):
+        self.table = FileSearchTable([
+            "utilities/lexers/lexer_ide.py",
+            "utilities/lexers/python_tokenizer.py",
+            "utilities/ide.py",
+            "tests/test_python_tokenizer.test.py",
+            "lexicon/parser.py",
+            "lexers/ide.md",
+            "README.md"
+        ])
+
+    def test_names_rank_by_prefix_then_substring_then_fuzzy_then_path(self):
+        self.assertEqual(
+            self.table.search("ide", 10), ["lexers/ide.md", "utilities/ide.py", "utilities/lexers/lexer_ide.py"]
+        )
+
+        self.assertEqual(self.table.search("lexide", 10), ["utilities/lexers/lexer_ide.py", "lexers/ide.md"])
+        self.assertEqual(self.table.search("lexpars", 10), ["lexicon/parser.py"])
+
+        self.assertEqual(
+            self.table.search("pytok", 10),
+            ["tests/test_python_tokenizer.test.py", "utilities/lexers/python_tokenizer.py"]
+        )
+
+    def test_queries_ignore_case_and_spaces(self):
+        self.assertEqual(self.table.search("Read Me", 10), ["README.md"])
+        self.assertEqual(self.table.search("zzz", 10), [])
+
+    def test_limit_and_empty_query(self):
+        self.assertEqual(len(self.table.search("", 3)), 3)
+        self.assertEqual(len(self.table.search("e", 2)), 2)
+
+    def test_narrowed_queries_match_fresh_ones(self):
+        for query in ("l", "le", "lex", "lexe", "lexer", "lexerid"):
+            narrowed = self.table.search(query, 10)
+
+            self.assertEqual(narrowed, FileSearchTable(self.table.paths).search(query, 10))
+
+        self.assertEqual(self.table.search("t", 10), FileSearchTable(self.table.paths).search("t", 10))
+
+
+class TestProjectIndex(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+
+        self.root = Path(self.temporary_directory.name) / "project"
+        self.cache_directory = Path(self.temporary_directory.name) / "cache"
+
+        create_files(self.root, ["main.py", "package/module.py", "package/data/table.csv", ".git/HEAD"])
+
+    def get_paths(self, index: ProjectIndex) -> list:
+        index.rebuild_search_table()
+
+        return index.search_table.paths
+
+    def test_scan_skips_ignored_directories(self):
+        index = ProjectIndex(self.root, self.cache_directory)
+        index.scan()
+
+        self.assertEqual(self.get_paths(index), ["main.py", "package/data/table.csv", "package/module.py"])
+        self.assertEqual(index.number_of_files, 3)
+
+    def test_update_directory_adds_and_removes_trees(self):
+        index = ProjectIndex(self.root, self.cache_directory)
+        index.scan()
+
+        create_files(self.root, ["package/new/one.py", "package/new/deeper/two.py"])
+        (self.root / "package/data/table.csv").unlink()
+        (self.root / "package/data").rmdir()
+
+        added_directories, removed_directories = index.update_directory("package")
+
+        self.assertEqual(sorted(added_directories), ["package/new", "package/new/deeper"])
+        self.assertEqual(removed_directories, ["package/data"])
+        self.assertEqual(
+            self.get_paths(index), ["main.py", "package/module.py", "package/new/deeper/two.py", "package/new/one.py"]
+        )
+        self.assertEqual(index.number_of_files, 4)
+
+    def test_saved_index_is_loaded_and_validated(self):
+        index = ProjectIndex(self.root, self.cache_directory)
+        index.scan()
+        index.save()
+
+        self.assertFalse(index.has_unsaved_changes)
+
+        create_files(self.root, ["package/added.py"])
+        touch_directory(self.root / "package")
+
+        loaded_index = ProjectIndex(self.root, self.cache_directory)
+
+        self.assertTrue(loaded_index.load())
+        self.assertEqual(self.get_paths(loaded_index), self.get_paths(index))
+
+        loaded_index.validate()
+
+        self.assertIn("package/added.py", self.get_paths(loaded_index))
+        self.assertTrue(loaded_index.has_unsaved_changes)
+
+    def test_missing_cache_is_not_loaded(self):
+        self.assertFalse(ProjectIndex(self.root, self.cache_directory).load())
+
+    def test_relative_paths(self):
+        index = ProjectIndex(self.root, self.cache_directory)
+
+        self.assertEqual(index.get_relative_path(self.root / "package" / "module.py"), "package/module.py")
+        self.assertEqual(index.get_relative_path(self.root), "")
+        self.assertIsNone(index.get_relative_path(self.cache_directory))
+        self.assertEqual(index.get_absolute_path("package/module.py"), str(self.root / "package" / "module.py"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+
+from utilities.diagnostics.python_checks import (
+    ERROR, WARNING, split_blocks, analyse_block, combine_analyses
+)
+
+
+def check(source: bytes) -> list:
+    return combine_analyses([(line, analyse_block(block)) for line, block in split_blocks(source)], 100)
+
+
+class TestPythonChecks(unittest.TestCase):
+    def test_blocks_keep_decorators_clauses_and_docstrings_together(self):
+        source = (
+            b'"""\nDocstring at\ncolumn 0.\n"""\n\nimport os\n'
+            b'@decorator\n\ndef f():\n    pass\n# comment\n'
+            b'try:\n    pass\nexcept OSError:\n    pass\nelsewhere = 1\n'
+        )
+
+        self.assertEqual(
+            [(line, block.split(b"\n")[0]) for line, block in split_blocks(source)],
+            [(0, b'"""'), (5, b"import os"), (6, b"@decorator"), (11, b"try:"), (15, b"elsewhere = 1")]
+        )
+        self.assertEqual(b"".join(block for _, block in split_blocks(source)), source)
+
+    def test_syntax_errors_are_positioned_in_the_document(self):
+        diagnostics = check(b"x = 1\n\ny = (1 +\n     2))\n")
+
+        self.assertEqual(len(diagnostics), 1)
+        self.assertEqual(diagnostics[0][:2], (3, 7))
+        self.assertEqual(diagnostics[0].severity, ERROR)
+
+    def test_block_cut_short_is_incomplete(self):
+        self.assertTrue(analyse_block(b"print(\n").is_incomplete)
+        self.assertFalse(analyse_block(b"print(1))\n").is_incomplete)
+
+    def test_compiler_errors_are_reported(self):
+        self.assertEqual(analyse_block(b"return 1\n").diagnostics[0].message, "'return' outside function")
+
+    def test_undefined_names_and_unused_imports_across_blocks(self):
+        diagnostics = check(
+            b"import os\nimport sys as system\nfrom typing import List\n\n"
+            b"def f(x: 'List') -> None:\n    return helper(x) + missing\n\n"
+            b"def helper(y):\n    return [z for z in y]\n"
+        )
+
+        self.assertEqual(
+            [(diagnostic.line, diagnostic.severity, diagnostic.message) for diagnostic in diagnostics],
+            [
+                (0, WARNING, "'os' imported but unused"),
+                (1, WARNING, "'system' imported but unused"),
+                (5, WARNING, "undefined name 'missing'")
+            ]
+        )
+
+    def test_syntax_errors_hide_lint(self):
+        diagnostics = check(b"import os\nx = = 1\n")
+
+        self.assertEqual([diagnostic.severity for diagnostic in diagnostics], [ERROR])
+
+    def test_star_imports_disable_undefined_names(self):
+        self.assertEqual(check(b"from os import *\nprint(path)\n"), [])
+
+    def test_columns_are_utf8_bytes(self):
+        diagnostic, = check("s = 'é'; undefined\n".encode("utf-8"))
+
+        self.assertEqual((diagnostic.column, diagnostic.end_column), (10, 19))
+
+if __name__ == "__main__":
+    unittest.main()
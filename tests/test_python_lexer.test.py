@@ -0,0 +1,159 @@
+import os
+
+# Must be set before the `QApplication` exists.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import unittest
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.Qsci import QsciScintilla
+
+from utilities.lexers.lexer_ide import PythonLexer
+from utilities.lexers.python_tokenizer import STRING_STYLE_ID, KEYWORD_STYLE_ID
+from utilities.lexers.outline import METHOD_DEFINITION
+from utilities.instrumentation import Instrumentation
+
+application = QApplication.instance() or QApplication([])
+
+NUMBER_OF_FUNCTIONS = 2500
+
+
+def generate_document() -> str:
+    return "".join(f"def function_{number}(value):\n    return value + {number}\n" for number in range(NUMBER_OF_FUNCTIONS))
+
+
+class TestPythonLexer(unittest.TestCase):
+    def setUp(self):
+        self.editor = QsciScintilla()
+        self.addCleanup(self.editor.deleteLater)
+
+        self.lexer = PythonLexer(self.editor)
+
+        # Styled synchronously, every pass is done by the time `SCI_COLOURISE` returns.
+        self.lexer.stop_lexing_worker()
+        self.lexer.lexing_worker_enabled = False
+        self.lexer.lazy_styling_enabled = False
+
+        self.editor.setLexer(self.lexer)
+        self.editor.setText(generate_document())
+
+        self.colourise()
+
+    def colourise(self) -> int:
+        """Styles every line Scintilla considers unstyled, returning how many lines the lexer styled."""
+
+        self.lexer.instrumentation = Instrumentation()
+
+        end_styled = self.editor.SendScintilla(QsciScintilla.SCI_GETENDSTYLED)
+        self.editor.SendScintilla(QsciScintilla.SCI_COLOURISE, end_styled, -1)
+
+        return self.lexer.instrumentation.get_snapshot()["counters"].get("lexer.lines_styled", 0)
+
+    def get_fold_levels(self, editor: QsciScintilla) -> list:
+        return [editor.SendScintilla(QsciScintilla.SCI_GETFOLDLEVEL, line) for line in range(editor.lines() - 1)]
+
+    def get_style(self, line: int, index: int) -> int:
+        position = self.editor.positionFromLineIndex(line, index)
+
+        return self.editor.SendScintilla(QsciScintilla.SCI_GETSTYLEAT, position)
+
+    def test_editing_one_line_restyles_only_that_line(self):
+        line = self.editor.lines() // 2
+
+        self.editor.insertAt("x", line, 4)
+
+        self.assertEqual(self.colourise(), 1)
+
+    def test_inserting_a_line_restyles_only_the_new_lines(self):
+        line = self.editor.lines() // 2
+
+        self.editor.insertAt("    value = 0\n", line + 1, 0)
+
+        self.assertEqual(self.colourise(), 2)
+
+    def test_opening_a_string_restyles_down_to_its_end(self):
+        line = self.editor.lines() // 2
+        # The document ends with a newline, the empty line after it is never styled.
+        last_line = self.editor.lines() - 2
+
+        self.editor.insertAt('"""', line, 0)
+
+        self.assertEqual(self.colourise(), last_line - line + 1)
+        self.assertEqual(self.get_style(last_line, 4), STRING_STYLE_ID)
+
+        self.editor.setSelection(line, 0, line, 3)
+        self.editor.removeSelectedText()
+
+        self.assertEqual(self.colourise(), last_line - line + 1)
+        self.assertEqual(self.get_style(last_line, 4), KEYWORD_STYLE_ID)
+
+    def test_edited_folds_and_outline_match_a_fresh_pass(self):
+        self.editor.setText("class Shape:\n    pass\n\nvalue = 1\n")
+        self.colourise()
+
+        edits = (
+            (1, "    def area(self):\n        return 0\n\n"),
+            (3, "        # Not a statement.\n"),
+            (0, '"""\nA docstring\n\n"""\n'),
+            (9, "    \n    def perimeter(self):\n        return 1\n"),
+        )
+
+        for line, text in edits:
+            self.editor.insertAt(text, line, 0)
+            self.colourise()
+
+        # Turns the method back into a comment, merging the lines around it.
+        self.editor.insertAt("# ", 10, 4)
+        self.colourise()
+
+        fresh_editor = QsciScintilla()
+        self.addCleanup(fresh_editor.deleteLater)
+
+        fresh_lexer = PythonLexer(fresh_editor)
+        fresh_lexer.stop_lexing_worker()
+        fresh_lexer.lexing_worker_enabled = False
+        fresh_lexer.lazy_styling_enabled = False
+
+        fresh_editor.setLexer(fresh_lexer)
+        fresh_editor.setText(self.editor.text())
+        fresh_editor.SendScintilla(QsciScintilla.SCI_COLOURISE, 0, -1)
+
+        self.assertEqual(self.get_fold_levels(self.editor), self.get_fold_levels(fresh_editor))
+
+        header_lines = [
+            line for line, level in enumerate(self.get_fold_levels(self.editor))
+            if level & QsciScintilla.SC_FOLDLEVELHEADERFLAG
+        ]
+
+        self.assertEqual(header_lines, [4, 5])
+
+        symbols = [(entry.name, depth, kind) for entry, depth, kind in self.lexer.outline.get_symbols()]
+
+        self.assertEqual(symbols, [("Shape", 0, "class"), ("area", 1, METHOD_DEFINITION)])
+
+    def test_typing_in_a_long_docstring_sets_few_fold_levels(self):
+        self.editor.setText('def function():\n    """\n' + "    Documentation.\n" * 20000 + '    """\n    return 0\n')
+        self.colourise()
+
+        fold_messages = []
+        send_scintilla = self.editor.SendScintilla
+
+        def count_fold_messages(message, *arguments):
+            if message in (QsciScintilla.SCI_GETFOLDLEVEL, QsciScintilla.SCI_SETFOLDLEVEL):
+                fold_messages.append(message)
+
+            return send_scintilla(message, *arguments)
+
+        self.editor.SendScintilla = count_fold_messages
+
+        for index in range(10):
+            self.editor.insertAt("x", 10000, 4 + index)
+            self.colourise()
+
+        self.editor.insertAt("\n", 10000, 4)
+        self.colourise()
+
+        self.assertLess(len(fold_messages), 100)
+
+if __name__ == "__main__":
+    unittest.main()
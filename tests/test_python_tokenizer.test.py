@@ -0,0 +1,123 @@
+import unittest
+
+from utilities.lexers.python_tokenizer import (
+    PythonTokenizer, DEFAULT_LINE_STATE, TRIPLE_DOUBLE_QUOTE_STATE, CONTINUED_SINGLE_QUOTE_STATE,
+    STRING_STATE_MASK, CONTINUATION_STATE, BRACKET_DEPTH_SHIFT, REGULAR_STYLE_ID, KEYWORD_STYLE_ID, FUNCTION_STYLE_ID,
+    COMMENT_STYLE_ID, BRACKETS_STYLE_ID, MODULE_STYLE_ID, STRING_STYLE_ID,
+    NO_INDENTATION, CLASS_DEFINITION, FUNCTION_DEFINITION
+)
+
+
+class TestPythonTokenizer(unittest.TestCase):
+    def setUp(self):
+        self.tokenizer = PythonTokenizer(["os"])
+
+    def test_runs_cover_every_byte(self):
+        line = "print(\"héllo\")  # 注释\n".encode("utf-8")
+
+        runs, _ = self.tokenizer.tokenize_line(memoryview(line), DEFAULT_LINE_STATE)
+
+        self.assertEqual(sum(length for length, _ in runs), len(line))
+
+    def test_adjacent_runs_are_coalesced(self):
+        runs, _ = self.tokenizer.tokenize_line(b"a = b\n", DEFAULT_LINE_STATE)
+
+        self.assertEqual(runs[0], (2, REGULAR_STYLE_ID))
+
+        for previous_run, run in zip(runs, runs[1:]):
+            self.assertNotEqual(previous_run[1], run[1])
+
+    def test_names_are_looked_up(self):
+        runs, _ = self.tokenizer.tokenize_line(b"import os; len", DEFAULT_LINE_STATE)
+
+        self.assertEqual(
+            [style for _, style in runs if style != REGULAR_STYLE_ID],
+            [KEYWORD_STYLE_ID, MODULE_STYLE_ID, FUNCTION_STYLE_ID]
+        )
+
+    def test_comment(self):
+        runs, _ = self.tokenizer.tokenize_line(b"x  # '''not a string", DEFAULT_LINE_STATE)
+
+        self.assertEqual(runs[-1], (17, COMMENT_STYLE_ID))
+
+    def test_triple_quoted_string_spans_lines(self):
+        _, state = self.tokenizer.tokenize_line(b"x = \"\"\"start\n", DEFAULT_LINE_STATE)
+        self.assertEqual(state, TRIPLE_DOUBLE_QUOTE_STATE)
+
+        runs, state = self.tokenizer.tokenize_line(b"middle ( # \n", state)
+        self.assertEqual(runs, [(12, STRING_STYLE_ID)])
+        self.assertEqual(state, TRIPLE_DOUBLE_QUOTE_STATE)
+
+        runs, state = self.tokenizer.tokenize_line(b"end\"\"\" + 1\n", state)
+        self.assertEqual(runs[0], (6, STRING_STYLE_ID))
+        self.assertEqual(state, DEFAULT_LINE_STATE)
+
+    def test_brackets_and_continuation(self):
+        _, state = self.tokenizer.tokenize_line(b"f(a, [\n", DEFAULT_LINE_STATE)
+        self.assertEqual(state >> BRACKET_DEPTH_SHIFT, 2)
+
+        _, state = self.tokenizer.tokenize_line(b"1]) + \\\n", state)
+        self.assertEqual(state, CONTINUATION_STATE)
+
+    def test_unterminated_string_closes_the_brackets_of_its_line(self):
+        runs, state = self.tokenizer.tokenize_line(b"print('unterminated)\n", DEFAULT_LINE_STATE)
+        self.assertEqual(runs[-2:], [(14, STRING_STYLE_ID), (1, REGULAR_STYLE_ID)])
+        self.assertEqual(state, DEFAULT_LINE_STATE)
+
+        _, state = self.tokenizer.tokenize_line(b"    {\"key: [1, 2]}\n", 1 << BRACKET_DEPTH_SHIFT)
+        self.assertEqual(state >> BRACKET_DEPTH_SHIFT, 1)
+
+        _, state = self.tokenizer.tokenize_line(b"print('escaped \\')\n", DEFAULT_LINE_STATE)
+        self.assertEqual(state, DEFAULT_LINE_STATE)
+
+        _, state = self.tokenizer.tokenize_line(b"f('closed', (\n", DEFAULT_LINE_STATE)
+        self.assertEqual(state >> BRACKET_DEPTH_SHIFT, 2)
+
+    def test_backslash_carries_a_string_to_the_next_line(self):
+        runs, state = self.tokenizer.tokenize_line(b"f(x, 'first \\\n", DEFAULT_LINE_STATE)
+        self.assertEqual(runs[-1], (9, STRING_STYLE_ID))
+        self.assertEqual(state, CONTINUED_SINGLE_QUOTE_STATE | 1 << BRACKET_DEPTH_SHIFT)
+
+        runs, state = self.tokenizer.tokenize_line(b"second ) \\\r\n", state)
+        self.assertEqual(runs, [(12, STRING_STYLE_ID)])
+        self.assertEqual(state, CONTINUED_SINGLE_QUOTE_STATE | 1 << BRACKET_DEPTH_SHIFT)
+
+        runs, state = self.tokenizer.tokenize_line(b"third')\n", state)
+        self.assertEqual(runs, [(6, STRING_STYLE_ID), (1, BRACKETS_STYLE_ID), (1, REGULAR_STYLE_ID)])
+        self.assertEqual(state, DEFAULT_LINE_STATE)
+
+        self.assertEqual(
+            self.tokenizer.get_line_structure(b"def f():\n", CONTINUED_SINGLE_QUOTE_STATE), (NO_INDENTATION, None)
+        )
+
+    def test_escaped_backslash_ends_a_string_at_the_end_of_its_line(self):
+        _, state = self.tokenizer.tokenize_line(b"print('escaped \\\\\n", 1 << BRACKET_DEPTH_SHIFT)
+        self.assertEqual(state & STRING_STATE_MASK, DEFAULT_LINE_STATE)
+        self.assertEqual(state >> BRACKET_DEPTH_SHIFT, 1)
+
+    def test_backslash_in_comment_is_not_continuation(self):
+        lines = list(self.tokenizer.tokenize_lines(b"# path C:\\\ndef foo():\n", [11, 22], DEFAULT_LINE_STATE))
+
+        self.assertEqual(lines[0][1], DEFAULT_LINE_STATE)
+        self.assertEqual(lines[1][2:], (0, (FUNCTION_DEFINITION, "foo")))
+
+    def test_line_structure(self):
+        self.assertEqual(
+            self.tokenizer.get_line_structure(b"    async def f\xc3\xa9(x):\n", DEFAULT_LINE_STATE),
+            (4, (FUNCTION_DEFINITION, "f\u00e9"))
+        )
+        self.assertEqual(
+            self.tokenizer.get_line_structure(b"\tclass A:\n", DEFAULT_LINE_STATE), (8, (CLASS_DEFINITION, "A"))
+        )
+        self.assertEqual(self.tokenizer.get_line_structure(b"  x = 1\n", DEFAULT_LINE_STATE), (2, None))
+
+        for line in (b"\n", b"   \r\n", b"  # def f():\n", b""):
+            self.assertEqual(self.tokenizer.get_line_structure(line, DEFAULT_LINE_STATE), (NO_INDENTATION, None))
+
+        self.assertEqual(self.tokenizer.get_line_structure(b"def f():\n", CONTINUATION_STATE), (NO_INDENTATION, None))
+        self.assertEqual(
+            self.tokenizer.get_line_structure(b"def f():\n", TRIPLE_DOUBLE_QUOTE_STATE), (NO_INDENTATION, None)
+        )
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+from utilities.startup_trace import StartupTrace
+
+import sys
+import importlib
+
+
+def get_enabled_trace() -> StartupTrace:
+    trace = StartupTrace()
+    trace.enabled = True
+
+    return trace
+
+
+class TestStartupTrace(unittest.TestCase):
+    def test_imports_are_timed_while_started(self):
+        trace = get_enabled_trace()
+
+        # Imported afresh, so its loader runs through the finder.
+        sys.modules.pop("colorsys", None)
+
+        trace.start()
+
+        import_timing_finder = trace.import_timing_finder
+
+        try:
+            self.assertIs(sys.meta_path[0], import_timing_finder)
+
+            colorsys = importlib.import_module("colorsys")
+        finally:
+            trace.stop()
+
+        self.assertNotIn(import_timing_finder, sys.meta_path)
+        self.assertEqual(colorsys.rgb_to_hsv(1.0, 0.0, 0.0), (0.0, 1.0, 1.0))
+
+        (name, self_seconds, cumulative_seconds), = [item for item in trace.imports if item[0] == "colorsys"]
+
+        self.assertLessEqual(self_seconds, cumulative_seconds)
+        self.assertEqual(trace.import_stack, [])
+
+        self.assertIn("colorsys", trace.get_report())
+
+    def test_phases_and_marks_are_reported(self):
+        trace = get_enabled_trace()
+
+        with trace.phase("create window"):
+            pass
+
+        trace.mark("first paint")
+
+        self.assertEqual([name for name, _, _ in trace.phases], ["create window", "first paint"])
+
+        report = trace.get_report()
+
+        self.assertIn("create window", report)
+        self.assertIn("first paint", report)
+
+    def test_disabled_trace_records_nothing(self):
+        trace = StartupTrace()
+        trace.enabled = False
+
+        trace.start()
+
+        with trace.phase("create window"):
+            pass
+
+        self.assertIsNone(trace.import_timing_finder)
+        self.assertEqual(trace.phases, [])
+
+if __name__ == "__main__":
+    unittest.main()
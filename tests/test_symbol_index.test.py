@@ -0,0 +1,60 @@
+import unittest
+
+from utilities.completion.symbol_index import PrefixTrie, BufferSymbolIndex
+
+
+class TestPrefixTrie(unittest.TestCase):
+    def test_prefix_is_case_insensitive(self):
+        trie = PrefixTrie()
+
+        for word in ["Foo", "foobar", "bar"]:
+            trie.insert(word)
+
+        self.assertEqual(sorted(trie.get_words_with_prefix("FOO", 10)), ["Foo", "foobar"])
+
+    def test_word_stays_until_last_definition_is_removed(self):
+        trie = PrefixTrie()
+
+        trie.insert("value")
+        trie.insert("value")
+
+        trie.remove("value")
+        self.assertEqual(trie.get_words_with_prefix("va", 10), ["value"])
+
+        trie.remove("value")
+        self.assertEqual(trie.get_words_with_prefix("va", 10), [])
+        self.assertEqual(trie.root, [{}, {}])
+
+
+class TestBufferSymbolIndex(unittest.TestCase):
+    def test_symbols_of_line(self):
+        index = BufferSymbolIndex()
+
+        self.assertEqual(index.get_symbols_of_line("import os.path, numpy as np\n"), (("os", 2), ("np", 2)))
+        self.assertEqual(index.get_symbols_of_line("async def fetch(url):\n"), (("fetch", 1),))
+        self.assertEqual(index.get_symbols_of_line("a, b: int = 1, 2\n"), (("a", None), ("b", None)))
+        self.assertEqual(index.get_symbols_of_line("if a == b:\n"), ())
+
+    def test_replace_lines(self):
+        index = BufferSymbolIndex()
+
+        index.replace_lines(0, 1, ["def first():\n", "    second = 2\n", "third = 3\n"])
+        self.assertEqual(sorted(index.get_completions("")), ["first?1", "second", "third"])
+
+        index.replace_lines(1, 2, ["pass\n"])
+        self.assertEqual(index.get_completions(""), ["first?1"])
+        self.assertEqual(len(index.symbols_of_line), 2)
+
+    def test_images_are_dropped_with_their_last_definition(self):
+        index = BufferSymbolIndex()
+
+        index.replace_lines(0, 1, ["def first():\n", "def first():\n", "import os\n"])
+
+        index.replace_lines(0, 1, [])
+        self.assertEqual(index.image_of_symbol, {"first": 1, "os": 2})
+
+        index.replace_lines(0, 2, ["second = 2\n"])
+        self.assertEqual(index.image_of_symbol, {"second": None})
+
+if __name__ == "__main__":
+    unittest.main()
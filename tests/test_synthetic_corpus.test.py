@@ -0,0 +1,56 @@
+import unittest
+
+from tests.benchmarks.synthetic_corpus import generate_corpus
+
+from utilities.lexers.python_tokenizer import PythonTokenizer, DEFAULT_LINE_STATE, BRACKET_DEPTH_SHIFT
+
+
+class TestSyntheticCorpus(unittest.TestCase):
+    def test_corpus_has_the_requested_lines(self):
+        for number_of_lines in (1, 17, 1000):
+            corpus = generate_corpus(number_of_lines)
+
+            self.assertEqual(len(corpus.splitlines()), number_of_lines)
+            self.assertTrue(corpus.endswith("\n"))
+
+    def test_corpus_is_deterministic(self):
+        self.assertEqual(generate_corpus(500, seed=3), generate_corpus(500, seed=3))
+        self.assertNotEqual(generate_corpus(500, seed=3), generate_corpus(500, seed=4))
+
+    def test_corpus_mixes_unicode_comments_and_strings(self):
+        corpus = generate_corpus(1000)
+
+        self.assertFalse(corpus.isascii())
+        self.assertIn("#", corpus)
+        self.assertIn('"""', corpus)
+        self.assertIn("'''", corpus)
+
+    def tokenize(self, text: bytes) -> list:
+        line_ends = []
+        position = 0
+
+        for line in text.splitlines(keepends=True):
+            position += len(line)
+            line_ends.append(position)
+
+        return PythonTokenizer(["os"]).tokenize_lines(memoryview(text), line_ends, DEFAULT_LINE_STATE)
+
+    def test_tokenizer_covers_every_byte(self):
+        text = generate_corpus(1000).encode("utf-8")
+
+        lines = self.tokenize(text)
+
+        self.assertEqual(sum(length for runs, *_ in lines for length, _ in runs), len(text))
+
+    def test_unterminated_strings_leave_no_bracket_open(self):
+        corpus = generate_corpus(5000)
+
+        self.assertIn("'unterminated on purpose\n", corpus)
+
+        # Only the call spread over three lines is still inside its bracket at the end of a line.
+        bracket_depths = {state >> BRACKET_DEPTH_SHIFT for _, state, *_ in self.tokenize(corpus.encode("utf-8"))}
+
+        self.assertEqual(bracket_depths, {0, 1})
+
+if __name__ == "__main__":
+    unittest.main()
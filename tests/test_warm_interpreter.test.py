@@ -0,0 +1,87 @@
+import unittest
+
+from pathlib import Path
+
+import sys
+import json
+import tempfile
+import subprocess
+
+BOOTSTRAP_PATH = Path(__file__).parent.parent / "utilities" / "warm_interpreter.py"
+
+PROGRAM = """
+import os
+import sys
+import json
+
+try:
+    import resource
+    memory_limit = resource.getrlimit(resource.RLIMIT_AS)[0]
+except ImportError:
+    memory_limit = None
+
+print(json.dumps({
+    "argv": sys.argv, "path": sys.path[0], "working_directory": os.getcwd(),
+    "memory_limit": memory_limit, "preloaded": "colorsys" in sys.modules
+}))
+"""
+
+
+class TestWarmInterpreter(unittest.TestCase):
+    def setUp(self):
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+
+        self.directory = Path(temporary_directory.name).resolve()
+
+    def run_bootstrap(self, source: str, script_directory=None, memory_limit_megabytes: int = 1024):
+        program_path = self.directory / "program.py"
+        program_path.write_text(source)
+
+        request = {
+            "file_name": str(program_path), "working_directory": str(self.directory),
+            "script_directory": script_directory
+        }
+
+        return subprocess.run(
+            [sys.executable, "-u", str(BOOTSTRAP_PATH), "colorsys", str(memory_limit_megabytes)],
+            input=json.dumps(request) + "\n", capture_output=True, text=True, timeout=60
+        )
+
+    def test_program_runs_as_main_under_the_memory_limit(self):
+        completed = self.run_bootstrap(PROGRAM)
+
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+
+        report = json.loads(completed.stdout)
+
+        self.assertEqual(report["argv"], [str(self.directory / "program.py")])
+        self.assertEqual(report["path"], str(self.directory))
+        self.assertEqual(report["working_directory"], str(self.directory))
+        self.assertTrue(report["preloaded"])
+
+        try:
+            import resource
+        except ImportError:
+            return
+
+        hard_limit = resource.getrlimit(resource.RLIMIT_AS)[1]
+        limit = 1024 * 1024 * 1024
+
+        self.assertEqual(report["memory_limit"], limit if hard_limit == resource.RLIM_INFINITY else min(limit, hard_limit))
+
+    def test_script_directory_comes_first_on_the_path(self):
+        completed = self.run_bootstrap(PROGRAM, script_directory=str(self.directory / "project"))
+
+        self.assertEqual(json.loads(completed.stdout)["path"], str(self.directory / "project"))
+
+    def test_tracebacks_start_at_the_program(self):
+        completed = self.run_bootstrap("raise ValueError('broken')\n")
+
+        self.assertEqual(completed.returncode, 1)
+        self.assertNotIn("runpy", completed.stderr)
+        self.assertNotIn("warm_interpreter", completed.stderr)
+        self.assertIn("ValueError: broken", completed.stderr)
+
+if __name__ == "__main__":
+    unittest.main()
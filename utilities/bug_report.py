@@ -5,9 +5,7 @@ from PyQt5.QtWidgets import QMessageBox, QLineEdit, QPushButton, QWidget, QTextE
 from PyQt5.QtGui import QFont, QIcon
 from PyQt5.QtCore import pyqtSlot
 
-from utilities.settings.essential_settings import DEBUGGING_MODE
-
-from pathlib import Path
+from utilities.settings.essential_settings import ASSETS_DIRECTORY, STYLESHEETS_DIRECTORY
 
 import logging
 
@@ -17,11 +15,7 @@ from datetime import datetime
 
 from discord_webhook import DiscordWebhook, DiscordEmbed
 
-logging.basicConfig(
-    level=logging.DEBUG, 
-    format="%(levelname)s on %(asctime)s in %(filename)s; %(message)s", 
-    datefmt="%d/%m/%Y, %I:%M:%S %p"
-)
+logger = logging.getLogger("pysee.interface")
 
 
 class BugReport(QWidget):
@@ -52,7 +46,7 @@ class BugReport(QWidget):
 
         self.setGeometry(self.WINDOW_X, self.WINDOW_Y, self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
         self.setWindowTitle(self.TITLE)
-        self.setWindowIcon(QIcon(r"assets\doce_logo.png"))
+        self.setWindowIcon(QIcon(str(ASSETS_DIRECTORY / "doce_logo.png")))
 
         self.start_UI()
 
@@ -106,14 +100,10 @@ class BugReport(QWidget):
         self.destroy()
         sys.exit(0)
 
-    def console_debug(self, message):
-        """
-        Debugs message to terminal if 
-        `utilities.settings.consts.DEBUGGING_MODE` is set to True
-        """
+    def console_debug(self, message, *arguments):
+        """Logs `message` at the debug level of `pysee.interface`, formatted with `arguments` on the logging thread."""
 
-        if DEBUGGING_MODE: 
-            logging.debug(message)
+        logger.debug(message, *arguments)
 
     def create_bug_text_box(self):
         self.bug_text_box = QLineEdit(self)
@@ -156,7 +146,7 @@ class BugReport(QWidget):
 
         self.document_window = None
 
-        self.style_sheet_path = Path(r"utilities\settings\stylesheets\main_menu_style.qss")
+        self.style_sheet_path = STYLESHEETS_DIRECTORY / "main_menu_style.qss"
         self.setStyleSheet(self.style_sheet_path.read_text())
 
         self.create_bug_text_box()
@@ -0,0 +1,185 @@
+"""Non-blocking execution of Python code in a child process, powered by `PyQt5.QtCore.QProcess`."""
+
+from PyQt5.QtCore import QObject, QProcess, QProcessEnvironment, QTimer, pyqtSignal, pyqtSlot
+
+from utilities.settings.essential_settings import (
+    ESSENTIAL_CACHE_DIRECTORY, RUN_CODE_TERMINATION_GRACE_MILLISECONDS, INTERPRETER_POOL_ENABLED
+)
+
+from utilities.interpreter_pool import get_interpreter_pool
+
+import logging
+
+import os
+import sys
+import time
+import codecs
+
+logger = logging.getLogger("pysee.running")
+
+
+class CodeRunner(QObject):
+    """
+    Runs a file or a buffer with the current interpreter and streams its output as it comes. \\
+    The process never blocks the event loop; it can be cancelled and reports its exit code and run time. \\
+    Inherits `PyQt5.QtCore.QObject`.
+    """
+
+    started = pyqtSignal(str)
+    output_received = pyqtSignal(str, bool)
+    finished = pyqtSignal(int, float, bool)
+
+    def __init__(self, parent=None) -> None:
+        super(CodeRunner, self).__init__(parent)
+
+        self.TERMINATION_GRACE_MILLISECONDS: int = RUN_CODE_TERMINATION_GRACE_MILLISECONDS
+
+        self.process = None
+        self.start_time = 0.0
+        self.cancelled = False
+
+        self.stdout_decoder = None
+        self.stderr_decoder = None
+
+        self.buffer_path = ESSENTIAL_CACHE_DIRECTORY / f"run_buffer_{os.getpid()}_{id(self)}.py"
+
+        self.interpreter_pool = get_interpreter_pool() if INTERPRETER_POOL_ENABLED else None
+
+    def console_debug(self, message, *arguments):
+        logger.debug(message, *arguments)
+
+    def is_running(self) -> bool:
+        return self.process is not None and self.process.state() != QProcess.NotRunning
+
+    def run_source(self, source: bytes, working_directory: str, script_directory=None) -> None:
+        """
+        Runs the UTF-8 `source` of an unsaved buffer from a scratch file. \\
+        Modules are imported from `script_directory`, the directory of the saved file the buffer holds changes to,
+        as if the file itself ran.
+        """
+
+        ESSENTIAL_CACHE_DIRECTORY.mkdir(parents=True, exist_ok=True)
+
+        with open(self.buffer_path, "wb") as file:
+            file.write(source)
+
+        self.run_file(str(self.buffer_path), working_directory, script_directory)
+
+    def run_file(self, file_name: str, working_directory: str, script_directory=None) -> None:
+        if self.is_running():
+            return
+
+        self.cancelled = False
+        self.start_time = time.perf_counter()
+
+        self.stdout_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.stderr_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        if self.interpreter_pool is not None:
+            self.process = self.interpreter_pool.take(file_name, working_directory, script_directory, self)
+        else:
+            self.process = None
+
+        if self.process is None:
+            self.start_cold_interpreter(file_name, working_directory, script_directory)
+        else:
+            self.console_debug("RUNNING %s IN A WARM INTERPRETER", file_name)
+
+            self.connect_process()
+
+        self.started.emit(file_name)
+
+    def start_cold_interpreter(self, file_name: str, working_directory: str, script_directory=None) -> None:
+        self.process = QProcess(self)
+
+        environment = QProcessEnvironment.systemEnvironment()
+        environment.insert("PYTHONUNBUFFERED", "1")
+        environment.insert("PYTHONIOENCODING", "utf-8")
+
+        # Right after the directory of the scratch file, which holds no modules of its own.
+        if script_directory:
+            python_path = environment.value("PYTHONPATH")
+
+            environment.insert(
+                "PYTHONPATH", script_directory + os.pathsep + python_path if python_path else script_directory
+            )
+
+        self.process.setProcessEnvironment(environment)
+        self.process.setWorkingDirectory(working_directory)
+
+        self.connect_process()
+
+        self.console_debug("RUNNING %s", file_name)
+
+        self.process.start(sys.executable, ["-u", file_name])
+
+        # There is no console to type into, so `input()` gets an end of file instead of hanging.
+        self.process.closeWriteChannel()
+
+    def connect_process(self) -> None:
+        self.process.readyReadStandardOutput.connect(self.read_standard_output)
+        self.process.readyReadStandardError.connect(self.read_standard_error)
+        self.process.finished.connect(self.finish)
+        self.process.errorOccurred.connect(self.report_error)
+
+    @pyqtSlot()
+    def read_standard_output(self):
+        text = self.stdout_decoder.decode(bytes(self.process.readAllStandardOutput()))
+
+        if text:
+            self.output_received.emit(text, False)
+
+    @pyqtSlot()
+    def read_standard_error(self):
+        text = self.stderr_decoder.decode(bytes(self.process.readAllStandardError()))
+
+        if text:
+            self.output_received.emit(text, True)
+
+    @pyqtSlot()
+    def cancel(self):
+        """Asks the process to terminate, and kills it if it is still running after a grace period."""
+
+        if not self.is_running():
+            return
+
+        self.cancelled = True
+
+        self.process.terminate()
+
+        process = self.process
+
+        QTimer.singleShot(
+            self.TERMINATION_GRACE_MILLISECONDS,
+            lambda: process.kill() if process.state() != QProcess.NotRunning else None
+        )
+
+    @pyqtSlot(int, QProcess.ExitStatus)
+    def finish(self, exit_code, exit_status):
+        self.read_standard_output()
+        self.read_standard_error()
+
+        elapsed_seconds = time.perf_counter() - self.start_time
+
+        if exit_status == QProcess.CrashExit and not exit_code:
+            exit_code = -1
+
+        self.console_debug("RUN FINISHED WITH EXIT CODE %d IN %.3f SECONDS", exit_code, elapsed_seconds)
+
+        self.finished.emit(exit_code, elapsed_seconds, self.cancelled)
+
+        self.process.deleteLater()
+        self.process = None
+
+    @pyqtSlot(QProcess.ProcessError)
+    def report_error(self, error):
+        # Only a failed start never reaches `finished`.
+        if error != QProcess.FailedToStart:
+            return
+
+        self.output_received.emit(f"Could not start {sys.executable}: {self.process.errorString()}\n", True)
+
+        self.finished.emit(-1, time.perf_counter() - self.start_time, False)
+
+        self.process.deleteLater()
+        self.process = None
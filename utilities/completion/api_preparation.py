@@ -0,0 +1,135 @@
+"""Cached and deferred preparation of the `PyQt5.Qsci.QsciAPIs` used for autocompletion."""
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+from PyQt5.Qsci import QsciAPIs
+
+from utilities.settings.essential_settings import ESSENTIAL_CACHE_DIRECTORY
+
+from utilities.module_index import ModuleIndex
+
+import logging
+
+import sys
+import hashlib
+
+import builtins
+import keyword
+
+logger = logging.getLogger("pysee.completion")
+
+
+class APIPreparation(QObject):
+    """
+    Fills and prepares a `PyQt5.Qsci.QsciAPIs` after the first paint. \\
+    Prepared data is saved in the `QsciAPIs` prepared format, keyed by the interpreter
+    and the module index fingerprint, so later launches load it instead of rebuilding it. \\
+    Inherits `PyQt5.QtCore.QObject`.
+    """
+
+    ready = pyqtSignal()
+    module_index_refreshed = pyqtSignal()
+
+    def __init__(self, api: QsciAPIs, module_index: ModuleIndex) -> None:
+        super(APIPreparation, self).__init__(api)
+
+        self.api = api
+        self.module_index = module_index
+
+        self.CACHE_DIRECTORY = ESSENTIAL_CACHE_DIRECTORY
+
+        self.prepared_apis_path = None
+
+        # `QsciAPIs` may still deliver the result of a cancelled preparation into the next one,
+        # so a preparation is never cancelled: a refresh during one prepares again once it is done.
+        self.is_preparing = False
+        self.is_preparation_outdated = False
+
+        self.api.apiPreparationFinished.connect(self.save_prepared_apis)
+
+        self.module_index.add_listener(self.announce_module_index_refresh)
+        self.module_index_refreshed.connect(self.prepare)
+
+    def console_debug(self, message, *arguments):
+        logger.debug(message, *arguments)
+
+    def announce_module_index_refresh(self) -> None:
+        # Refreshes happen on a background thread, the signal brings them back to this one.
+        self.module_index_refreshed.emit()
+
+    def start(self) -> None:
+        """Loads or prepares the APIs once the event loop is idle, so the first paint isn't blocked."""
+
+        QTimer.singleShot(0, self.load_or_prepare)
+
+    def get_prepared_apis_path(self):
+        if not self.module_index.fingerprint:
+            return None
+
+        key = "\n".join([sys.executable, sys.version, self.module_index.fingerprint])
+
+        return self.CACHE_DIRECTORY / f"apis_{hashlib.sha1(key.encode('utf-8')).hexdigest()}.pap"
+
+    @pyqtSlot()
+    def load_or_prepare(self):
+        self.prepared_apis_path = self.get_prepared_apis_path()
+
+        if self.prepared_apis_path is not None \
+        and self.api.isPrepared(str(self.prepared_apis_path)) \
+        and self.api.loadPrepared(str(self.prepared_apis_path)):
+            self.console_debug("PREPARED APIS LOADED FROM %s", self.prepared_apis_path)
+
+            self.ready.emit()
+        else:
+            self.prepare()
+
+    @pyqtSlot()
+    def prepare(self):
+        """Fills the APIs with built-ins, keywords and modules, then prepares them on `QsciAPIs`' own thread."""
+
+        if self.is_preparing:
+            self.is_preparation_outdated = True
+
+            return
+
+        self.is_preparing = True
+        self.is_preparation_outdated = False
+
+        self.prepared_apis_path = self.get_prepared_apis_path()
+
+        self.api.clear()
+
+        for built_in_function in dir(builtins) + list(keyword.kwlist):
+            if keyword.iskeyword(built_in_function):
+                self.api.add(f"{built_in_function}?3")
+            else:
+                self.api.add(built_in_function)
+
+        for module in self.module_index.modules:
+            self.api.add(f"{module}?2")
+
+        self.api.prepare()
+
+    @pyqtSlot()
+    def save_prepared_apis(self):
+        self.is_preparing = False
+
+        if self.is_preparation_outdated:
+            self.prepare()
+
+            return
+
+        if self.prepared_apis_path is not None:
+            try:
+                self.CACHE_DIRECTORY.mkdir(parents=True, exist_ok=True)
+
+                # Prepared APIs of older interpreters or module sets are never loaded again.
+                for old_prepared_apis_path in self.CACHE_DIRECTORY.glob("apis_*.pap"):
+                    if old_prepared_apis_path != self.prepared_apis_path:
+                        old_prepared_apis_path.unlink()
+            except OSError as error:
+                self.console_debug("OLD PREPARED APIS NOT REMOVED: %s", error)
+
+            if self.api.savePrepared(str(self.prepared_apis_path)):
+                self.console_debug("PREPARED APIS SAVED TO %s", self.prepared_apis_path)
+
+        self.ready.emit()
@@ -0,0 +1,94 @@
+"""Autocompletion APIs that also know the symbols of the open buffer, powered by `Qsci`."""
+
+from PyQt5.Qsci import QsciAPIs, QsciLexer
+
+from utilities.completion.symbol_index import BufferSymbolIndex, FUNCTION_SYMBOL_IMAGE, MODULE_SYMBOL_IMAGE
+from utilities.completion.introspection import IntrospectionPool
+from utilities.completion.introspection_worker import FUNCTION_MEMBER, MODULE_MEMBER
+
+from utilities.instrumentation import get_instrumentation
+
+
+class BufferAwareAPIs(QsciAPIs):
+    """
+    `PyQt5.Qsci.QsciAPIs` whose completions are merged with the prefix matches of a
+    `utilities.completion.symbol_index.BufferSymbolIndex`,
+    so the document never has to be rescanned for words. \\
+    Attributes after a dot and call tips come from a
+    `utilities.completion.introspection.IntrospectionPool`. \\
+    Inherits `PyQt5.Qsci.QsciAPIs`.
+    """
+    def __init__(self, lexer: QsciLexer, symbol_index: BufferSymbolIndex, introspection_pool: IntrospectionPool) -> None:
+        super(BufferAwareAPIs, self).__init__(lexer)
+
+        self.symbol_index = symbol_index
+        self.introspection_pool = introspection_pool
+
+        self.IMAGE_OF_MEMBER_KIND = {FUNCTION_MEMBER: FUNCTION_SYMBOL_IMAGE, MODULE_MEMBER: MODULE_SYMBOL_IMAGE}
+
+        self.instrumentation = get_instrumentation()
+
+    def updateAutoCompletionList(self, context, word_list):
+        with self.instrumentation.span("completion.update_list", depth=len(context)):
+            return self.get_completion_list(context, word_list)
+
+    def get_completion_list(self, context, word_list) -> list:
+        word_list = super(BufferAwareAPIs, self).updateAutoCompletionList(context, word_list)
+
+        if len(context) > 1:
+            return word_list + self.get_member_completions(context)
+
+        # Only plain names come from the buffer.
+        if not context or not context[0]:
+            return word_list
+
+        known_words = {word.split("?")[0] for word in word_list}
+
+        for completion in self.symbol_index.get_completions(context[0]):
+            if completion.split("?")[0] not in known_words:
+                word_list.append(completion)
+
+        return word_list
+
+    def get_member_completions(self, context) -> list:
+        """
+        Returns the members of the module named by `context` (like `["os", "pa"]`) starting with its last part. \\
+        Nothing is returned while the module is being introspected, the next keystroke picks the members up.
+        """
+
+        members = self.introspection_pool.get_members(".".join(context[:-1]))
+
+        if not members:
+            return []
+
+        prefix = context[-1].lower()
+        completions = []
+
+        for name, (kind, _) in members.items():
+            # Private members only show up once an underscore is typed.
+            if name.lower().startswith(prefix) and (prefix.startswith("_") or not name.startswith("_")):
+                image = self.IMAGE_OF_MEMBER_KIND.get(kind)
+
+                completions.append(name if image is None else f"{name}?{image}")
+
+        return completions
+
+    def callTips(self, context, commas, style, shifts):
+        with self.instrumentation.span("completion.call_tips"):
+            return self.get_call_tips(context, commas, style, shifts)
+
+    def get_call_tips(self, context, commas, style, shifts) -> list:
+        call_tips = super(BufferAwareAPIs, self).callTips(context, commas, style, shifts)
+
+        if call_tips or not context or not context[-1]:
+            return call_tips
+
+        # A plain name is looked up among the built-ins.
+        module_name = ".".join(context[:-1]) or "builtins"
+
+        signature = self.introspection_pool.get_signature(module_name, context[-1])
+
+        if signature is None:
+            return call_tips
+
+        return [f"{context[-1]}{signature}"]
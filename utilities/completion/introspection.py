@@ -0,0 +1,258 @@
+"""
+Member and signature introspection for autocompletion and call tips,
+done by worker processes so user modules are never imported into the editor.
+"""
+
+from PyQt5.QtCore import QObject, QCoreApplication, QTimer, pyqtSignal, pyqtSlot
+
+from utilities.settings.essential_settings import (
+    INTROSPECTION_WORKER_COUNT,
+    INTROSPECTION_TASKS_PER_WORKER, INTROSPECTION_CACHE_SIZE, INTROSPECTION_TIMEOUT_MILLISECONDS
+)
+
+from utilities.completion.introspection_worker import introspect_module
+
+from utilities.module_index import get_module_index
+from utilities.instrumentation import get_instrumentation
+
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+
+import logging
+
+import os
+import sys
+import threading
+import importlib.util
+import multiprocessing
+
+logger = logging.getLogger("pysee.completion")
+
+_introspection_pool = None
+
+
+class WorkerProcessContext:
+    """
+    The multiprocessing context of an executor's workers, remembering the processes it starts
+    so they can be killed: `ProcessPoolExecutor` can't cancel a running task, nor exit while a worker hangs in one. \\
+    Workers are spawned, forking the editor would copy its threads' locks in whatever state they are.
+    """
+    def __init__(self) -> None:
+        self.context = multiprocessing.get_context("spawn")
+
+        self.processes = []
+        self.lock = threading.Lock()
+
+    def __getattr__(self, name: str):
+        return getattr(self.context, name)
+
+    def Process(self, *arguments, **keyword_arguments):
+        process = self.context.Process(*arguments, **keyword_arguments)
+
+        # Recycled workers exit on their own, only the live ones are kept.
+        with self.lock:
+            self.processes = [process for process in self.processes if process.is_alive()]
+            self.processes.append(process)
+
+        return process
+
+    def kill_processes(self) -> None:
+        with self.lock:
+            processes, self.processes = self.processes, []
+
+        for process in processes:
+            if process.is_alive():
+                process.kill()
+
+
+class IntrospectionPool(QObject):
+    """
+    Hands introspection to a pool of worker processes and keeps the results
+    in an LRU cache keyed by module name and version, shared by every window. \\
+    A module that hangs while imported, waiting on `input()` or the network, is given up on after a deadline,
+    and the workers are replaced so later lookups aren't stuck behind it. \\
+    Inherits `PyQt5.QtCore.QObject`.
+    """
+
+    members_ready = pyqtSignal(str)
+
+    # Emitted from the pool's thread, the connection brings results back to this one.
+    introspection_finished = pyqtSignal(object, object)
+
+    def __init__(self) -> None:
+        super(IntrospectionPool, self).__init__()
+
+        self.CACHE_SIZE: int = INTROSPECTION_CACHE_SIZE
+        self.TIMEOUT_MILLISECONDS: int = INTROSPECTION_TIMEOUT_MILLISECONDS
+
+        self.executor = self.create_executor()
+
+        self.cache = OrderedDict()
+
+        # Key to the future introspecting it, results of any other future are stale.
+        self.pending_futures = {}
+
+        # Top-level module name to version stamp, valid while the module index doesn't change.
+        self.module_index = get_module_index()
+        self.module_versions = {}
+        self.module_versions_fingerprint = self.module_index.fingerprint
+
+        self.instrumentation = get_instrumentation()
+
+        self.introspection_finished.connect(self.store_members)
+
+    def console_debug(self, message, *arguments):
+        logger.debug(message, *arguments)
+
+    def create_executor(self) -> ProcessPoolExecutor:
+        self.worker_context = WorkerProcessContext()
+
+        executor_options = {"max_workers": INTROSPECTION_WORKER_COUNT, "mp_context": self.worker_context}
+
+        # Workers are recycled so modules imported for old lookups don't pile up in them.
+        if sys.version_info >= (3, 11):
+            executor_options["max_tasks_per_child"] = INTROSPECTION_TASKS_PER_WORKER
+
+        return ProcessPoolExecutor(**executor_options)
+
+    def get_module_version(self, module_name: str) -> str:
+        """
+        Returns a version stamp for `module_name` without importing it:
+        the modification time of its top-level package,
+        or the interpreter version for built-in modules. \\
+        Stamps are looked up once per package, and again once a refresh of the module index finds `sys.path` changed.
+        """
+
+        if self.module_index.fingerprint != self.module_versions_fingerprint:
+            self.module_versions.clear()
+            self.module_versions_fingerprint = self.module_index.fingerprint
+
+        package_name = module_name.split(".")[0]
+
+        if package_name not in self.module_versions:
+            self.module_versions[package_name] = self.find_module_version(package_name)
+
+        return self.module_versions[package_name]
+
+    def find_module_version(self, package_name: str) -> str:
+        try:
+            specification = importlib.util.find_spec(package_name)
+        except (ImportError, ValueError):
+            specification = None
+
+        if specification is None or not specification.has_location:
+            return sys.version
+
+        try:
+            return str(os.stat(specification.origin).st_mtime_ns)
+        except OSError:
+            return sys.version
+
+    def get_members(self, module_name: str):
+        """
+        Returns the cached members of `module_name`, or `None` while they are introspected
+        (`members_ready` is emitted once they are).
+        """
+
+        key = (module_name, self.get_module_version(module_name))
+
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.instrumentation.count("introspection.cache_hits")
+
+            return self.cache[key]
+
+        self.instrumentation.count("introspection.cache_misses")
+
+        if key not in self.pending_futures:
+            future = self.pending_futures[key] = self.executor.submit(introspect_module, module_name)
+            future.add_done_callback(lambda future: self.introspection_finished.emit(key, future))
+
+            QTimer.singleShot(self.TIMEOUT_MILLISECONDS, lambda: self.expire(key, future))
+
+        return None
+
+    def get_signature(self, module_name: str, member_name: str):
+        members = self.get_members(module_name)
+
+        if not members or member_name not in members:
+            return None
+
+        return members[member_name][1]
+
+    @pyqtSlot(object, object)
+    def store_members(self, key, future):
+        if self.pending_futures.get(key) is not future:
+            return
+
+        del self.pending_futures[key]
+
+        try:
+            members = future.result()
+        except Exception as error:
+            # Modules that can't be imported are remembered as empty, so they aren't retried.
+            self.console_debug("COULD NOT INTROSPECT %s: %r", key[0], error)
+            self.instrumentation.count("introspection.failures")
+
+            members = {}
+
+        self.cache_members(key, members)
+
+        self.members_ready.emit(key[0])
+
+    def expire(self, key, future) -> None:
+        """
+        Gives up on `key` if `future` is still introspecting it, remembering it as empty like a failed import,
+        and replaces the workers, one of which is stuck in it. \\
+        The other pending lookups are dropped with them and sent again when next asked for.
+        """
+
+        if self.pending_futures.get(key) is not future or future.done():
+            return
+
+        # Still queued behind other lookups, the deadline counts from when a worker takes it.
+        if not future.running():
+            QTimer.singleShot(self.TIMEOUT_MILLISECONDS, lambda: self.expire(key, future))
+
+            return
+
+        logger.warning("INTROSPECTION OF %s TIMED OUT, RESTARTING THE WORKERS", key[0])
+        self.instrumentation.count("introspection.timeouts")
+
+        self.kill_executor()
+
+        self.executor = self.create_executor()
+        self.pending_futures.clear()
+
+        self.cache_members(key, {})
+
+        self.members_ready.emit(key[0])
+
+    def kill_executor(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+        self.worker_context.kill_processes()
+
+    def cache_members(self, key, members: dict) -> None:
+        self.cache[key] = members
+        self.cache.move_to_end(key)
+
+        while len(self.cache) > self.CACHE_SIZE:
+            self.cache.popitem(last=False)
+
+    @pyqtSlot()
+    def shut_down(self):
+        self.kill_executor()
+
+
+def get_introspection_pool() -> IntrospectionPool:
+    """Returns the introspection pool shared by every window."""
+
+    global _introspection_pool
+
+    if _introspection_pool is None:
+        _introspection_pool = IntrospectionPool()
+
+        QCoreApplication.instance().aboutToQuit.connect(_introspection_pool.shut_down)
+
+    return _introspection_pool
@@ -0,0 +1,49 @@
+"""
+The introspection done inside worker processes, kept free of `PyQt5`
+so spawning a worker doesn't load Qt.
+"""
+
+import importlib
+import inspect
+
+MODULE_MEMBER = "module"
+FUNCTION_MEMBER = "function"
+VALUE_MEMBER = "value"
+
+
+def introspect_module(module_name: str) -> dict:
+    """
+    Runs in a worker process: imports `module_name` and returns
+    `{member name: (kind, signature or None)}` for its public members.
+    """
+
+    module = importlib.import_module(module_name)
+
+    members = {}
+
+    for name in dir(module):
+        if name.startswith("__"):
+            continue
+
+        try:
+            member = getattr(module, name)
+        except Exception:
+            continue
+
+        signature = None
+
+        if inspect.ismodule(member):
+            kind = MODULE_MEMBER
+        elif callable(member):
+            kind = FUNCTION_MEMBER
+
+            try:
+                signature = str(inspect.signature(member))
+            except (TypeError, ValueError):
+                pass
+        else:
+            kind = VALUE_MEMBER
+
+        members[name] = (kind, signature)
+
+    return members
@@ -0,0 +1,161 @@
+"""
+The index of the symbols defined in an open buffer, kept free of `PyQt5`.
+Updated line by line from edited regions and queried through a prefix trie.
+"""
+
+import re
+
+FUNCTION_SYMBOL_IMAGE = 1
+MODULE_SYMBOL_IMAGE = 2
+
+
+class PrefixTrie:
+    """
+    A case-insensitive prefix trie of words. \\
+    Every spelling of a word is counted, so a word stays until its last definition is removed.
+    """
+    def __init__(self) -> None:
+        # A node is `[children by lowercase character, {spelling: count}]`.
+        self.root = [{}, {}]
+
+    def insert(self, word: str) -> None:
+        node = self.root
+
+        for character in word.lower():
+            node = node[0].setdefault(character, [{}, {}])
+
+        node[1][word] = node[1].get(word, 0) + 1
+
+    def remove(self, word: str) -> bool:
+        """Uncounts one definition of `word`, returns `True` if it was the last one."""
+
+        path = [self.root]
+
+        for character in word.lower():
+            node = path[-1][0].get(character)
+
+            if node is None:
+                return False
+
+            path.append(node)
+
+        spellings = path[-1][1]
+
+        if spellings.get(word, 0) > 1:
+            spellings[word] -= 1
+
+            return False
+
+        if spellings.pop(word, None) is None:
+            return False
+
+        # Prunes the nodes that no longer lead to any word.
+        for character, parent, node in zip(reversed(word.lower()), reversed(path[:-1]), reversed(path[1:])):
+            if node[0] or node[1]:
+                break
+
+            del parent[0][character]
+
+        return True
+
+    def get_words_with_prefix(self, prefix: str, limit: int) -> list:
+        node = self.root
+
+        for character in prefix.lower():
+            node = node[0].get(character)
+
+            if node is None:
+                return []
+
+        words = []
+        nodes_to_visit = [node]
+
+        while nodes_to_visit and len(words) < limit:
+            node = nodes_to_visit.pop()
+
+            words.extend(node[1])
+            nodes_to_visit.extend(node[0].values())
+
+        return words[:limit]
+
+
+class BufferSymbolIndex:
+    """
+    Indexes the functions, classes, imports and assignments of a buffer per line,
+    so an edit only re-reads the lines it touched.
+    """
+    def __init__(self) -> None:
+        self.DEFINITION_PATTERN = re.compile(r"^\s*(?:async\s+)?(?:def|class)\s+(\w+)")
+        self.IMPORT_PATTERN = re.compile(r"^\s*import\s+([\w\s.,]+)")
+        self.FROM_IMPORT_PATTERN = re.compile(r"^\s*from\s+[\w.]+\s+import\s+\(?([\w\s,]+)")
+        self.ASSIGNMENT_PATTERN = re.compile(r"^\s*([A-Za-z_][\w\s,]*?)\s*(?::[^=]*)?=(?!=)")
+
+        self.MAXIMUM_COMPLETIONS = 200
+
+        self.trie = PrefixTrie()
+        self.image_of_symbol = {}
+
+        # A Scintilla document always has at least one line.
+        self.symbols_of_line = [()]
+
+    def get_symbols_of_line(self, text: str) -> tuple:
+        """Returns the `(name, image)` symbols a line defines."""
+
+        definition = self.DEFINITION_PATTERN.match(text)
+
+        if definition:
+            return ((definition.group(1), FUNCTION_SYMBOL_IMAGE),)
+
+        imports = self.IMPORT_PATTERN.match(text) or self.FROM_IMPORT_PATTERN.match(text)
+
+        if imports:
+            symbols = []
+
+            for imported_name in imports.group(1).split(","):
+                parts = imported_name.split()
+
+                if parts:
+                    # `import a.b` binds `a`, `import a.b as c` binds `c`.
+                    symbols.append((parts[-1] if len(parts) == 3 else parts[0].split(".")[0], MODULE_SYMBOL_IMAGE))
+
+            return tuple(symbols)
+
+        assignment = self.ASSIGNMENT_PATTERN.match(text)
+
+        if assignment:
+            return tuple(
+                (name.strip(), None) for name in assignment.group(1).split(",") \
+                if name.strip().isidentifier()
+            )
+
+        return ()
+
+    def replace_lines(self, first_line: int, number_of_old_lines: int, new_lines) -> None:
+        """Replaces the lines `[first_line, first_line + number_of_old_lines)` with the texts `new_lines`."""
+
+        new_symbols = [self.get_symbols_of_line(text) for text in new_lines]
+
+        for symbols in self.symbols_of_line[first_line:first_line + number_of_old_lines]:
+            for name, _ in symbols:
+                # Images of symbols no line defines anymore would otherwise pile up.
+                if self.trie.remove(name):
+                    del self.image_of_symbol[name]
+
+        for symbols in new_symbols:
+            for name, image in symbols:
+                self.trie.insert(name)
+                self.image_of_symbol[name] = image
+
+        self.symbols_of_line[first_line:first_line + number_of_old_lines] = new_symbols
+
+    def get_completions(self, prefix: str) -> list:
+        """Returns the symbols starting with `prefix`, with `?image` suffixes for autocompletion."""
+
+        completions = []
+
+        for name in self.trie.get_words_with_prefix(prefix, self.MAXIMUM_COMPLETIONS):
+            image = self.image_of_symbol.get(name)
+
+            completions.append(name if image is None else f"{name}?{image}")
+
+        return completions
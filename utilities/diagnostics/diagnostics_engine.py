@@ -0,0 +1,446 @@
+"""
+Syntax and lint diagnostics of a `PyQt5.Qsci.QsciScintilla` document, checked in the background
+and shown as squiggles, with their message on hover.
+"""
+
+from PyQt5.QtCore import QObject, QThread, QTimer, QCoreApplication, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QColor
+from PyQt5.Qsci import QsciScintilla
+
+from utilities.settings.essential_settings import (
+    DIAGNOSTICS_DEBOUNCE_MILLISECONDS, DIAGNOSTICS_WORKER_COUNT, DIAGNOSTICS_BATCH_BYTES,
+    DIAGNOSTICS_MAXIMUM_MERGED_BLOCKS, DIAGNOSTICS_MAXIMUM_REPORTED, DIAGNOSTICS_TIMEOUT_MILLISECONDS
+)
+
+from utilities.diagnostics.python_checks import (
+    ERROR, BlockAnalysis, split_blocks, get_block_hash, analyse_blocks, combine_analyses
+)
+
+from utilities.completion.introspection import WorkerProcessContext
+from utilities.scintilla_buffer import get_document_view
+from utilities.instrumentation import get_instrumentation
+
+from concurrent.futures import (
+    ProcessPoolExecutor, BrokenExecutor, CancelledError, TimeoutError as FutureTimeoutError
+)
+
+import logging
+
+import time
+import threading
+
+logger = logging.getLogger("pysee.diagnostics")
+
+# A block given up on. Like a star import, the names it might bind are never reported as undefined elsewhere.
+UNCHECKED_ANALYSIS = BlockAnalysis([], frozenset(), {}, [], True, False)
+
+_diagnostics_pool = None
+
+
+class DiagnosticsPool:
+    """
+    The worker processes that analyse blocks for every window. \\
+    Checks run on the windows' worker threads, so the executor is only submitted to or replaced under a lock.
+    """
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+
+        self.executor = self.create_executor()
+
+    def create_executor(self) -> ProcessPoolExecutor:
+        self.worker_context = WorkerProcessContext()
+
+        return ProcessPoolExecutor(max_workers=DIAGNOSTICS_WORKER_COUNT, mp_context=self.worker_context)
+
+    def submit_batches(self, batches: list):
+        """Returns the executor the `analyse_blocks` of each of `batches` is submitted to, and their futures."""
+
+        with self.lock:
+            try:
+                return self.executor, [self.executor.submit(analyse_blocks, batch) for batch in batches]
+            except BrokenExecutor:
+                self.replace_executor()
+
+                return self.executor, [self.executor.submit(analyse_blocks, batch) for batch in batches]
+
+    def expire(self, executor: ProcessPoolExecutor) -> None:
+        """
+        Replaces `executor`, one of whose workers hangs or died, unless another thread already has. \\
+        Its other batches are cancelled, the checks waiting on them send them again to the new workers.
+        """
+
+        with self.lock:
+            if executor is self.executor:
+                self.replace_executor()
+
+    def replace_executor(self) -> None:
+        self.kill_executor()
+
+        self.executor = self.create_executor()
+
+    def kill_executor(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+        self.worker_context.kill_processes()
+
+    def shut_down(self) -> None:
+        with self.lock:
+            self.kill_executor()
+
+
+def get_diagnostics_pool() -> DiagnosticsPool:
+    """Returns the worker processes that analyse blocks for every window."""
+
+    global _diagnostics_pool
+
+    if _diagnostics_pool is None:
+        _diagnostics_pool = DiagnosticsPool()
+
+        QCoreApplication.instance().aboutToQuit.connect(_diagnostics_pool.shut_down)
+
+    return _diagnostics_pool
+
+
+class DiagnosticsWorker(QObject):
+    """
+    Splits snapshots of a document into blocks on its own `PyQt5.QtCore.QThread`,
+    sends the blocks it hasn't analysed yet to the worker processes, and combines the results. \\
+    A check is abandoned, and its queued batches cancelled, as soon as a newer revision is written. \\
+    A batch still analysed after `DIAGNOSTICS_TIMEOUT_MILLISECONDS` is given up on and its blocks left unchecked,
+    the workers are replaced and the batches after it sent to the new ones. \\
+    Inherits `PyQt5.QtCore.QObject`.
+    """
+
+    diagnostics_ready = pyqtSignal(int, object)
+
+    def __init__(self, pool: DiagnosticsPool) -> None:
+        super(DiagnosticsWorker, self).__init__()
+
+        self.pool = pool
+
+        self.BATCH_BYTES: int = DIAGNOSTICS_BATCH_BYTES
+        self.MAXIMUM_MERGED_BLOCKS: int = DIAGNOSTICS_MAXIMUM_MERGED_BLOCKS
+        self.MAXIMUM_REPORTED: int = DIAGNOSTICS_MAXIMUM_REPORTED
+        self.TIMEOUT_MILLISECONDS: int = DIAGNOSTICS_TIMEOUT_MILLISECONDS
+
+        # How often a wait on the worker processes looks for a newer revision.
+        self.CANCELLATION_POLL_SECONDS: float = 0.05
+
+        # Written by the GUI thread, so checks of older revisions can be abandoned.
+        self.latest_revision = 0
+
+        # Block hash to `BlockAnalysis`, pruned to the blocks of the last finished check.
+        self.analyses = {}
+        self.used_hashes = set()
+
+        self.instrumentation = get_instrumentation()
+
+    def console_debug(self, message, *arguments):
+        logger.debug(message, *arguments)
+
+    @pyqtSlot(int, object)
+    def check_snapshot(self, revision, snapshot):
+        if revision != self.latest_revision:
+            self.instrumentation.count("diagnostics.skipped_snapshots")
+
+            return
+
+        self.used_hashes = set()
+
+        with self.instrumentation.span("diagnostics.check", bytes=len(snapshot)):
+            blocks = split_blocks(snapshot)
+            analyses = self.get_analyses(revision, [source for _, source in blocks])
+
+            if analyses is not None:
+                analyses = self.merge_incomplete_blocks(revision, blocks, analyses)
+
+            if analyses is None:
+                self.instrumentation.count("diagnostics.cancelled_checks")
+
+                return
+
+            self.analyses = {block_hash: self.analyses[block_hash] for block_hash in self.used_hashes}
+
+            diagnostics = combine_analyses(analyses, self.MAXIMUM_REPORTED)
+
+        self.console_debug("%d DIAGNOSTICS IN %d BLOCKS", len(diagnostics), len(blocks))
+
+        self.diagnostics_ready.emit(revision, diagnostics)
+
+    def get_analyses(self, revision: int, sources: list):
+        """
+        Returns the `BlockAnalysis` of each of `sources`, analysing in batches only those not cached,
+        or `None` once `revision` is superseded.
+        """
+
+        hashes = [get_block_hash(source) for source in sources]
+        self.used_hashes.update(hashes)
+
+        missing = {
+            block_hash: source for block_hash, source in zip(hashes, sources) if block_hash not in self.analyses
+        }
+
+        self.instrumentation.count("diagnostics.cached_blocks", len(sources) - len(missing))
+        self.instrumentation.count("diagnostics.analysed_blocks", len(missing))
+
+        batches = [[]]
+        batch_bytes = 0
+
+        for block_hash, source in missing.items():
+            if batch_bytes >= self.BATCH_BYTES:
+                batches.append([])
+                batch_bytes = 0
+
+            batches[-1].append((block_hash, source))
+            batch_bytes += len(source)
+
+        batches = [batch for batch in batches if batch]
+
+        while batches:
+            executor, futures = self.pool.submit_batches([[source for _, source in batch] for batch in batches])
+
+            try:
+                for future in futures:
+                    results = self.wait_for_result(revision, future, futures)
+
+                    if results is None:
+                        return None
+
+                    self.analyses.update(zip((block_hash for block_hash, _ in batches.pop(0)), results))
+            except (FutureTimeoutError, BrokenExecutor, CancelledError) as error:
+                # Replaced for another check, the batches left are sent again to the new workers.
+                if executor is not self.pool.executor:
+                    continue
+
+                # Shut down as the editor quits.
+                if isinstance(error, CancelledError):
+                    return None
+
+                logger.warning("DIAGNOSTICS OF A BATCH FAILED, RESTARTING THE WORKERS: %r", error)
+                self.instrumentation.count("diagnostics.failed_batches")
+
+                self.pool.expire(executor)
+
+                # Left unchecked rather than sent again, a block that hangs or crashes a worker would do it again.
+                self.analyses.update((block_hash, UNCHECKED_ANALYSIS) for block_hash, _ in batches.pop(0))
+
+        return [self.analyses[block_hash] for block_hash in hashes]
+
+    def wait_for_result(self, revision: int, future, futures: list):
+        """
+        Returns the result of `future`, or `None` once `revision` is superseded. \\
+        Raises `TimeoutError` once a worker has been on it for `TIMEOUT_MILLISECONDS`,
+        the deadline counts from when a worker takes it, not from when it was queued. \\
+        A worker that died, or workers replaced for another check, raise their own error.
+        """
+
+        start_time = None
+
+        while True:
+            try:
+                return future.result(timeout=self.CANCELLATION_POLL_SECONDS)
+            except FutureTimeoutError:
+                if start_time is None and future.running():
+                    start_time = time.monotonic()
+
+                if start_time is not None and time.monotonic() - start_time >= self.TIMEOUT_MILLISECONDS / 1000:
+                    for pending_future in futures:
+                        pending_future.cancel()
+
+                    raise
+
+                if revision == self.latest_revision:
+                    continue
+            except (BrokenExecutor, CancelledError):
+                raise
+            except Exception as error:
+                logger.warning("DIAGNOSTICS NOT CHECKED: %r", error)
+
+            for pending_future in futures:
+                pending_future.cancel()
+
+            return None
+
+    def merge_incomplete_blocks(self, revision: int, blocks: list, analyses: list):
+        """
+        Merges every block cut short, like by a bracket closed in a later block, with the blocks after it
+        until it parses or `MAXIMUM_MERGED_BLOCKS` are merged. \\
+        Returns `(first line, BlockAnalysis)` of the merged blocks, or `None` once `revision` is superseded.
+        """
+
+        merged = []
+        index = 0
+
+        while index < len(blocks):
+            first_line, source = blocks[index]
+            analysis = analyses[index]
+
+            last_index = min(index + self.MAXIMUM_MERGED_BLOCKS, len(blocks) - 1)
+
+            while analysis.is_incomplete and index < last_index:
+                index += 1
+                source += blocks[index][1]
+
+                merged_analyses = self.get_analyses(revision, [source])
+
+                if merged_analyses is None:
+                    return None
+
+                analysis = merged_analyses[0]
+
+            merged.append((first_line, analysis))
+            index += 1
+
+        return merged
+
+
+class DiagnosticsEngine(QObject):
+    """
+    Checks the document of a `PyQt5.Qsci.QsciScintilla` once edits pause for `DIAGNOSTICS_DEBOUNCE_MILLISECONDS`,
+    through a `DiagnosticsWorker`, so typing never waits on a check. \\
+    Errors are underlined with red squiggles, warnings with amber ones. \\
+    Inherits `PyQt5.QtCore.QObject`.
+    """
+
+    snapshot_ready = pyqtSignal(int, object)
+
+    def __init__(self, editor: QsciScintilla) -> None:
+        super(DiagnosticsEngine, self).__init__(editor)
+
+        self.editor = editor
+
+        self.ERROR_INDICATOR = self.editor.indicatorDefine(QsciScintilla.SquiggleIndicator)
+        self.WARNING_INDICATOR = self.editor.indicatorDefine(QsciScintilla.SquiggleIndicator)
+
+        self.editor.setIndicatorForegroundColor(QColor("#FF0000"), self.ERROR_INDICATOR)
+        self.editor.setIndicatorForegroundColor(QColor("#FFBF00"), self.WARNING_INDICATOR)
+
+        # The value of an indicator is the index of its message, plus one.
+        self.messages = []
+        self.is_showing_message = False
+
+        self.revision = 0
+
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(DIAGNOSTICS_DEBOUNCE_MILLISECONDS)
+        self.debounce_timer.timeout.connect(self.check_document)
+
+        self.worker_thread = QThread(self)
+
+        self.worker = DiagnosticsWorker(get_diagnostics_pool())
+        self.worker.moveToThread(self.worker_thread)
+
+        self.snapshot_ready.connect(self.worker.check_snapshot)
+        self.worker.diagnostics_ready.connect(self.show_diagnostics)
+
+        self.worker_thread.start()
+
+        QCoreApplication.instance().aboutToQuit.connect(self.stop_worker)
+
+        self.instrumentation = get_instrumentation()
+
+        self.editor.textChanged.connect(self.schedule_check)
+
+        self.editor.SendScintilla(QsciScintilla.SCI_SETMOUSEDWELLTIME, 500)
+        self.editor.SCN_DWELLSTART.connect(self.show_message_at)
+        self.editor.SCN_DWELLEND.connect(self.hide_message)
+
+    def console_debug(self, message, *arguments):
+        logger.debug(message, *arguments)
+
+    @pyqtSlot()
+    def schedule_check(self):
+        """Supersedes any check in progress and restarts the wait for edits to pause."""
+
+        self.revision += 1
+        self.worker.latest_revision = self.revision
+
+        self.debounce_timer.start()
+
+    @pyqtSlot()
+    def check_document(self):
+        self.snapshot_ready.emit(self.revision, bytes(get_document_view(self.editor)))
+
+    def reset(self):
+        """Clears the diagnostics of the shown document, for one shown in its place, and checks it anew."""
+
+        self.clear_indicators()
+        self.messages = []
+
+        self.schedule_check()
+
+    def clear_indicators(self):
+        length = self.editor.length()
+
+        for indicator in (self.ERROR_INDICATOR, self.WARNING_INDICATOR):
+            self.editor.SendScintilla(QsciScintilla.SCI_SETINDICATORCURRENT, indicator)
+            self.editor.SendScintilla(QsciScintilla.SCI_INDICATORCLEARRANGE, 0, length)
+
+    @pyqtSlot(int, object)
+    def show_diagnostics(self, revision, diagnostics):
+        """Underlines the diagnostics of the worker, unless the document changed since the snapshot."""
+
+        if revision != self.revision:
+            self.instrumentation.count("diagnostics.stale_results")
+
+            return
+
+        with self.instrumentation.span("diagnostics.show", diagnostics=len(diagnostics)):
+            self.clear_indicators()
+            self.messages = []
+
+            line_count = self.editor.lines()
+
+            for diagnostic in diagnostics:
+                if diagnostic.line >= line_count:
+                    continue
+
+                start = self.get_position(diagnostic.line, diagnostic.column)
+                end = self.get_position(min(diagnostic.end_line, line_count - 1), diagnostic.end_column)
+
+                self.messages.append(diagnostic.message)
+
+                self.editor.SendScintilla(
+                    QsciScintilla.SCI_SETINDICATORCURRENT,
+                    self.ERROR_INDICATOR if diagnostic.severity == ERROR else self.WARNING_INDICATOR
+                )
+                self.editor.SendScintilla(QsciScintilla.SCI_SETINDICATORVALUE, len(self.messages))
+                self.editor.SendScintilla(QsciScintilla.SCI_INDICATORFILLRANGE, start, max(end - start, 1))
+
+    def get_position(self, line: int, column: int) -> int:
+        """Returns the position `column` bytes into `line`, at most its end."""
+
+        return min(
+            self.editor.SendScintilla(QsciScintilla.SCI_POSITIONFROMLINE, line) + column,
+            self.editor.SendScintilla(QsciScintilla.SCI_GETLINEENDPOSITION, line)
+        )
+
+    @pyqtSlot(int, int, int)
+    def show_message_at(self, position, *_):
+        if position < 0:
+            return
+
+        for indicator in (self.ERROR_INDICATOR, self.WARNING_INDICATOR):
+            value = self.editor.SendScintilla(QsciScintilla.SCI_INDICATORVALUEAT, indicator, position)
+
+            if 0 < value <= len(self.messages):
+                self.editor.SendScintilla(
+                    QsciScintilla.SCI_CALLTIPSHOW, position, self.messages[value - 1].encode("utf-8")
+                )
+                self.is_showing_message = True
+
+                return
+
+    @pyqtSlot(int, int, int)
+    def hide_message(self, *_):
+        if self.is_showing_message:
+            self.editor.SendScintilla(QsciScintilla.SCI_CALLTIPCANCEL)
+            self.is_showing_message = False
+
+    @pyqtSlot()
+    def stop_worker(self):
+        self.worker.latest_revision = -1
+
+        self.worker_thread.quit()
+        self.worker_thread.wait()
@@ -0,0 +1,315 @@
+"""
+The syntax and lint checks behind diagnostics, kept free of `PyQt5` so spawning a worker doesn't load Qt. \\
+A document is split into top-level blocks that are checked on their own, so an edit only invalidates
+the analysis of the block it touches; the checks that need the whole module, undefined names and
+unused imports, are then made from the names each block binds and loads.
+"""
+
+from collections import namedtuple
+
+import ast
+import re
+import hashlib
+import builtins
+
+ERROR = 1
+WARNING = 2
+
+# Lines and columns are counted from 0, columns in UTF-8 bytes like Scintilla positions.
+Diagnostic = namedtuple("Diagnostic", ("line", "column", "end_line", "end_column", "severity", "message"))
+
+# Positions are relative to the block, names loaded map to the first place they are loaded at.
+BlockAnalysis = namedtuple(
+    "BlockAnalysis", ("diagnostics", "bound_names", "loaded_names", "imports", "has_star_import", "is_incomplete")
+)
+
+# A triple quote, whose string is skipped, or the start of a line that starts a statement at column 0.
+BLOCK_BOUNDARY_PATTERN = re.compile(rb"\"\"\"|'''|^(?=[^\s#)\]}])", re.MULTILINE)
+
+# The clauses that carry on the statement before them.
+CLAUSE_PATTERN = re.compile(rb"(?:else|elif|except|finally)\b")
+
+# Errors of a block that is only cut short, like a bracket or string closed in a later block.
+INCOMPLETE_MESSAGES = ("was never closed", "unterminated triple-quoted string", "unexpected EOF")
+
+MODULE_NAMES = frozenset(dir(builtins)) | {
+    "__file__", "__builtins__", "__path__", "__cached__", "__annotations__", "__class__", "__module__", "__qualname__"
+}
+
+
+def split_blocks(source: bytes) -> list:
+    """
+    Returns `(first line, source of the block)` for every top-level statement of `source`,
+    with its decorators, its `else`-like clauses and the comments and blank lines after it.
+    """
+
+    starts = [0]
+    position = 0
+    follows_decorator = False
+
+    while True:
+        match = BLOCK_BOUNDARY_PATTERN.search(source, position)
+
+        if match is None:
+            break
+
+        quote = match.group()
+
+        if quote:
+            end = source.find(quote, match.end())
+
+            if end < 0:
+                break
+
+            position = end + 3
+
+            continue
+
+        start = match.start()
+        position = start + 1
+
+        is_continuation = follows_decorator or CLAUSE_PATTERN.match(source, start) is not None
+
+        if start > 1 and source[start - 2:start].rstrip(b"\r\n").endswith(b"\\"):
+            is_continuation = True
+
+        follows_decorator = source.startswith(b"@", start)
+
+        if not is_continuation and start:
+            starts.append(start)
+
+    blocks = []
+    line = 0
+
+    for start, end in zip(starts, starts[1:] + [len(source)]):
+        if start == end:
+            continue
+
+        blocks.append((line, source[start:end]))
+
+        line += source.count(b"\n", start, end)
+
+    return blocks
+
+
+def get_block_hash(source: bytes) -> bytes:
+    return hashlib.blake2b(source, digest_size=16).digest()
+
+
+def analyse_blocks(sources: list) -> list:
+    """Runs in a worker process: returns the `BlockAnalysis` of each of `sources`."""
+
+    return [analyse_block(source) for source in sources]
+
+
+def analyse_block(source: bytes) -> BlockAnalysis:
+    try:
+        tree = ast.parse(source)
+
+        # Some errors, like `return` outside a function, are only found by the compiler.
+        compile(tree, "<block>", "exec", dont_inherit=True)
+    except SyntaxError as error:
+        return get_syntax_error_analysis(source, error)
+    except ValueError as error:
+        return BlockAnalysis([Diagnostic(0, 0, 0, 0, ERROR, str(error))], frozenset(), {}, [], False, False)
+
+    return NameCollector().collect(tree)
+
+
+def get_syntax_error_analysis(source: bytes, error: SyntaxError) -> BlockAnalysis:
+    lines = source.splitlines()
+
+    line = max((error.lineno or 1) - 1, 0)
+    is_incomplete = line >= len(lines) or any(message in error.msg for message in INCOMPLETE_MESSAGES)
+
+    if line >= len(lines):
+        line = max(len(lines) - 1, 0)
+
+    text = lines[line].decode("utf-8", "replace") if lines else ""
+
+    # The offsets of a `SyntaxError` count characters from 1.
+    column = len(text[:max((error.offset or 1) - 1, 0)].encode("utf-8"))
+    end_column = column + 1
+
+    if error.end_lineno == error.lineno and error.end_offset and error.end_offset > (error.offset or 1):
+        end_column = len(text[:error.end_offset - 1].encode("utf-8"))
+
+    diagnostic = Diagnostic(line, column, line, end_column, ERROR, error.msg)
+
+    return BlockAnalysis([diagnostic], frozenset(), {}, [], False, is_incomplete)
+
+
+class NameCollector(ast.NodeVisitor):
+    """
+    Collects every name a block binds or loads, in any scope. \\
+    Treating all scopes as one misses some mistakes but never reports a name that is defined.
+    """
+    def __init__(self) -> None:
+        self.bound_names = set()
+        self.loaded_names = {}
+        self.imports = []
+        self.has_star_import = False
+
+    def collect(self, tree: ast.Module) -> BlockAnalysis:
+        for statement in tree.body:
+            if isinstance(statement, (ast.Import, ast.ImportFrom)):
+                self.collect_imports(statement)
+
+        self.visit(tree)
+
+        return BlockAnalysis(
+            [], frozenset(self.bound_names), self.loaded_names, self.imports, self.has_star_import, False
+        )
+
+    def collect_imports(self, statement) -> None:
+        """Remembers the module-level imports, the only ones reported when unused."""
+
+        if isinstance(statement, ast.ImportFrom) and statement.module == "__future__":
+            return
+
+        for alias in statement.names:
+            if alias.name == "*":
+                continue
+
+            name = alias.asname or alias.name.split(".")[0]
+
+            # `import module as module` re-exports on purpose.
+            if alias.asname is not None and alias.asname == alias.name:
+                continue
+
+            self.imports.append(
+                (name, statement.lineno - 1, statement.col_offset, statement.end_lineno - 1, statement.end_col_offset)
+            )
+
+    def load(self, name: str, node) -> None:
+        if name not in self.loaded_names:
+            self.loaded_names[name] = (node.lineno - 1, node.col_offset, node.end_lineno - 1, node.end_col_offset)
+
+    def load_annotation(self, annotation) -> None:
+        """Loads the names of an annotation written as a string."""
+
+        if not isinstance(annotation, ast.Constant) or not isinstance(annotation.value, str):
+            return
+
+        try:
+            expression = ast.parse(annotation.value, mode="eval")
+        except SyntaxError:
+            return
+
+        for node in ast.walk(expression):
+            if isinstance(node, ast.Name):
+                self.load(node.id, annotation)
+
+    def visit_Name(self, node):
+        if isinstance(node.ctx, ast.Load):
+            self.load(node.id, node)
+        else:
+            self.bound_names.add(node.id)
+
+    def visit_arg(self, node):
+        self.bound_names.add(node.arg)
+        self.load_annotation(node.annotation)
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        self.bound_names.add(node.name)
+        self.load_annotation(node.returns)
+        self.generic_visit(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node):
+        self.bound_names.add(node.name)
+        self.generic_visit(node)
+
+    def visit_AnnAssign(self, node):
+        self.load_annotation(node.annotation)
+        self.generic_visit(node)
+
+    def visit_Assign(self, node):
+        # Names listed in `__all__` count as used.
+        if any(isinstance(target, ast.Name) and target.id == "__all__" for target in node.targets):
+            if isinstance(node.value, (ast.List, ast.Tuple)):
+                for element in node.value.elts:
+                    if isinstance(element, ast.Constant) and isinstance(element.value, str):
+                        self.load(element.value, element)
+
+        self.generic_visit(node)
+
+    def visit_Import(self, node):
+        for alias in node.names:
+            self.bound_names.add(alias.asname or alias.name.split(".")[0])
+
+    def visit_ImportFrom(self, node):
+        for alias in node.names:
+            if alias.name == "*":
+                self.has_star_import = True
+            else:
+                self.bound_names.add(alias.asname or alias.name)
+
+    def visit_ExceptHandler(self, node):
+        if node.name:
+            self.bound_names.add(node.name)
+
+        self.generic_visit(node)
+
+    def visit_Global(self, node):
+        self.bound_names.update(node.names)
+
+    visit_Nonlocal = visit_Global
+
+    def visit_MatchAs(self, node):
+        if node.name:
+            self.bound_names.add(node.name)
+
+        self.generic_visit(node)
+
+    def visit_MatchStar(self, node):
+        if node.name:
+            self.bound_names.add(node.name)
+
+    def visit_MatchMapping(self, node):
+        if node.rest:
+            self.bound_names.add(node.rest)
+
+        self.generic_visit(node)
+
+
+def combine_analyses(blocks: list, maximum_diagnostics: int) -> list:
+    """
+    Returns the diagnostics of the whole document, at most `maximum_diagnostics` of them,
+    from `(first line, BlockAnalysis)` of every block. \\
+    Like pyflakes, a document with syntax errors only gets those reported.
+    """
+
+    diagnostics = [
+        offset_diagnostic(diagnostic, first_line) for first_line, analysis in blocks for diagnostic in analysis.diagnostics
+    ]
+
+    if not diagnostics:
+        bound_names = MODULE_NAMES.union(*(analysis.bound_names for _, analysis in blocks))
+        loaded_names = set().union(*(analysis.loaded_names for _, analysis in blocks))
+
+        has_star_import = any(analysis.has_star_import for _, analysis in blocks)
+
+        for first_line, analysis in blocks:
+            if not has_star_import:
+                for name, position in analysis.loaded_names.items():
+                    if name not in bound_names:
+                        diagnostics.append(
+                            offset_diagnostic(Diagnostic(*position, WARNING, f"undefined name '{name}'"), first_line)
+                        )
+
+            for name, *position in analysis.imports:
+                if name not in loaded_names:
+                    diagnostics.append(
+                        offset_diagnostic(Diagnostic(*position, WARNING, f"'{name}' imported but unused"), first_line)
+                    )
+
+    diagnostics.sort()
+
+    return diagnostics[:maximum_diagnostics]
+
+
+def offset_diagnostic(diagnostic: Diagnostic, first_line: int) -> Diagnostic:
+    return diagnostic._replace(line=diagnostic.line + first_line, end_line=diagnostic.end_line + first_line)
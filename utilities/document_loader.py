@@ -0,0 +1,305 @@
+"""Streaming, chunked loading of files into a `PyQt5.Qsci.QsciScintilla`."""
+
+from PyQt5.QtWidgets import QProgressDialog
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal, pyqtSlot
+from PyQt5.Qsci import QsciScintilla
+
+from utilities.settings.essential_settings import (
+    DOCUMENT_LOADING_CHUNK_BYTES, DOCUMENT_LOADING_PROGRESS_DELAY_MILLISECONDS, DOCUMENT_LOADING_FALLBACK_ENCODING
+)
+
+from utilities.instrumentation import get_instrumentation
+
+import logging
+
+import os
+import io
+import re
+import time
+import codecs
+import tokenize
+
+logger = logging.getLogger("pysee.documents")
+
+# The PEP 263 coding cookie, as `tokenize` matches it.
+CODING_COOKIE_PATTERN = re.compile(rb"^[ \t\f]*#.*?coding[:=][ \t]*[-\w.]+")
+
+
+def detect_encoding(head: bytes) -> tuple:
+    """
+    Returns the encoding of a file from its first bytes, and whether the file declares it:
+    by its byte order mark or its PEP 263 coding cookie. \\
+    Files that declare neither are taken as UTF-8.
+    """
+
+    for byte_order_mark, encoding in (
+        (codecs.BOM_UTF32_LE, "utf-32"), (codecs.BOM_UTF32_BE, "utf-32"),
+        (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16")
+    ):
+        if head.startswith(byte_order_mark):
+            return encoding, True
+
+    try:
+        encoding, lines = tokenize.detect_encoding(io.BytesIO(head).readline)
+    except SyntaxError:
+        return "utf-8", False
+
+    is_declared = encoding == "utf-8-sig" or any(CODING_COOKIE_PATTERN.match(line) for line in lines)
+
+    return encoding, is_declared
+
+
+class DocumentLoader(QObject):
+    """
+    Reads a file in fixed-size chunks on idle ticks of the event loop,
+    decodes them incrementally and appends them to a hidden Scintilla buffer,
+    so only the buffer itself grows with the file. \\
+    The document keeps its text, undo history and saved file until the whole file is loaded,
+    then takes the buffer's text in one insertion; a load that is cancelled or fails leaves it as it was. \\
+    Shows a progress dialog that cancels the load. \\
+    Inherits `PyQt5.QtCore.QObject`.
+    """
+
+    finished = pyqtSignal(str, str)
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, editor: QsciScintilla, file_name: str) -> None:
+        super(DocumentLoader, self).__init__(editor)
+
+        self.editor = editor
+        self.file_name = file_name
+
+        self.CHUNK_BYTES: int = DOCUMENT_LOADING_CHUNK_BYTES
+        self.FALLBACK_ENCODING: str = DOCUMENT_LOADING_FALLBACK_ENCODING
+
+        self.file = None
+        self.file_size = 0
+        self.loaded_bytes = 0
+
+        self.encoding = None
+        self.is_encoding_declared = False
+        self.decoder = None
+
+        self.eol_mode = QsciScintilla.EolUnix
+
+        # Holds the text until the load is done, without a lexer or undo history.
+        self.buffer = None
+
+        self.instrumentation = get_instrumentation()
+        self.start_time = 0.0
+
+        self.chunk_timer = QTimer(self)
+        self.chunk_timer.setInterval(0)
+        self.chunk_timer.timeout.connect(self.load_next_chunk)
+
+        # Percentages, since the byte count of a large file overflows the dialog's `int` range.
+        self.progress_dialog = QProgressDialog(
+            f"Loading {os.path.basename(file_name)}...", "Cancel", 0, 100, editor.window()
+        )
+        self.progress_dialog.setWindowModality(Qt.WindowModal)
+        self.progress_dialog.setMinimumDuration(DOCUMENT_LOADING_PROGRESS_DELAY_MILLISECONDS)
+        self.progress_dialog.setAutoClose(False)
+        self.progress_dialog.setAutoReset(False)
+        self.progress_dialog.canceled.connect(self.cancel)
+
+    def console_debug(self, message, *arguments):
+        logger.debug(message, *arguments)
+
+    def start(self) -> None:
+        self.start_time = time.perf_counter()
+
+        try:
+            self.file = open(self.file_name, "rb")
+            self.file_size = os.fstat(self.file.fileno()).st_size
+
+            head = self.file.read(self.CHUNK_BYTES)
+            self.file.seek(0)
+        except OSError as error:
+            self.fail(error)
+
+            return
+
+        encoding, self.is_encoding_declared = detect_encoding(head)
+
+        # The byte order mark of UTF-8 files isn't part of the text.
+        if encoding == "utf-8-sig":
+            self.file.seek(len(codecs.BOM_UTF8))
+            self.loaded_bytes = len(codecs.BOM_UTF8)
+
+        self.set_encoding(encoding)
+
+        # Decoded, so the line endings of UTF-16 and UTF-32 files are found too.
+        if "\r\n" in head.decode(encoding, "replace"):
+            self.eol_mode = QsciScintilla.EolWindows
+
+        self.buffer = QsciScintilla()
+        self.buffer.setUtf8(True)
+        self.buffer.SendScintilla(QsciScintilla.SCI_SETUNDOCOLLECTION, False)
+        self.buffer.SendScintilla(QsciScintilla.SCI_ALLOCATE, self.file_size + 1)
+
+        # Keeps the user from typing into a document about to be replaced, before the progress dialog shows up.
+        self.editor.setReadOnly(True)
+
+        self.console_debug("LOADING %s (%d BYTES, %s)", self.file_name, self.file_size, self.encoding)
+
+        # Small files are loaded right away, larger ones go on in `self.load_next_chunk` on idle ticks.
+        self.load_next_chunk()
+
+    def set_encoding(self, encoding: str) -> None:
+        """Decodes what follows as `encoding`, strictly, so no byte of the file is lost to a replacement character."""
+
+        self.encoding = encoding
+        self.decoder = codecs.getincrementaldecoder("utf-8" if encoding == "utf-8-sig" else encoding)()
+
+    def append_chunk(self, chunk: bytes, final: bool = False) -> bool:
+        """
+        Appends `chunk` to the document, returns `False` if it could not be decoded. \\
+        The load then either failed, or starts over in `self.FALLBACK_ENCODING`.
+        """
+
+        with self.instrumentation.span("document.load_chunk", bytes=len(chunk)):
+            try:
+                text = self.decoder.decode(chunk, final)
+            except UnicodeDecodeError as error:
+                self.handle_decoding_error(error)
+
+                return False
+
+            self.loaded_bytes += len(chunk)
+
+            if text:
+                data = text.encode("utf-8")
+
+                self.buffer.SendScintilla(QsciScintilla.SCI_APPENDTEXT, len(data), data)
+
+        if self.file_size:
+            self.progress_dialog.setValue(min(99, self.loaded_bytes * 100 // self.file_size))
+
+        return True
+
+    def handle_decoding_error(self, error: UnicodeDecodeError) -> None:
+        """
+        Fails the load of a file that isn't in the encoding it declares. \\
+        A file that declares none and isn't UTF-8 is loaded again from the start in `self.FALLBACK_ENCODING`,
+        which decodes any bytes, and is saved back in it unchanged.
+        """
+
+        if self.is_encoding_declared or self.encoding == self.FALLBACK_ENCODING:
+            self.fail(error)
+
+            return
+
+        try:
+            self.file.seek(0)
+        except OSError as seek_error:
+            self.fail(seek_error)
+
+            return
+
+        self.console_debug("%s IS NOT UTF-8, LOADING IT AS %s", self.file_name, self.FALLBACK_ENCODING)
+
+        self.buffer.SendScintilla(QsciScintilla.SCI_CLEARALL)
+
+        self.loaded_bytes = 0
+        self.set_encoding(self.FALLBACK_ENCODING)
+
+        if not self.chunk_timer.isActive():
+            self.chunk_timer.start()
+
+    @pyqtSlot()
+    def load_next_chunk(self):
+        try:
+            chunk = self.file.read(self.CHUNK_BYTES)
+        except OSError as error:
+            self.fail(error)
+
+            return
+
+        if not self.append_chunk(chunk):
+            return
+
+        if len(chunk) < self.CHUNK_BYTES:
+            self.finish()
+        elif not self.chunk_timer.isActive():
+            self.chunk_timer.start()
+
+    def finish(self) -> None:
+        # A multibyte sequence cut off at the end of the file.
+        if not self.append_chunk(b"", final=True):
+            return
+
+        self.close_file()
+        self.commit()
+
+        self.editor.SendScintilla(QsciScintilla.SCI_GOTOPOS, 0)
+        self.editor.setModified(False)
+
+        self.console_debug("FILE %s LOADED", self.file_name)
+
+        self.instrumentation.count("document.loaded_bytes", self.loaded_bytes)
+        self.instrumentation.observe("document.load.seconds", time.perf_counter() - self.start_time)
+
+        self.finished.emit(self.file_name, self.encoding)
+        self.deleteLater()
+
+    @pyqtSlot()
+    def cancel(self):
+        if self.file is None:
+            return
+
+        self.close_file()
+        self.release_buffer()
+
+        self.console_debug("LOADING %s CANCELLED", self.file_name)
+
+        self.cancelled.emit()
+        self.deleteLater()
+
+    def fail(self, error: Exception) -> None:
+        self.close_file()
+        self.release_buffer()
+
+        logger.warning("COULD NOT LOAD %s: %s", self.file_name, error)
+
+        self.failed.emit(str(error))
+        self.deleteLater()
+
+    def close_file(self) -> None:
+        self.chunk_timer.stop()
+
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+        # Closing a `QProgressDialog` emits `canceled` too.
+        self.progress_dialog.canceled.disconnect(self.cancel)
+        self.progress_dialog.close()
+        self.progress_dialog.deleteLater()
+
+        self.editor.setReadOnly(False)
+
+    def commit(self) -> None:
+        """Replaces the text of the document with the buffer's, read straight from its storage, as a fresh undo history."""
+
+        self.editor.SendScintilla(QsciScintilla.SCI_SETUNDOCOLLECTION, False)
+        self.editor.SendScintilla(QsciScintilla.SCI_CLEARALL)
+        self.editor.setEolMode(self.eol_mode)
+
+        length = self.buffer.length()
+
+        if length:
+            self.editor.SendScintilla(
+                QsciScintilla.SCI_APPENDTEXT, length,
+                self.buffer.SendScintillaPtrResult(QsciScintilla.SCI_GETCHARACTERPOINTER)
+            )
+
+        self.editor.SendScintilla(QsciScintilla.SCI_SETUNDOCOLLECTION, True)
+        self.editor.SendScintilla(QsciScintilla.SCI_EMPTYUNDOBUFFER)
+
+        self.release_buffer()
+
+    def release_buffer(self) -> None:
+        if self.buffer is not None:
+            self.buffer.deleteLater()
+            self.buffer = None
@@ -0,0 +1,143 @@
+"""Atomic saving of a `PyQt5.Qsci.QsciScintilla` document, streamed from its own storage."""
+
+from PyQt5.Qsci import QsciScintilla
+
+from utilities.settings.essential_settings import DOCUMENT_SAVING_CHUNK_BYTES
+
+from utilities.scintilla_buffer import get_document_view
+from utilities.instrumentation import get_instrumentation
+
+import logging
+
+import os
+import codecs
+import tempfile
+
+logger = logging.getLogger("pysee.documents")
+
+
+def save_document(editor: QsciScintilla, file_name: str, encoding: str = "utf-8") -> None:
+    """
+    Writes the document of `editor` to `file_name` in `encoding`. \\
+    The bytes are streamed in large chunks to a temporary file next to `file_name`,
+    which is synced and then renamed over it, so a crash mid-save leaves the old file intact. \\
+    Raises `OSError` (or `UnicodeEncodeError` for text `encoding` can't hold) and leaves nothing behind on failure.
+    """
+
+    with get_instrumentation().span("document.save", bytes=editor.length(), encoding=encoding):
+        write_document_atomically(editor, file_name, encoding)
+
+
+def write_document_atomically(editor: QsciScintilla, file_name: str, encoding: str) -> None:
+    # A symbolic link keeps pointing at the saved file instead of being replaced by it.
+    file_name = os.path.realpath(file_name)
+    directory, base_name = os.path.split(file_name)
+
+    file_descriptor, temporary_file_name = tempfile.mkstemp(
+        prefix=f".{base_name}.", suffix=".tmp", dir=directory
+    )
+
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            write_document(editor, file, encoding)
+
+            file.flush()
+            os.fsync(file.fileno())
+
+        # The new file keeps the permissions of the one it replaces, `mkstemp` makes it readable by its owner only.
+        try:
+            mode = os.stat(file_name).st_mode
+        except FileNotFoundError:
+            mode = get_new_file_mode()
+
+        os.chmod(temporary_file_name, mode)
+
+        os.replace(temporary_file_name, file_name)
+    except BaseException:
+        try:
+            os.unlink(temporary_file_name)
+        except OSError:
+            pass
+
+        raise
+
+    sync_directory(directory)
+
+
+def read_umask_by_setting_it() -> int:
+    umask = os.umask(0o022)
+    os.umask(umask)
+
+    return umask
+
+
+# Setting the umask changes it for every thread until it is put back, files created meanwhile by the journal writer,
+# the logging listener or the indexers would get the wrong permissions. It is only set once, while this is imported.
+UMASK_AT_STARTUP = read_umask_by_setting_it()
+
+
+def get_umask() -> int:
+    """Returns the current umask, read from `/proc/self/status` where the kernel reports it."""
+
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+
+    return UMASK_AT_STARTUP
+
+
+def get_new_file_mode() -> int:
+    """Returns the permissions `open` would give a new file under the current umask."""
+
+    return 0o666 & ~get_umask()
+
+
+def write_document(editor: QsciScintilla, file, encoding: str) -> None:
+    view = get_document_view(editor)
+    codec_name = codecs.lookup(encoding).name
+
+    # The document is stored as UTF-8, so it is written as is.
+    if codec_name in ("utf-8", "utf-8-sig"):
+        if codec_name == "utf-8-sig":
+            file.write(codecs.BOM_UTF8)
+
+        for start in range(0, len(view), DOCUMENT_SAVING_CHUNK_BYTES):
+            file.write(view[start:start + DOCUMENT_SAVING_CHUNK_BYTES])
+
+        return
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    encoder = codecs.getincrementalencoder(encoding)()
+
+    for start in range(0, len(view), DOCUMENT_SAVING_CHUNK_BYTES):
+        file.write(encoder.encode(decoder.decode(view[start:start + DOCUMENT_SAVING_CHUNK_BYTES])))
+
+    file.write(encoder.encode(decoder.decode(b"", True), True))
+
+
+def sync_directory(directory: str) -> None:
+    """
+    Makes the rename itself durable, where the platform allows opening directories. \\
+    The file has already been replaced, so a failure is only logged.
+    """
+
+    if os.name != "posix":
+        return
+
+    try:
+        directory_descriptor = os.open(directory, os.O_RDONLY)
+    except OSError as error:
+        logger.warning("COULD NOT SYNC %s: %s", directory, error)
+
+        return
+
+    try:
+        os.fsync(directory_descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(directory_descriptor)
@@ -0,0 +1,41 @@
+"""The state of a document in a tab of `utilities.ide.EssentialIDE`."""
+
+from PyQt5.Qsci import QsciDocument
+
+from utilities.completion.symbol_index import BufferSymbolIndex
+from utilities.lexers.outline import Outline
+
+
+class DocumentTab:
+    """
+    A Scintilla document and what `utilities.ide.EssentialIDE` tracks about it. \\
+    While the tab is in the background only its buffer is kept, it isn't styled or painted;
+    the editor, lexer and completion APIs are shared by every tab.
+    """
+
+    # The attributes `EssentialIDE` holds for the shown tab, swapped in and out on a switch.
+    WINDOW_ATTRIBUTES = (
+        "name_of_document", "file_has_been_saved", "name_of_saved_file",
+        "encoding_of_saved_file", "symbol_index", "edit_journal"
+    )
+
+    def __init__(self, name_of_document: str, qsci_document=None) -> None:
+        self.qsci_document = qsci_document if qsci_document is not None else QsciDocument()
+
+        self.name_of_document = name_of_document
+        self.file_has_been_saved = False
+        self.name_of_saved_file = None
+        self.encoding_of_saved_file = "utf-8"
+
+        self.symbol_index = BufferSymbolIndex()
+        self.edit_journal = None
+
+        self.is_modified = False
+        self.lexer_state = (0, 0, Outline())
+
+        # `None` keeps the end of line mode of the editor.
+        self.eol_mode = None
+
+        self.anchor = 0
+        self.current_position = 0
+        self.first_visible_line = 0
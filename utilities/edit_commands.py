@@ -0,0 +1,118 @@
+"""Edits on ranges of a `PyQt5.Qsci.QsciScintilla` document, through Scintilla's own insert and replace calls."""
+
+from PyQt5.QtGui import QClipboard
+from PyQt5.Qsci import QsciScintilla
+
+from contextlib import contextmanager
+
+import logging
+
+logger = logging.getLogger("pysee.documents")
+
+
+class EditCommands:
+    """
+    Copies, cuts, pastes and replaces only the selection or the given ranges, never the whole document,
+    so only the touched lines are restyled and the caret and undo history survive. \\
+    Positions are byte offsets into the UTF-8 document, as Scintilla counts them. \\
+    Every command is one undo step, and `transaction` groups any number of them into one.
+    """
+    def __init__(self, editor: QsciScintilla, clipboard: QClipboard) -> None:
+        self.editor = editor
+        self.clipboard = clipboard
+
+        self.END_OF_LINE_OF_MODE = {
+            QsciScintilla.EolWindows: "\r\n", QsciScintilla.EolUnix: "\n", QsciScintilla.EolMac: "\r"
+        }
+
+    def console_debug(self, message, *arguments):
+        logger.debug(message, *arguments)
+
+    @contextmanager
+    def transaction(self):
+        """Makes every edit inside the `with` block a single undo step, transactions nest."""
+
+        self.editor.beginUndoAction()
+
+        try:
+            yield self
+        finally:
+            self.editor.endUndoAction()
+
+    def has_selection(self) -> bool:
+        return not self.editor.SendScintilla(QsciScintilla.SCI_GETSELECTIONEMPTY)
+
+    def copy(self) -> None:
+        """Copies the selection, or the caret's line when nothing is selected."""
+
+        self.editor.SendScintilla(QsciScintilla.SCI_COPYALLOWLINE)
+
+    def cut(self) -> None:
+        """Cuts the selection, or the caret's line when nothing is selected."""
+
+        if self.has_selection():
+            self.editor.SendScintilla(QsciScintilla.SCI_CUT)
+        else:
+            self.editor.SendScintilla(QsciScintilla.SCI_LINECUT)
+
+    def paste(self) -> None:
+        """Replaces the selection, or inserts at the caret, with the clipboard's text in the document's line endings."""
+
+        # Several or rectangular selections get Scintilla's own paste, which fills each of them.
+        if self.editor.SendScintilla(QsciScintilla.SCI_GETSELECTIONS) > 1 or self.editor.SendScintilla(
+            QsciScintilla.SCI_SELECTIONISRECTANGLE
+        ):
+            self.editor.SendScintilla(QsciScintilla.SCI_PASTE)
+
+            return
+
+        text = self.clipboard.text()
+
+        if text:
+            self.replace_selection(self.convert_line_endings(text))
+
+    def convert_line_endings(self, text: str) -> str:
+        end_of_line = self.END_OF_LINE_OF_MODE[self.editor.eolMode()]
+
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+        if end_of_line != "\n":
+            text = text.replace("\n", end_of_line)
+
+        return text
+
+    def replace_selection(self, text: str) -> None:
+        """Replaces the main selection with `text`, leaving the caret after it."""
+
+        data = text.encode("utf-8")
+
+        self.console_debug("REPLACING THE SELECTION WITH %d BYTES", len(data))
+
+        with self.transaction():
+            self.editor.SendScintilla(QsciScintilla.SCI_REPLACESEL, data)
+
+    def insert_text(self, position: int, text: str) -> None:
+        with self.transaction():
+            self.editor.SendScintilla(QsciScintilla.SCI_INSERTTEXT, position, text.encode("utf-8"))
+
+    def delete_range(self, start: int, end: int) -> None:
+        with self.transaction():
+            self.editor.SendScintilla(QsciScintilla.SCI_DELETERANGE, start, end - start)
+
+    def replace_range(self, start: int, end: int, text: str) -> None:
+        data = text.encode("utf-8")
+
+        with self.transaction():
+            self.editor.SendScintilla(QsciScintilla.SCI_SETTARGETRANGE, start, end)
+            self.editor.SendScintilla(QsciScintilla.SCI_REPLACETARGET, len(data), data)
+
+    def apply_edits(self, edits) -> None:
+        """
+        Applies `(start, end, text)` edits, with ranges of the document before any of them, as one undo step. \\
+        They are applied from the last to the first, so no edit moves the range of another.
+        """
+
+        with self.transaction():
+            for start, end, text in sorted(edits, key=lambda edit: (edit[0], edit[1]), reverse=True):
+                self.replace_range(start, end, text)
@@ -0,0 +1,461 @@
+"""
+Incremental autosave of a `PyQt5.Qsci.QsciScintilla` document as an append-only journal of its edits,
+and recovery of the document from the journal after a crash.
+"""
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSlot
+from PyQt5.Qsci import QsciScintilla
+
+from utilities.settings.essential_settings import (
+    EDIT_JOURNAL_DIRECTORY, EDIT_JOURNAL_FLUSH_MILLISECONDS, EDIT_JOURNAL_COMPACTION_BYTES
+)
+
+from utilities.journal_records import (
+    INSERT_RECORD, DELETE_RECORD, SNAPSHOT_RECORD,
+    encode_header, encode_record, read_journal, get_records_to_replay
+)
+from utilities.scintilla_buffer import read_bytes, get_document_view
+
+import logging
+
+import os
+import uuid
+import queue
+import hashlib
+import itertools
+import threading
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+logger = logging.getLogger("pysee.documents")
+
+
+def lock_file(file) -> bool:
+    """Takes an exclusive lock on `file` without waiting, returns `False` if another writer holds it."""
+
+    try:
+        if os.name == "nt":
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+            file.seek(0, os.SEEK_END)
+        else:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+
+    return True
+
+
+def get_journal_path(file_name) -> str:
+    """Returns the journal of the saved file `file_name`."""
+
+    key = os.path.normcase(os.path.abspath(file_name)).encode("utf-8")
+
+    return str(EDIT_JOURNAL_DIRECTORY / f"{hashlib.sha1(key).hexdigest()}.journal")
+
+
+def get_untitled_journal_path() -> str:
+    return str(EDIT_JOURNAL_DIRECTORY / f"untitled-{uuid.uuid4().hex}.journal")
+
+
+def read_recoverable_journal(journal_path: str, file_name=None):
+    """
+    Returns the records to replay from the journal at `journal_path`,
+    or `None` if there is nothing to recover from it. \\
+    A journal is only recovered when no other window writes it, and when it starts from
+    the current state of `file_name` or holds a snapshot of its own.
+    """
+
+    try:
+        with open(journal_path, "rb") as file:
+            if not lock_file(file):
+                return None
+
+            base, records = read_journal(file)
+    except (OSError, ValueError):
+        return None
+
+    records = get_records_to_replay(records)
+
+    if not records:
+        return None
+
+    if records[0][0] == SNAPSHOT_RECORD:
+        return records
+
+    if file_name is None:
+        return records if base.get("path") is None else None
+
+    try:
+        status = os.stat(file_name)
+    except OSError:
+        return None
+
+    if [base.get("size"), base.get("modification_time")] != [status.st_size, status.st_mtime_ns]:
+        return None
+
+    return records
+
+
+def find_untitled_journals() -> list:
+    """
+    Returns the journals of documents that were never saved, most recent first. \\
+    Journals no window writes that hold no edits are removed on the way.
+    """
+
+    try:
+        journal_paths = [
+            str(path) for path in EDIT_JOURNAL_DIRECTORY.glob("untitled-*.journal")
+        ]
+    except OSError:
+        return []
+
+    journals = []
+
+    for journal_path in journal_paths:
+        # Another window may remove its journal at any time.
+        try:
+            modification_time = os.path.getmtime(journal_path)
+        except OSError:
+            continue
+
+        if is_empty_journal(journal_path):
+            try:
+                os.unlink(journal_path)
+            except OSError:
+                pass
+
+            continue
+
+        journals.append((modification_time, journal_path))
+
+    return [journal_path for _, journal_path in sorted(journals, reverse=True)]
+
+
+def is_empty_journal(journal_path: str) -> bool:
+    """Returns `True` if no window writes the journal at `journal_path` and it holds nothing to replay."""
+
+    try:
+        with open(journal_path, "rb") as file:
+            if not lock_file(file):
+                return False
+
+            _, records = read_journal(file)
+    except OSError:
+        return False
+    except ValueError:
+        return True
+
+    return not get_records_to_replay(records)
+
+
+class JournalWriter(threading.Thread):
+    """
+    Does all the file work of the `EditJournal`s of a window in order, off the GUI thread,
+    so the journals of every tab share one thread. \\
+    Commands name the journal they are for. \\
+    Inherits `threading.Thread`.
+    """
+    def __init__(self) -> None:
+        super(JournalWriter, self).__init__(daemon=True)
+
+        self.commands = queue.Queue()
+
+        # Journal number to the path and the open file of its journal.
+        self.journal_paths = {}
+        self.files = {}
+
+    def console_debug(self, message, *arguments):
+        logger.debug(message, *arguments)
+
+    def run(self):
+        while True:
+            command = self.commands.get()
+
+            if command is None:
+                for journal_number in list(self.files):
+                    self.close_file(journal_number)
+
+                return
+
+            name, journal_number, *arguments = command
+
+            try:
+                getattr(self, name)(journal_number, *arguments)
+            except OSError as error:
+                logger.warning("EDIT JOURNAL %s NOT WRITTEN: %s", self.journal_paths.get(journal_number), error)
+
+    def stop(self) -> None:
+        """Closes every journal once the commands before it are done, and waits for the thread to end."""
+
+        self.commands.put(None)
+        self.join()
+
+    def close_file(self, journal_number: int) -> None:
+        file = self.files.pop(journal_number, None)
+
+        if file is not None:
+            file.close()
+
+    def rewrite(self, journal_number: int, journal_path: str, data: bytes) -> None:
+        """Replaces the current journal by one holding `data`, removing the old one if it moves."""
+
+        self.close_file(journal_number)
+
+        previous_journal_path = self.journal_paths.get(journal_number)
+
+        if previous_journal_path is not None and previous_journal_path != journal_path:
+            self.remove(previous_journal_path)
+
+        self.journal_paths[journal_number] = journal_path
+
+        EDIT_JOURNAL_DIRECTORY.mkdir(parents=True, exist_ok=True)
+
+        temporary_journal_path = f"{journal_path}.tmp"
+
+        with open(temporary_journal_path, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temporary_journal_path, journal_path)
+
+        file = self.files[journal_number] = open(journal_path, "ab")
+
+        if not lock_file(file):
+            self.console_debug("EDIT JOURNAL %s IS LOCKED BY ANOTHER WINDOW", journal_path)
+
+    def append(self, journal_number: int, data: bytes) -> None:
+        file = self.files.get(journal_number)
+
+        if file is None:
+            return
+
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+
+    def remove(self, journal_path: str) -> None:
+        try:
+            os.unlink(journal_path)
+        except FileNotFoundError:
+            pass
+
+    def discard(self, journal_number: int) -> None:
+        self.close_file(journal_number)
+
+        journal_path = self.journal_paths.pop(journal_number, None)
+
+        if journal_path is not None:
+            self.remove(journal_path)
+
+    def release(self, journal_number: int) -> None:
+        """Closes a journal that will get no more commands, leaving its file in place."""
+
+        self.close_file(journal_number)
+        self.journal_paths.pop(journal_number, None)
+
+
+class EditJournal(QObject):
+    """
+    Records the insertions and deletions `PyQt5.Qsci.QsciScintilla` reports through `SCN_MODIFIED`,
+    and has a `utilities.edit_journal.JournalWriter` append them in timed batches. \\
+    The journal is compacted into a snapshot once it outgrows the document,
+    so autosave I/O follows the amount of editing and not the size of the file. \\
+    Inherits `PyQt5.QtCore.QObject`.
+    """
+
+    journal_numbers = itertools.count()
+
+    def __init__(self, editor: QsciScintilla, writer: JournalWriter | None = None) -> None:
+        super(EditJournal, self).__init__(editor)
+
+        self.editor = editor
+
+        self.COMPACTION_BYTES: int = EDIT_JOURNAL_COMPACTION_BYTES
+
+        self.recording = False
+
+        self.journal_path = None
+        self.journal_header = b""
+        self.journal_size = 0
+        self.number_of_records = 0
+
+        # The file is only written with the first edits, so documents never edited leave no journal behind.
+        self.is_journal_written = False
+
+        self.pending_records = []
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(EDIT_JOURNAL_FLUSH_MILLISECONDS)
+        self.flush_timer.timeout.connect(self.flush)
+
+        # The writer of the window, shared with the journals of its other tabs, or one of its own.
+        self.owns_writer = writer is None
+
+        if self.owns_writer:
+            writer = JournalWriter()
+            writer.start()
+
+        self.writer = writer
+        self.journal_number = next(self.journal_numbers)
+
+        self.attach()
+
+    def send(self, name: str, *arguments) -> None:
+        self.writer.commands.put((name, self.journal_number, *arguments))
+
+    def attach(self) -> None:
+        """Records the edits of the document shown in the editor, which must be this journal's."""
+
+        self.editor.SCN_MODIFIED.connect(self.record_modification)
+
+    def detach(self) -> None:
+        """Stops recording before the editor shows another document."""
+
+        self.flush()
+
+        self.editor.SCN_MODIFIED.disconnect(self.record_modification)
+
+    def open(self, file_name=None, journal_path=None, with_snapshot=None) -> None:
+        """
+        Starts a new journal from the saved state of `file_name`,
+        or from the current text of an untitled document. \\
+        Replaces the previous journal, whose edits are now saved or discarded.
+        """
+
+        self.pending_records.clear()
+        self.flush_timer.stop()
+
+        if file_name is None:
+            self.journal_path = journal_path or get_untitled_journal_path()
+            self.journal_header = encode_header({"path": None})
+        else:
+            status = os.stat(file_name)
+
+            self.journal_path = get_journal_path(file_name)
+            self.journal_header = encode_header({
+                "path": os.path.abspath(file_name),
+                "size": status.st_size, "modification_time": status.st_mtime_ns
+            })
+
+        if with_snapshot is None:
+            with_snapshot = file_name is None and self.editor.length() > 0
+
+        if with_snapshot:
+            self.compact()
+        else:
+            self.journal_size = len(self.journal_header)
+            self.number_of_records = 0
+
+            # The previous journal, whose edits are now saved or discarded.
+            self.send("discard")
+            self.is_journal_written = False
+
+        self.recording = True
+
+    def pause(self) -> None:
+        """Stops recording, for changes that will be followed by `open`."""
+
+        self.flush()
+
+        self.recording = False
+
+    def resume(self) -> None:
+        """Records again after a `pause` that left the document unchanged, into the same journal."""
+
+        self.recording = True
+
+    def record_modification(self, position, modification_type, text, length, *_):
+        if not self.recording:
+            return
+
+        # The inserted text is read back from the document, it is in place by the time of the notification.
+        if modification_type & QsciScintilla.SC_MOD_INSERTTEXT:
+            record = encode_record(INSERT_RECORD, position, length, bytes(read_bytes(self.editor, position, position + length)))
+        elif modification_type & QsciScintilla.SC_MOD_DELETETEXT:
+            record = encode_record(DELETE_RECORD, position, length)
+        else:
+            return
+
+        self.pending_records.append(record)
+
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    @pyqtSlot()
+    def flush(self):
+        self.flush_timer.stop()
+
+        if not self.pending_records:
+            return
+
+        data = b"".join(self.pending_records)
+
+        self.number_of_records += len(self.pending_records)
+        self.pending_records.clear()
+
+        self.journal_size += len(data)
+
+        if self.is_journal_written:
+            self.send("append", data)
+        else:
+            self.send("rewrite", self.journal_path, self.journal_header + data)
+            self.is_journal_written = True
+
+        if self.journal_size > max(self.COMPACTION_BYTES, self.editor.length()):
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrites the journal as a single snapshot of the document."""
+
+        snapshot = bytes(get_document_view(self.editor))
+
+        data = self.journal_header + encode_record(SNAPSHOT_RECORD, 0, len(snapshot), snapshot)
+
+        self.journal_size = len(data)
+        self.number_of_records = 1
+
+        self.send("rewrite", self.journal_path, data)
+        self.is_journal_written = True
+
+    def recover(self, records: list, file_name=None, journal_path=None) -> None:
+        """
+        Applies recovered records to the document, then starts its journal over
+        as a snapshot of the result, replacing the recovered journal in one atomic rename.
+        """
+
+        self.pause()
+
+        for kind, position, length, payload in records:
+            if kind == SNAPSHOT_RECORD:
+                self.editor.SendScintilla(QsciScintilla.SCI_CLEARALL)
+                self.editor.SendScintilla(QsciScintilla.SCI_APPENDTEXT, len(payload), payload)
+            elif kind == INSERT_RECORD:
+                self.editor.SendScintilla(QsciScintilla.SCI_INSERTTEXT, position, payload)
+            else:
+                self.editor.SendScintilla(QsciScintilla.SCI_DELETERANGE, position, length)
+
+        self.open(file_name, journal_path, with_snapshot=True)
+
+    def close(self, keep_edits: bool = True) -> None:
+        """
+        Flushes the journal and releases it from the writer, stopping the writer if it is its own. \\
+        The journal is removed unless it holds edits to recover, or if `keep_edits` is `False`.
+        """
+
+        self.flush()
+
+        self.recording = False
+
+        if not keep_edits or not self.number_of_records:
+            self.send("discard")
+
+        self.send("release")
+
+        if self.owns_writer:
+            self.writer.stop()
@@ -1,26 +1,18 @@
 from PyQt5.QtWidgets import (
-    QMainWindow, QMessageBox, QLineEdit, QPushButton, QInputDialog, 
+    QMainWindow, QApplication, QMessageBox, QLineEdit, QPushButton, QInputDialog, 
     QLabel
 )
 
 from PyQt5.QtGui import QFont, QIcon, QPixmap
 from PyQt5.QtCore import pyqtSlot
 
-from utilities.ide import EssentialIDE
+from utilities.settings.essential_settings import ASSETS_DIRECTORY, STYLESHEETS_DIRECTORY
 
-from utilities.settings.essential_settings import DEBUGGING_MODE
-
-from pathlib import Path
+from utilities.startup_trace import get_startup_trace
 
 import logging
 
-import sys
-
-logging.basicConfig(
-    level=logging.DEBUG, 
-    format="%(levelname)s on %(asctime)s in %(filename)s; %(message)s", 
-    datefmt="%d/%m/%Y, %I:%M:%S %p"
-)
+logger = logging.getLogger("pysee.interface")
 
 
 class MainMenuOfEssential(QMainWindow):
@@ -46,20 +38,16 @@ class MainMenuOfEssential(QMainWindow):
 
         self.setGeometry(self.WINDOW_X, self.WINDOW_Y, self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
         self.setWindowTitle(self.TITLE)
-        self.setWindowIcon(QIcon(r"assets\icons\pysee_icon.ico"))
+        self.setWindowIcon(QIcon(str(ASSETS_DIRECTORY / "icons" / "pysee_icon.ico")))
 
         self.start_UI()
 
         self.showMaximized()
 
-    def console_debug(self, message):
-        """
-        Debugs message to terminal if 
-        `utilities.settings.consts.DEBUGGING_MODE` is set to True
-        """
+    def console_debug(self, message, *arguments):
+        """Logs `message` at the debug level of `pysee.interface`, formatted with `arguments` on the logging thread."""
 
-        if DEBUGGING_MODE: 
-            logging.debug(message)
+        logger.debug(message, *arguments)
 
     def closeEvent(self, event):
         """Calls close event. Built-in method from QWidget."""
@@ -75,7 +63,9 @@ class MainMenuOfEssential(QMainWindow):
             self.console_debug("EXIT CONFIRMED")
 
             event.accept()
-            sys.exit(0)
+
+            # Returning from the event loop lets `aboutToQuit` stop the worker threads of open documents.
+            QApplication.quit()
         else:
             self.console_debug("USER DOES NOT WANT TO EXIT")
             event.ignore()
@@ -90,11 +80,22 @@ class MainMenuOfEssential(QMainWindow):
         )
 
         if self.ide_window is None and self.file_name and confirm:
-            self.ide_window = EssentialIDE(self.file_name)
+            startup_trace = get_startup_trace()
+
+            # The IDE, with Qsci and the lexers, is only imported once it is asked for.
+            with startup_trace.phase("import EssentialIDE"):
+                from utilities.ide import EssentialIDE
+
+            with startup_trace.phase("create EssentialIDE"):
+                self.ide_window = EssentialIDE(self.file_name)
 
             self.destroy()
             self.ide_window.show()
 
+            startup_trace.mark("IDE window shown")
+            startup_trace.report()
+            startup_trace.stop()
+
     def add_create_file_button_to_essential_main_menu_window(self):
         self.file_button_in_essential_main_menu_window = QPushButton(self)
 
@@ -119,11 +120,11 @@ class MainMenuOfEssential(QMainWindow):
         )
 
     def start_UI(self):
-        self.style_sheet_for_main_menu = Path(
-            r"utilities\settings\stylesheets\main_menu_style.qss"
-        )
+        self.style_sheet_for_main_menu = STYLESHEETS_DIRECTORY / "main_menu_style.qss"
 
-        self.style_for_main_menu = self.style_sheet_for_main_menu.read_text()
-        self.setStyleSheet(self.style_for_main_menu)
+        # Applied before the first paint, an unstyled menu would flash otherwise.
+        with get_startup_trace().phase("main menu stylesheet"):
+            self.style_for_main_menu = self.style_sheet_for_main_menu.read_text()
+            self.setStyleSheet(self.style_for_main_menu)
 
         self.add_create_file_button_to_essential_main_menu_window()
@@ -4,35 +4,49 @@ from PyQt5.QtWidgets import (
     QWidget, QApplication, QMessageBox, 
     QFileDialog, QAction, QVBoxLayout, 
     QMenu, QMenuBar, QFontDialog, QPushButton, QInputDialog, 
-    QLineEdit, QColorDialog
+    QLineEdit, QColorDialog, QTabBar
 )
 from PyQt5.QtGui import QFont, QIcon, QKeySequence, QColor, QPixmap
-from PyQt5.QtCore import pyqtSlot, Qt, QDir
-from PyQt5.Qsci import QsciScintilla, QsciAPIs
+from PyQt5.QtCore import pyqtSlot, Qt, QDir, QTimer
+from PyQt5.Qsci import QsciScintilla
 
-from utilities.settings.essential_settings import DEBUGGING_MODE
+from utilities.settings.essential_settings import (
+    LAZY_STYLING_ENABLED, DIAGNOSTICS_ENABLED, ASSETS_DIRECTORY, STYLESHEETS_DIRECTORY
+)
 
 from utilities.lexers.lexer_ide import PythonLexer
+from utilities.lexers.lazy_styling import LazyStyler
+
+from utilities.module_index import get_module_index
+
+from utilities.completion.api_preparation import APIPreparation
+from utilities.completion.buffer_aware_apis import BufferAwareAPIs
+from utilities.completion.symbol_index import BufferSymbolIndex
+from utilities.document_tab import DocumentTab
+from utilities.completion.introspection import get_introspection_pool
+
+from utilities.document_loader import DocumentLoader
+from utilities.document_saver import save_document
+from utilities.code_runner import CodeRunner
+from utilities.output_panel import OutputPanel
+from utilities.outline_panel import OutlinePanel
+from utilities.quick_open_dialog import QuickOpenDialog
+from utilities.project_indexer import get_project_indexer
+from utilities.scintilla_buffer import get_document_view
+from utilities.edit_commands import EditCommands
+from utilities.diagnostics.diagnostics_engine import DiagnosticsEngine
+from utilities.edit_journal import (
+    EditJournal, JournalWriter, get_journal_path, read_recoverable_journal, find_untitled_journals
+)
 
 from pathlib import Path
 
 import logging
 
-import sys
+import os
 import subprocess
-import threading
 
-import builtins
-import keyword
-
-import inspect
-import pkgutil
-
-logging.basicConfig(
-    level=logging.DEBUG, 
-    format="%(levelname)s on %(asctime)s in %(filename)s; %(message)s", 
-    datefmt="%d/%m/%Y, %I:%M:%S %p"
-)
+logger = logging.getLogger("pysee.interface")
 
 
 class EssentialIDE(QWidget):
@@ -67,7 +81,7 @@ class EssentialIDE(QWidget):
 
         self.setGeometry(self.WINDOW_X, self.WINDOW_Y, self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
         self.setWindowTitle(self.title)
-        self.setWindowIcon(QIcon(r"assets\icons\pysee_icon.ico"))
+        self.setWindowIcon(QIcon(str(ASSETS_DIRECTORY / "icons" / "pysee_icon.ico")))
 
         self.clipboard = QApplication.clipboard()
 
@@ -88,8 +102,21 @@ class EssentialIDE(QWidget):
         if self.exit_confirmation_message_box == QMessageBox.Yes:
             self.console_debug("EXIT CONFIRMED")
 
+            self.store_current_tab()
+
+            # Unsaved edits stay in the journals, to be recovered on the next launch.
+            for tab in self.tabs:
+                tab.edit_journal.close()
+
+            self.journal_writer.stop()
+
+            self.code_runner.cancel()
+
             event.accept()
-            sys.exit(0)
+
+            # Returning from the event loop lets `aboutToQuit` stop the worker threads,
+            # `sys.exit` here would abort the process with them still running.
+            QApplication.quit()
         else:
             self.console_debug("USER DOES NOT WANT TO EXIT")
             event.ignore()
@@ -108,14 +135,10 @@ class EssentialIDE(QWidget):
         if event.button() == Qt.RightButton:
             self.create_edit_menu_as_context_menu()
 
-    def console_debug(self, message):
-        """
-        Debugs message to terminal if 
-        `utilities.settings.consts.DEBUGGING_MODE` is set to True
-        """
+    def console_debug(self, message, *arguments):
+        """Logs `message` at the debug level of `pysee.interface`, formatted with `arguments` on the logging thread."""
 
-        if DEBUGGING_MODE: 
-            logging.debug(message)
+        logger.debug(message, *arguments)
 
     @pyqtSlot()
     def exit_application(self):
@@ -126,48 +149,171 @@ class EssentialIDE(QWidget):
 
         self.console_debug("EXITING APP.")
 
-        self.exit_confirmation_message_box = QMessageBox.question(
-            self, "Exit Conformation", "Exit application?", 
-            QMessageBox.Yes | QMessageBox.No, QMessageBox.No
-        )
-
-        if self.exit_confirmation_message_box == QMessageBox.Yes:
-            sys.exit(0)
+        # Confirmed and shut down by `closeEvent`.
+        self.close()
 
     @pyqtSlot()
     def new_application(self):
         """
-        Creates a new application when called, 
+        Opens a new document in a tab of this window when called, 
         uses `PyQt5.QtCore.pyqtSlot()` decorator.
         """
 
-        self.console_debug("CREATING NEW APP.")
+        # Tabs don't change while a load writes into the shown document.
+        if not self.tab_bar.isEnabled():
+            return
+
+        self.console_debug("CREATING NEW TAB.")
+
+        self.tabs.append(DocumentTab("EEIIDoc"))
+        self.tab_bar.setCurrentIndex(self.tab_bar.addTab("EEIIDoc"))
+
+    def store_current_tab(self) -> None:
+        """Keeps what this window tracks about the shown document in its `utilities.document_tab.DocumentTab`."""
+
+        tab = self.current_tab
+
+        for attribute in DocumentTab.WINDOW_ATTRIBUTES:
+            setattr(tab, attribute, getattr(self, attribute))
+
+        tab.is_modified = self.document.isModified()
+        tab.lexer_state = self.lexer.get_document_state()
+        tab.eol_mode = self.document.eolMode()
+
+        tab.anchor = self.document.SendScintilla(QsciScintilla.SCI_GETANCHOR)
+        tab.current_position = self.document.SendScintilla(QsciScintilla.SCI_GETCURRENTPOS)
+        tab.first_visible_line = self.document.SendScintilla(QsciScintilla.SCI_GETFIRSTVISIBLELINE)
 
-        self.new_document_window = EssentialIDE("EEIIDoc")
-        self.new_document_window.show()
+        self.edit_journal.detach()
+
+    def show_tab(self, tab: DocumentTab) -> None:
+        """Shows the document of `tab` in the shared editor, with the same lexer and completion APIs."""
+
+        self.current_tab = tab
+
+        self.document.setDocument(tab.qsci_document)
+
+        # The code page, indentation and end of lines belong to each Scintilla document.
+        self.document.setUtf8(True)
+        self.document.setIndentationsUseTabs(True)
+        self.document.setTabWidth(self.TAB_WIDTH)
+
+        if tab.eol_mode is not None:
+            self.document.setEolMode(tab.eol_mode)
+
+        self.document.SendScintilla(QsciScintilla.SCI_SETLEXER, QsciScintilla.SCLEX_CONTAINER)
+        self.lexer.set_document_state(tab.lexer_state)
+
+        for attribute in DocumentTab.WINDOW_ATTRIBUTES:
+            setattr(self, attribute, getattr(tab, attribute))
+
+        self.api.symbol_index = self.symbol_index
+
+        if self.edit_journal is None:
+            self.edit_journal = tab.edit_journal = EditJournal(self.document, self.journal_writer)
+            self.edit_journal.open()
+        else:
+            self.edit_journal.attach()
+
+        self.document.SendScintilla(QsciScintilla.SCI_SETSEL, tab.anchor, tab.current_position)
+        self.document.SendScintilla(QsciScintilla.SCI_SETFIRSTVISIBLELINE, tab.first_visible_line)
+
+        self.title = f"PySee | \"{self.name_of_document}\""
+        self.setWindowTitle(self.title)
+
+        if LAZY_STYLING_ENABLED:
+            self.lazy_styler.style_viewport()
+
+        # Indicators belong to each Scintilla document, their messages to the engine.
+        if DIAGNOSTICS_ENABLED:
+            self.diagnostics_engine.reset()
+
+    @pyqtSlot(int)
+    def switch_to_tab(self, index):
+        if index < 0 or self.tabs[index] is self.current_tab:
+            return
+
+        self.store_current_tab()
+        self.show_tab(self.tabs[index])
+
+    @pyqtSlot()
+    def close_current_tab(self):
+        self.close_tab(self.tab_bar.currentIndex())
+
+    @pyqtSlot(int)
+    def close_tab(self, index):
+        if not self.tab_bar.isEnabled():
+            return
+
+        tab = self.tabs[index]
+
+        is_modified = self.document.isModified() if tab is self.current_tab else tab.is_modified
+
+        if is_modified and QMessageBox.question(
+            self, "Close Document", f"Discard the unsaved changes to {tab.name_of_document}?", 
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+        ) != QMessageBox.Yes:
+            return
+
+        # A window always shows a document.
+        if len(self.tabs) == 1:
+            self.new_application()
+
+        if tab is self.current_tab:
+            self.tab_bar.setCurrentIndex(index + 1 if index + 1 < len(self.tabs) else index - 1)
+
+        tab.edit_journal.close(keep_edits=False)
+
+        # Removed from the list first, so the index change `removeTab` causes finds the shown tab.
+        self.tabs.pop(index)
+        self.tab_bar.removeTab(index)
+
+    def set_up_tab_bar(self):
+        self.tab_bar = QTabBar(self)
+        self.tab_bar.setGeometry(self.DOCUMENT_X, self.TAB_BAR_Y, self.DOCUMENT_WIDTH, self.DOCUMENT_Y - self.TAB_BAR_Y)
+        self.tab_bar.setTabsClosable(True)
+        self.tab_bar.setExpanding(False)
+
+        self.current_tab = DocumentTab(self.name_of_document, self.document.document())
+        self.tabs = [self.current_tab]
+
+        self.tab_bar.addTab(self.name_of_document)
+
+        self.tab_bar.currentChanged.connect(self.switch_to_tab)
+        self.tab_bar.tabCloseRequested.connect(self.close_tab)
 
     @pyqtSlot()
     def copy(self):
         """
-        Copies selected text on the document when called, 
+        Copies the selected text, or the current line, when called, 
         uses `PyQt5.QtCore.pyqtSlot()` decorator.
         """
 
         self.console_debug("TEXT COPIED.")
 
-        self.clipboard.clear()
-        self.clipboard.setText(self.document.text())
+        self.edit_commands.copy()
+
+    @pyqtSlot()
+    def cut(self):
+        """
+        Cuts the selected text, or the current line, when called, 
+        uses `PyQt5.QtCore.pyqtSlot()` decorator.
+        """
+
+        self.console_debug("TEXT CUT.")
+
+        self.edit_commands.cut()
 
     @pyqtSlot()
     def paste(self):
         """
-        Pastes text on clipboard to the document when called, 
+        Pastes text on clipboard over the selection, or at the caret, when called, 
         uses `PyQt5.QtCore.pyqtSlot()` decorator.
         """
 
         self.console_debug("TEXT PASTE.")
 
-        self.document.setText(self.document.text() + self.clipboard.text())
+        self.edit_commands.paste()
 
     @pyqtSlot()
     def save(self):
@@ -176,8 +322,6 @@ class EssentialIDE(QWidget):
         uses `PyQt5.QtCore.pyqtSlot()` decorator.
         """
 
-        # FIXME When saved, doubles the lines in saved file.
-
         save_dialog_options = QFileDialog.Options()
         save_dialog_options |= QFileDialog.DontUseNativeDialog
 
@@ -188,13 +332,20 @@ class EssentialIDE(QWidget):
         )
 
         if file_name: 
-            self.console_debug(f"FILE {file_name} SAVED")
+            try:
+                save_document(self.document, file_name, self.encoding_of_saved_file)
+            except (OSError, UnicodeError) as error:
+                logger.warning("COULD NOT SAVE %s: %s", file_name, error)
+
+                QMessageBox.warning(self, "Save Document", f"Could not save the document:\n{error}")
 
-            with open(file_name, "w") as file:
-                file.writelines(self.document.text())
+                return
 
-                self.console_debug(self.document.text())
+            self.console_debug("FILE %s SAVED", file_name)
 
+            self.edit_journal.open(file_name)
+
+            self.document.setModified(False)
             self.file_has_been_saved = True
             self.name_of_saved_file = file_name
 
@@ -205,29 +356,133 @@ class EssentialIDE(QWidget):
         uses `PyQt5.QtCore.pyqtSlot()` decorator.
         """
 
-        load_dialog_options = QFileDialog.Options()
-        load_dialog_options |= QFileDialog.DontUseNativeDialog
-
+        # The native dialog lists directories without blocking the window.
         file_name, _ = QFileDialog.getOpenFileName(
-            self, "Load Document", "", 
-            "All Files (*);;Python Files (.py)", 
-            options=load_dialog_options
+            self, "Load Document", self.project_indexer.root or "", 
+            "All Files (*);;Python Files (.py)"
         )
 
-        if file_name: 
-            self.console_debug(f"FILE {file_name} LOADED")
+        if file_name:
+            self.open_file(file_name)
 
-            with open(file_name, "r") as file:
-                to_be_on_document = "".join(map(str, file.readlines()))
+    def open_file(self, file_name: str) -> None:
+        """Loads `file_name` into the shown document, replacing what it holds."""
 
-                self.document.setText(to_be_on_document)
+        # Large files are streamed in chunks, `self.finish_loading` runs once the last one is in.
+        self.edit_journal.pause()
 
-            self.file_has_been_saved = True
+        self.document_loader = DocumentLoader(self.document, file_name)
+        self.document_loader.finished.connect(self.finish_loading)
+        self.document_loader.cancelled.connect(self.cancel_loading)
+        self.document_loader.failed.connect(self.announce_loading_failed)
 
-            self.name_of_saved_file = file_name
+        # The loader replaces the text of the shown document once done, which must stay shown until then.
+        self.tab_bar.setEnabled(False)
+
+        self.document_loader.start()
 
         self.document.setFont(QFont(self.FONT_FAMILY, 16))
 
+    @pyqtSlot()
+    def open_project(self):
+        """Makes the chosen directory the project that quick open searches, indexing it in the background."""
+
+        root = QFileDialog.getExistingDirectory(self, "Open Project", self.project_indexer.root or "")
+
+        if root:
+            self.project_indexer.open_root(root)
+
+    @pyqtSlot()
+    def show_quick_open_dialog(self):
+        if self.project_indexer.root is None:
+            self.open_project()
+
+        if self.project_indexer.root is not None:
+            self.quick_open_dialog.open_dialog()
+
+    @pyqtSlot(str)
+    def open_project_file(self, file_name):
+        """Shows the tab holding `file_name`, if any, or loads it into a new tab, or into this one if it is blank."""
+
+        # Tabs don't change while a load writes into the shown document.
+        if not self.tab_bar.isEnabled():
+            return
+
+        file_path = os.path.normcase(os.path.abspath(file_name))
+
+        for index, tab in enumerate(self.tabs):
+            name_of_saved_file = self.name_of_saved_file if tab is self.current_tab else tab.name_of_saved_file
+
+            if name_of_saved_file and os.path.normcase(os.path.abspath(name_of_saved_file)) == file_path:
+                self.tab_bar.setCurrentIndex(index)
+                self.document.setFocus()
+
+                return
+
+        if self.file_has_been_saved or self.document.isModified() or self.document.length():
+            self.new_application()
+
+        self.open_file(file_name)
+
+    @pyqtSlot(str, str)
+    def finish_loading(self, file_name, encoding):
+        self.tab_bar.setEnabled(True)
+
+        records = read_recoverable_journal(get_journal_path(file_name), file_name)
+
+        if records and self.confirm_recovery(file_name):
+            self.edit_journal.recover(records, file_name)
+        else:
+            self.edit_journal.open(file_name)
+
+        if LAZY_STYLING_ENABLED:
+            self.lazy_styler.style_viewport()
+
+        self.file_has_been_saved = True
+
+        self.name_of_saved_file = file_name
+        self.encoding_of_saved_file = encoding
+
+        self.rename_current_tab(Path(file_name).name)
+
+    @pyqtSlot()
+    def cancel_loading(self):
+        self.tab_bar.setEnabled(True)
+
+        # The document is as it was, still titled after its own file.
+        self.edit_journal.resume()
+
+    @pyqtSlot(str)
+    def announce_loading_failed(self, error):
+        self.tab_bar.setEnabled(True)
+
+        self.edit_journal.resume()
+
+        QMessageBox.warning(self, "Load Document", f"Could not load the document:\n{error}")
+
+    def confirm_recovery(self, name_of_document) -> bool:
+        return QMessageBox.question(
+            self, "Recover Document", f"{name_of_document} has unsaved changes from a previous session. Recover them?", 
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
+        ) == QMessageBox.Yes
+
+    @pyqtSlot()
+    def offer_untitled_recovery(self):
+        """Offers the most recent unsaved document left behind by a previous session."""
+
+        for journal_path in find_untitled_journals():
+            records = read_recoverable_journal(journal_path)
+
+            if not records:
+                continue
+
+            if self.confirm_recovery("An untitled document"):
+                self.edit_journal.recover(records, journal_path=journal_path)
+            else:
+                Path(journal_path).unlink(missing_ok=True)
+
+            return
+
     # FIXME Fix theme changing.
 
     @pyqtSlot()
@@ -276,8 +531,15 @@ class EssentialIDE(QWidget):
         )
 
         if new_name_of_document and confirm:
-            self.title = f"DOCESSENTIAL | Document \"{new_name_of_document}\""
-            self.setWindowTitle(self.title)
+            self.rename_current_tab(new_name_of_document)
+
+    def rename_current_tab(self, new_name_of_document):
+        self.name_of_document = new_name_of_document
+
+        self.tab_bar.setTabText(self.tab_bar.currentIndex(), new_name_of_document)
+
+        self.title = f"PySee | \"{self.name_of_document}\""
+        self.setWindowTitle(self.title)
 
     @pyqtSlot()
     def set_text_color_of_document(self):
@@ -291,19 +553,122 @@ class EssentialIDE(QWidget):
         self.document.setTextColor(self.text_color)
 
     @pyqtSlot()
-    def run_code_and_wait(self):
-        self.code_running_process = self.start_code_running_process()
+    def run_code(self):
+        """
+        Runs the saved file, or the buffer if it has unsaved changes, in a child process
+        and streams its output into `self.output_panel`.
+        """
+
+        if self.code_runner.is_running():
+            return
+
+        self.show_output_panel()
+
+        if self.file_has_been_saved and not self.document.isModified():
+            self.code_runner.run_file(self.name_of_saved_file, str(Path(self.name_of_saved_file).parent))
+        else:
+            script_directory = str(Path(self.name_of_saved_file).parent) if self.file_has_been_saved else None
+
+            self.code_runner.run_source(
+                bytes(get_document_view(self.document)), script_directory or str(Path.home()), script_directory
+            )
 
-        if self.code_running_process != 1:
-            self.thread_to_wait_until_user_presses_any_key = threading.Thread(target=lambda: input())
-            self.thread_to_wait_until_user_presses_any_key.start()
+    def lay_out_document(self):
+        """Sizes the document around the output panel under it and the outline panel beside it, when shown."""
 
-            self.code_running_process.wait()
+        document_width = self.DOCUMENT_WIDTH - (0 if self.outline_panel.isHidden() else self.OUTLINE_PANEL_WIDTH)
+        document_height = self.DOCUMENT_HEIGHT - (0 if self.output_panel.isHidden() else self.OUTPUT_PANEL_HEIGHT)
 
-        self.file_has_not_been_saved_dialog = QMessageBox.information(
-            self, "File has not been saved", "User has not saved file.", QMessageBox.Ok
+        self.document.setFixedSize(document_width, document_height)
+
+        self.output_panel.setGeometry(
+            self.DOCUMENT_X, self.DOCUMENT_Y + self.DOCUMENT_HEIGHT - self.OUTPUT_PANEL_HEIGHT, 
+            document_width, self.OUTPUT_PANEL_HEIGHT
+        )
+
+        self.outline_panel.setGeometry(
+            self.DOCUMENT_X + document_width, self.DOCUMENT_Y, self.OUTLINE_PANEL_WIDTH, self.DOCUMENT_HEIGHT
         )
 
+    @pyqtSlot()
+    def show_output_panel(self):
+        self.output_panel.show()
+        self.lay_out_document()
+
+    @pyqtSlot()
+    def hide_output_panel(self):
+        self.output_panel.hide()
+        self.lay_out_document()
+
+    @pyqtSlot(bool)
+    def set_outline_panel_shown(self, is_shown):
+        self.outline_panel.setVisible(is_shown)
+        self.lay_out_document()
+
+    @pyqtSlot()
+    def hide_outline_panel(self):
+        self.show_outline_action.setChecked(False)
+
+    @pyqtSlot()
+    def update_outline_panel(self):
+        self.outline_panel.set_outline(self.lexer.outline)
+
+    @pyqtSlot(object)
+    def go_to_symbol(self, entry):
+        """Moves the caret to the line `entry` is on now, unfolding whatever hides it."""
+
+        line = self.lexer.outline.get_line(entry)
+
+        if line < 0:
+            return
+
+        self.document.SendScintilla(QsciScintilla.SCI_ENSUREVISIBLEENFORCEPOLICY, line)
+        self.document.SendScintilla(QsciScintilla.SCI_GOTOLINE, line)
+
+        self.document.setFocus()
+
+    @pyqtSlot()
+    def fold_all(self):
+        self.document.SendScintilla(QsciScintilla.SCI_FOLDALL, QsciScintilla.SC_FOLDACTION_CONTRACT)
+
+    @pyqtSlot()
+    def unfold_all(self):
+        self.document.SendScintilla(QsciScintilla.SCI_FOLDALL, QsciScintilla.SC_FOLDACTION_EXPAND)
+
+    def set_up_output_panel(self):
+        self.OUTPUT_PANEL_HEIGHT: int = 300
+
+        self.code_runner = CodeRunner(self)
+
+        self.output_panel = OutputPanel(self, self._font)
+        self.output_panel.hide()
+
+        self.code_runner.started.connect(self.output_panel.start_run)
+        self.code_runner.output_received.connect(self.output_panel.append_output)
+        self.code_runner.finished.connect(self.output_panel.finish_run)
+
+        self.output_panel.stop_requested.connect(self.code_runner.cancel)
+        self.output_panel.hide_requested.connect(self.hide_output_panel)
+
+    def set_up_outline_panel(self):
+        self.OUTLINE_PANEL_WIDTH: int = 350
+
+        self.outline_panel = OutlinePanel(self, self._font)
+        self.outline_panel.hide()
+
+        self.outline_panel.set_outline(self.lexer.outline)
+
+        self.lexer.outline_changed.connect(self.update_outline_panel)
+
+        self.outline_panel.symbol_activated.connect(self.go_to_symbol)
+        self.outline_panel.hide_requested.connect(self.hide_outline_panel)
+
+    def set_up_quick_open(self):
+        self.project_indexer = get_project_indexer()
+
+        self.quick_open_dialog = QuickOpenDialog(self, self._font, self.project_indexer)
+        self.quick_open_dialog.file_chosen.connect(self.open_project_file)
+
     @pyqtSlot()
     def set_file_has_been_saved_variable_to_false(self):
         self.file_has_been_saved = False
@@ -312,11 +677,16 @@ class EssentialIDE(QWidget):
         """Makes the user interface (UI)."""
 
         self.file_has_been_saved = False
+        self.name_of_saved_file = None
+        self.encoding_of_saved_file = "utf-8"
 
-        self.style_sheet_path = Path(r"utilities\settings\stylesheets\code_editor_style.qss")
+        self.style_sheet_path = STYLESHEETS_DIRECTORY / "code_editor_style.qss"
         self.setStyleSheet(self.style_sheet_path.read_text())
 
         self.set_up_code_editor()
+        self.set_up_output_panel()
+        self.set_up_outline_panel()
+        self.set_up_quick_open()
 
         self.add_document_menu_bar_to_document()
         
@@ -324,6 +694,7 @@ class EssentialIDE(QWidget):
 
         self.add_file_menu_to_document()
         self.add_edit_menu_to_document()
+        self.add_view_menu_to_document()
         self.add_themes_menu_to_document()
 
         self.add_menu_items_to_menu_bar()
@@ -391,6 +762,7 @@ class EssentialIDE(QWidget):
 
         self.document_menu_bar.addMenu(self.file_menu)
         self.document_menu_bar.addMenu(self.edit_menu)
+        self.document_menu_bar.addMenu(self.view_menu)
         # self.document_menu_bar.addMenu(self.theme_menu)
 
     def define_menu_item_actions(self):
@@ -401,12 +773,26 @@ class EssentialIDE(QWidget):
         self.save_action = QAction("Save", self)
         self.load_action = QAction("Load", self)
         self.rename_action = QAction("Rename", self)
+        self.close_tab_action = QAction("Close Document", self)
+        self.open_project_action = QAction("Open Project...", self)
+        self.quick_open_action = QAction("Quick Open", self)
 
         self.change_to_dark_theme_action = QAction("Dark Theme", self)
         self.change_to_light_theme_action = QAction("Light Theme", self)
 
+        # Without shortcuts, the editor already binds Ctrl+X, Ctrl+C and Ctrl+V to the same range-based commands.
+        self.cut_action = QAction("Cut", self)
+        self.copy_action = QAction("Copy", self)
+        self.paste_action = QAction("Paste", self)
+
         # self.switch_to_coding_mode_action = QAction("Document Mode", self)
-        # self.run_code = QAction("Run Code", self)
+        self.run_code_action = QAction("Run Code", self)
+        self.stop_code_action = QAction("Stop Code", self)
+
+        self.show_outline_action = QAction("Outline", self)
+        self.show_outline_action.setCheckable(True)
+        self.fold_all_action = QAction("Fold All", self)
+        self.unfold_all_action = QAction("Unfold All", self)
 
         self.new_action.triggered.connect(self.new_application)
         self.new_action.setShortcut(QKeySequence("Ctrl+N"))
@@ -422,6 +808,18 @@ class EssentialIDE(QWidget):
         self.rename_action.triggered.connect(self.rename_while_in_document)
         self.rename_action.setShortcut(QKeySequence("Ctrl+R"))
 
+        self.close_tab_action.triggered.connect(self.close_current_tab)
+        self.close_tab_action.setShortcut(QKeySequence("Ctrl+W"))
+
+        self.open_project_action.triggered.connect(self.open_project)
+
+        self.quick_open_action.triggered.connect(self.show_quick_open_dialog)
+        self.quick_open_action.setShortcut(QKeySequence("Ctrl+P"))
+
+        self.cut_action.triggered.connect(self.cut)
+        self.copy_action.triggered.connect(self.copy)
+        self.paste_action.triggered.connect(self.paste)
+
         self.change_to_dark_theme_action.triggered.connect(self.add_dark_theme_for_code_editor)
 
         self.change_to_light_theme_action.triggered.connect(self.add_light_theme_for_code_editor)
@@ -429,7 +827,20 @@ class EssentialIDE(QWidget):
         # self.switch_to_coding_mode_action.triggered.connect(self.switch_coding_to_document_mode)
         # self.switch_to_coding_mode_action.setShortcut(QKeySequence("Ctrl+Alt+S"))
 
-        # self.run_code.triggered.connect(self.run_code_and_wait)
+        self.run_code_action.triggered.connect(self.run_code)
+        self.run_code_action.setShortcut(QKeySequence("F5"))
+
+        self.stop_code_action.triggered.connect(self.code_runner.cancel)
+        self.stop_code_action.setShortcut(QKeySequence("Shift+F5"))
+
+        self.show_outline_action.toggled.connect(self.set_outline_panel_shown)
+        self.show_outline_action.setShortcut(QKeySequence("Ctrl+Shift+O"))
+
+        self.fold_all_action.triggered.connect(self.fold_all)
+        self.fold_all_action.setShortcut(QKeySequence("Ctrl+Shift+["))
+
+        self.unfold_all_action.triggered.connect(self.unfold_all)
+        self.unfold_all_action.setShortcut(QKeySequence("Ctrl+Shift+]"))
 
     def get_all_modules_in_users_computer(self):
         pip_freeze_subprocess = subprocess.Popen(
@@ -453,6 +864,10 @@ class EssentialIDE(QWidget):
         self.file_menu.addSeparator()
         self.file_menu.addAction(self.save_action)
         self.file_menu.addAction(self.load_action)
+        self.file_menu.addAction(self.close_tab_action)
+        self.file_menu.addSeparator()
+        self.file_menu.addAction(self.open_project_action)
+        self.file_menu.addAction(self.quick_open_action)
         self.file_menu.addSeparator()
         self.file_menu.addAction(self.close_action)
 
@@ -465,7 +880,25 @@ class EssentialIDE(QWidget):
         self.edit_menu = QMenu("Edit")
 
         # self.edit_menu.addAction(self.switch_to_coding_mode_action)
-        # self.edit_menu.addAction(self.run_code)
+        self.edit_menu.addAction(self.cut_action)
+        self.edit_menu.addAction(self.copy_action)
+        self.edit_menu.addAction(self.paste_action)
+        self.edit_menu.addSeparator()
+        self.edit_menu.addAction(self.run_code_action)
+        self.edit_menu.addAction(self.stop_code_action)
+
+    def add_view_menu_to_document(self):
+        """
+        Creates `utilities.document.Document.view_menu` 
+        and binds aforementioned actions to the menu.
+        """
+
+        self.view_menu = QMenu("View")
+
+        self.view_menu.addAction(self.show_outline_action)
+        self.view_menu.addSeparator()
+        self.view_menu.addAction(self.fold_all_action)
+        self.view_menu.addAction(self.unfold_all_action)
 
     def add_themes_menu_to_document(self):
         self.theme_menu = QMenu("Themes")
@@ -475,53 +908,90 @@ class EssentialIDE(QWidget):
         self.theme_menu.addAction(self.change_to_dark_theme_action)
         self.theme_menu.addAction(self.change_to_light_theme_action)
 
-    def get_parameters_from_function(self, function_to_get_parameters_from):
-        return inspect.signature(function_to_get_parameters_from)
-    
-    def convert_string_to_function(self, string_to_convert_to_function):
-        return eval(string_to_convert_to_function)
+    def get_parameters_from_function(self, name_of_function):
+        """
+        Returns the signature of `name_of_function` (like `"os.path.join"`) from `self.introspection_pool`,
+        or `None` while it is being introspected in a worker process.
+        """
+
+        module_name, _, function_name = name_of_function.rpartition(".")
+
+        return self.introspection_pool.get_signature(module_name or "builtins", function_name)
+
+    @pyqtSlot()
+    def announce_autocompletion_apis_are_ready(self):
+        self.console_debug("AUTOCOMPLETION APIS READY.")
+
+    def update_symbol_index(self, position, modification_type, text, length, lines_added, *_):
+        """Re-reads only the lines touched by an insertion or deletion into `self.symbol_index`."""
+
+        if not modification_type & (QsciScintilla.SC_MOD_INSERTTEXT | QsciScintilla.SC_MOD_DELETETEXT):
+            return
+
+        first_line = self.document.SendScintilla(QsciScintilla.SCI_LINEFROMPOSITION, position)
+
+        number_of_old_lines = 1 + max(-lines_added, 0)
+        number_of_new_lines = 1 + max(lines_added, 0)
+
+        self.symbol_index.replace_lines(
+            first_line, number_of_old_lines, 
+            (self.document.text(line) for line in range(first_line, first_line + number_of_new_lines))
+        )
 
     def set_up_code_editor(self):
         self.TAB_WIDTH = 4
 
+        self.DOCUMENT_X: int = 10
+        self.DOCUMENT_Y: int = 105
+
+        self.DOCUMENT_WIDTH: int = 1917
+        self.DOCUMENT_HEIGHT: int = 978
+
+        self.TAB_BAR_Y: int = 75
+
         self.document = QsciScintilla(self)
 
-        self.document.setFixedSize(1917, 1008)
-        self.document.move(10, 75)
+        self.document.setFixedSize(self.DOCUMENT_WIDTH, self.DOCUMENT_HEIGHT)
+        self.document.move(self.DOCUMENT_X, self.DOCUMENT_Y)
 
         self.lexer = PythonLexer(self)
 
-        self.function_autocompletion_image = QPixmap(r"assets\images\function_type_for_code_editor.png")
+        self.function_autocompletion_image = QPixmap(str(ASSETS_DIRECTORY / "images" / "function_type_for_code_editor.png"))
         self.document.registerImage(1, self.function_autocompletion_image)
 
-        self.module_autocompletion_image = QPixmap(r"assets\images\module_type_for_code_editor.png")
+        self.module_autocompletion_image = QPixmap(str(ASSETS_DIRECTORY / "images" / "module_type_for_code_editor.png"))
         self.document.registerImage(2, self.module_autocompletion_image)
 
-        self.keyword_autocompletion_image = QPixmap(r"assets\images\keyword_type_for_code_editor.png")
+        self.keyword_autocompletion_image = QPixmap(str(ASSETS_DIRECTORY / "images" / "keyword_type_for_code_editor.png"))
         self.document.registerImage(3, self.keyword_autocompletion_image)
 
-        self.modules_installed_on_computer = [module.name for module in pkgutil.iter_modules()]
+        self.module_index = get_module_index()
 
-        self.api = QsciAPIs(self.lexer)
-        self.built_in_functions = dir(builtins) + list(keyword.kwlist)
+        self.symbol_index = BufferSymbolIndex()
+        self.document.SCN_MODIFIED.connect(self.update_symbol_index)
 
-        for built_in_function in self.built_in_functions:
-            if keyword.iskeyword(built_in_function):
-                self.api.add(f"{built_in_function}?3")
-            else:
-                self.api.add(built_in_function)
+        self.introspection_pool = get_introspection_pool()
 
-        for module in self.modules_installed_on_computer:
-            self.api.add(f"{module}?2")
+        self.api = BufferAwareAPIs(self.lexer, self.symbol_index, self.introspection_pool)
 
-        self.api.prepare()
+        self.api_preparation = APIPreparation(self.api, self.module_index)
+        self.api_preparation.ready.connect(self.announce_autocompletion_apis_are_ready)
 
         self.document.setLexer(self.lexer)
         self.document.setFont(self._font)
         self.document.setUtf8(True)
 
+        if LAZY_STYLING_ENABLED:
+            self.lazy_styler = LazyStyler(self.document, self.lexer)
+
+        if DIAGNOSTICS_ENABLED:
+            self.diagnostics_engine = DiagnosticsEngine(self.document)
+
         self.document.setIndentationsUseTabs(True)
         self.document.setIndentationGuides(True)
+
+        # Fold levels come from the lexer, set as it styles.
+        self.document.setFolding(QsciScintilla.BoxedTreeFoldStyle)
         self.document.setTabWidth(self.TAB_WIDTH)
 
         self.document.setMarginType(1, QsciScintilla.NumberMargin)
@@ -530,9 +1000,25 @@ class EssentialIDE(QWidget):
 
         self.document.setAutoCompletionCaseSensitivity(False)
         self.document.setAutoCompletionReplaceWord(False)
-        self.document.setAutoCompletionSource(QsciScintilla.AcsAll)
+        # Buffer symbols come from `self.symbol_index`, so the document is never rescanned for words.
+        self.document.setAutoCompletionSource(QsciScintilla.AcsAPIs)
         self.document.setAutoCompletionThreshold(1)
 
+        self.api_preparation.start()
+
+        self.edit_commands = EditCommands(self.document, self.clipboard)
+
+        # One thread writes the journals of every tab.
+        self.journal_writer = JournalWriter()
+        self.journal_writer.start()
+
+        self.edit_journal = EditJournal(self.document, self.journal_writer)
+        self.edit_journal.open()
+
+        self.set_up_tab_bar()
+
+        QTimer.singleShot(0, self.offer_untitled_recovery)
+
         self.document.setCallTipsStyle(QsciScintilla.CallTipsContext)
         self.document.setCallTipsVisible(0)
         self.document.setCallTipsPosition(QsciScintilla.CallTipsBelowText)
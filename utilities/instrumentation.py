@@ -0,0 +1,226 @@
+"""
+Spans, counters and histograms for the hot paths: lexing, completion, loading and saving. \\
+Disabled, `get_instrumentation` hands out a `NullInstrumentation` whose methods do nothing,
+so instrumented code pays for a method call and records nothing. \\
+Enabled, everything recorded is exported on exit as a Chrome trace (for `chrome://tracing` or Perfetto)
+and a JSON snapshot of the metrics. \\
+Kept free of `PyQt5`, and safe to record into from the lexing thread.
+"""
+
+from utilities.settings.essential_settings import (
+    INSTRUMENTATION_ENABLED, INSTRUMENTATION_DIRECTORY, INSTRUMENTATION_MAXIMUM_SPANS
+)
+
+from contextlib import nullcontext
+from collections import deque
+
+import logging
+
+import os
+import json
+import math
+import time
+import atexit
+import threading
+
+logger = logging.getLogger("pysee.instrumentation")
+
+_instrumentation = None
+
+# Entered and left by every span of a disabled instrumentation, without allocating.
+NULL_SPAN = nullcontext()
+
+
+class Histogram:
+    """Counts values in power-of-two buckets, so percentiles are estimated in constant memory."""
+
+    __slots__ = ("count", "total", "minimum", "maximum", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+        # Exponent of the upper bound of a bucket, as given by `math.frexp`, to the number of values in it.
+        self.buckets = {}
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+        exponent = math.frexp(value)[1] if value > 0 else None
+
+        self.buckets[exponent] = self.buckets.get(exponent, 0) + 1
+
+    def get_percentile(self, percentile: float) -> float:
+        """Returns the (exclusive) upper bound of the bucket holding `percentile`, capped at the largest value seen."""
+
+        rank = max(math.ceil(percentile / 100 * self.count), 1)
+        seen = self.buckets.get(None, 0)
+
+        if seen >= rank:
+            return 0.0
+
+        for exponent in sorted(exponent for exponent in self.buckets if exponent is not None):
+            seen += self.buckets[exponent]
+
+            if seen >= rank:
+                return min(math.ldexp(1.0, exponent), self.maximum)
+
+        return self.maximum
+
+    def get_summary(self) -> dict:
+        if not self.count:
+            return {"count": 0}
+
+        return {
+            "count": self.count, "total": self.total, "mean": self.total / self.count,
+            "minimum": self.minimum, "maximum": self.maximum,
+            "p50": self.get_percentile(50), "p90": self.get_percentile(90), "p99": self.get_percentile(99)
+        }
+
+
+class Span:
+    """Times a `with` block and records it on exit, along with its arguments."""
+
+    __slots__ = ("instrumentation", "name", "arguments", "start")
+
+    def __init__(self, instrumentation, name: str, arguments: dict) -> None:
+        self.instrumentation = instrumentation
+        self.name = name
+        self.arguments = arguments
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+
+        return self
+
+    def __exit__(self, *_):
+        self.instrumentation.record_span(self.name, self.start, time.perf_counter_ns() - self.start, self.arguments)
+
+        return False
+
+
+class NullInstrumentation:
+    """What instrumented code talks to while instrumentation is disabled."""
+
+    enabled = False
+
+    def span(self, name: str, **arguments):
+        return NULL_SPAN
+
+    def count(self, name: str, amount: int = 1) -> None:
+        pass
+
+    def observe(self, name: str, value: float) -> None:
+        pass
+
+
+class Instrumentation:
+    """
+    Records spans, counters and histograms from any thread. \\
+    Only the latest `INSTRUMENTATION_MAXIMUM_SPANS` spans are kept for the trace,
+    but every span's duration goes into the histogram of its name.
+    """
+
+    enabled = True
+
+    def __init__(self, maximum_spans: int = INSTRUMENTATION_MAXIMUM_SPANS) -> None:
+        self.start_time = time.perf_counter_ns()
+
+        # (name, start, duration in nanoseconds, thread, arguments)
+        self.spans = deque(maxlen=maximum_spans)
+
+        self.counters = {}
+        self.histograms = {}
+
+        self.lock = threading.Lock()
+
+    def console_debug(self, message, *arguments):
+        logger.debug(message, *arguments)
+
+    def span(self, name: str, **arguments) -> Span:
+        return Span(self, name, arguments)
+
+    def record_span(self, name: str, start: int, duration: int, arguments: dict) -> None:
+        self.spans.append((name, start, duration, threading.get_ident(), arguments))
+
+        self.observe(f"{name}.seconds", duration / 1e9)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name: str, value: float) -> None:
+        with self.lock:
+            histogram = self.histograms.get(name)
+
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+
+            histogram.observe(value)
+
+    def get_snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "counters": dict(self.counters),
+                "histograms": {name: histogram.get_summary() for name, histogram in self.histograms.items()}
+            }
+
+    def get_chrome_trace(self) -> dict:
+        """Returns the spans as complete events of the Chrome trace event format, in microseconds."""
+
+        process_id = os.getpid()
+
+        events = [
+            {
+                "name": name, "cat": name.split(".")[0], "ph": "X", "pid": process_id, "tid": thread,
+                "ts": (start - self.start_time) / 1000, "dur": duration / 1000, "args": arguments
+            }
+            for name, start, duration, thread, arguments in list(self.spans)
+        ]
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, directory=INSTRUMENTATION_DIRECTORY) -> None:
+        """Writes the Chrome trace and the metrics snapshot, named after the process and the time."""
+
+        name = f"{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+
+            with open(directory / f"trace_{name}.json", "w", encoding="utf-8") as file:
+                json.dump(self.get_chrome_trace(), file, default=str)
+
+            with open(directory / f"metrics_{name}.json", "w", encoding="utf-8") as file:
+                json.dump(self.get_snapshot(), file, indent=4)
+        except OSError as error:
+            logger.warning("INSTRUMENTATION NOT EXPORTED: %s", error)
+
+            return
+
+        self.console_debug("INSTRUMENTATION EXPORTED TO %s", directory)
+
+
+def get_instrumentation():
+    """
+    Returns the instrumentation shared by the whole process, enabled by `INSTRUMENTATION_ENABLED`
+    or the `PYSEE_INSTRUMENTATION` environment variable.
+    """
+
+    global _instrumentation
+
+    if _instrumentation is None:
+        if INSTRUMENTATION_ENABLED or os.environ.get("PYSEE_INSTRUMENTATION"):
+            _instrumentation = Instrumentation()
+
+            atexit.register(_instrumentation.export)
+        else:
+            _instrumentation = NullInstrumentation()
+
+    return _instrumentation
@@ -0,0 +1,150 @@
+"""A pool of pre-started interpreters for running code without paying for startup, powered by `PyQt5.QtCore.QProcess`."""
+
+from PyQt5.QtCore import QObject, QProcess, QProcessEnvironment, QCoreApplication, pyqtSlot
+
+from utilities.settings.essential_settings import (
+    INTERPRETER_POOL_SIZE,
+    INTERPRETER_POOL_PRELOADED_MODULES, INTERPRETER_POOL_MEMORY_LIMIT_MEGABYTES
+)
+
+from collections import deque
+from pathlib import Path
+
+import logging
+
+import sys
+import json
+
+logger = logging.getLogger("pysee.running")
+
+_interpreter_pool = None
+
+
+class InterpreterPool(QObject):
+    """
+    Keeps `INTERPRETER_POOL_SIZE` interpreters running `utilities/warm_interpreter.py`,
+    with the preloaded modules already imported, once the first program is run. \\
+    Every interpreter runs a single program and exits, so each run starts clean;
+    a replacement is started as soon as one is taken. \\
+    The address space of an interpreter stays capped at `INTERPRETER_POOL_MEMORY_LIMIT_MEGABYTES` while its program runs,
+    unlike a cold interpreter's, a program that needs more gets a `MemoryError` unless it raises its soft limit. \\
+    Inherits `PyQt5.QtCore.QObject`.
+    """
+    def __init__(self) -> None:
+        super(InterpreterPool, self).__init__()
+
+        self.SIZE: int = INTERPRETER_POOL_SIZE
+        self.PRELOADED_MODULES: tuple = INTERPRETER_POOL_PRELOADED_MODULES
+        self.MEMORY_LIMIT_MEGABYTES: int = INTERPRETER_POOL_MEMORY_LIMIT_MEGABYTES
+
+        self.BOOTSTRAP_PATH = str(Path(__file__).with_name("warm_interpreter.py"))
+
+        self.MAXIMUM_IDLE_DEATHS: int = 3 * self.SIZE
+
+        self.idle_processes = deque()
+        self.idle_deaths = 0
+
+    def console_debug(self, message, *arguments):
+        logger.debug(message, *arguments)
+
+    @pyqtSlot()
+    def fill(self):
+        while len(self.idle_processes) < self.SIZE:
+            self.idle_processes.append(self.start_interpreter())
+
+    def start_interpreter(self) -> QProcess:
+        process = QProcess(self)
+
+        environment = QProcessEnvironment.systemEnvironment()
+        environment.insert("PYTHONUNBUFFERED", "1")
+        environment.insert("PYTHONIOENCODING", "utf-8")
+
+        process.setProcessEnvironment(environment)
+
+        # An interpreter that dies while idle, say at a failing preload, is replaced.
+        process.finished.connect(self.replace_dead_interpreter)
+
+        process.start(sys.executable, [
+            "-u", self.BOOTSTRAP_PATH,
+            ",".join(self.PRELOADED_MODULES), str(self.MEMORY_LIMIT_MEGABYTES)
+        ])
+
+        return process
+
+    @pyqtSlot()
+    def replace_dead_interpreter(self):
+        process = self.sender()
+
+        if process in self.idle_processes:
+            self.console_debug("WARM INTERPRETER EXITED WHILE IDLE: %r", bytes(process.readAllStandardError()))
+
+            self.idle_processes.remove(process)
+            process.deleteLater()
+
+            self.idle_deaths += 1
+
+            # Interpreters that keep dying are not restarted forever, runs then start cold.
+            if self.idle_deaths <= self.MAXIMUM_IDLE_DEATHS:
+                self.fill()
+
+    def take(self, file_name: str, working_directory: str, script_directory, parent: QObject):
+        """
+        Hands a warm interpreter to `parent` and has it run `file_name`,
+        importing from `script_directory` first if given, else from the directory of `file_name`. \\
+        Returns the running `PyQt5.QtCore.QProcess`, or `None` if no interpreter is ready.
+        """
+
+        while self.idle_processes:
+            process = self.idle_processes.popleft()
+
+            if process.state() != QProcess.NotRunning:
+                break
+
+            process.deleteLater()
+        else:
+            self.fill()
+
+            return None
+
+        process.finished.disconnect(self.replace_dead_interpreter)
+        process.setParent(parent)
+
+        self.idle_deaths = 0
+
+        request = {
+            "file_name": file_name, "working_directory": working_directory, "script_directory": script_directory
+        }
+
+        process.write(json.dumps(request).encode("utf-8") + b"\n")
+
+        # There is no console to type into, so `input()` gets an end of file instead of hanging.
+        process.closeWriteChannel()
+
+        self.fill()
+
+        return process
+
+    @pyqtSlot()
+    def shut_down(self):
+        while self.idle_processes:
+            process = self.idle_processes.popleft()
+
+            process.finished.disconnect(self.replace_dead_interpreter)
+            process.kill()
+            process.waitForFinished(1000)
+
+
+def get_interpreter_pool() -> InterpreterPool:
+    """
+    Returns the interpreter pool shared by every window. \\
+    No interpreter is started until the first program is run, which itself runs cold.
+    """
+
+    global _interpreter_pool
+
+    if _interpreter_pool is None:
+        _interpreter_pool = InterpreterPool()
+
+        QCoreApplication.instance().aboutToQuit.connect(_interpreter_pool.shut_down)
+
+    return _interpreter_pool
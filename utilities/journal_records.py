@@ -0,0 +1,99 @@
+"""
+The on-disk format of edit journals, kept free of `PyQt5`. \\
+A journal is a header naming the saved file it starts from,
+followed by append-only insert, delete and snapshot records, each with a checksum
+so a record torn by a crash is detected and everything before it is still recovered.
+"""
+
+import io
+import json
+import zlib
+import struct
+
+JOURNAL_MAGIC = b"PYSEE-JOURNAL-1\n"
+
+INSERT_RECORD = 1
+DELETE_RECORD = 2
+SNAPSHOT_RECORD = 3
+
+RECORD_FIELDS = struct.Struct("<BQQ")
+RECORD_CHECKSUM = struct.Struct("<I")
+
+
+def encode_header(base: dict) -> bytes:
+    """
+    Returns the header of a journal starting from `base`,
+    like `{"path": ..., "size": ..., "modification_time": ...}` of the saved file.
+    """
+
+    return JOURNAL_MAGIC + json.dumps(base).encode("utf-8") + b"\n"
+
+
+def encode_record(kind: int, position: int, length: int, payload: bytes = b"") -> bytes:
+    """
+    Returns a record: an insertion of `payload` at `position`, a deletion of `length` bytes at `position`,
+    or a snapshot of the whole text in `payload`.
+    """
+
+    fields = RECORD_FIELDS.pack(kind, position, length)
+
+    return fields + RECORD_CHECKSUM.pack(zlib.crc32(payload, zlib.crc32(fields))) + payload
+
+
+def read_journal(file) -> tuple:
+    """
+    Reads a journal from the binary `file`. \\
+    Returns `(base, records)` with records as `(kind, position, length, payload)` tuples,
+    stopping at the first incomplete or corrupt record. \\
+    Raises `ValueError` if `file` isn't a journal.
+    """
+
+    if file.read(len(JOURNAL_MAGIC)) != JOURNAL_MAGIC:
+        raise ValueError("not an edit journal")
+
+    base = json.loads(file.readline())
+
+    start_of_records = file.tell()
+    end_of_file = file.seek(0, io.SEEK_END)
+    file.seek(start_of_records)
+
+    records = []
+
+    while True:
+        fields = file.read(RECORD_FIELDS.size)
+        checksum = file.read(RECORD_CHECKSUM.size)
+
+        if len(fields) < RECORD_FIELDS.size or len(checksum) < RECORD_CHECKSUM.size:
+            break
+
+        kind, position, length = RECORD_FIELDS.unpack(fields)
+
+        if kind not in (INSERT_RECORD, DELETE_RECORD, SNAPSHOT_RECORD):
+            break
+
+        if kind == DELETE_RECORD:
+            payload = b""
+        else:
+            # A corrupt length could be anything, it must not be allocated before it is known to fit in the file.
+            if length > end_of_file - file.tell():
+                break
+
+            payload = file.read(length)
+
+        if len(payload) < length and kind != DELETE_RECORD \
+        or RECORD_CHECKSUM.unpack(checksum)[0] != zlib.crc32(payload, zlib.crc32(fields)):
+            break
+
+        records.append((kind, position, length, payload))
+
+    return base, records
+
+
+def get_records_to_replay(records: list) -> list:
+    """Returns the records from the last snapshot on, which is all a replay needs."""
+
+    for index in range(len(records) - 1, -1, -1):
+        if records[index][0] == SNAPSHOT_RECORD:
+            return records[index:]
+
+    return records
@@ -0,0 +1,77 @@
+"""Viewport-first styling for `utilities.lexers.lexer_ide.PythonLexer`, powered by `PyQt5` and `Qsci`."""
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSlot
+from PyQt5.Qsci import QsciScintilla
+
+from utilities.settings.essential_settings import (
+    LAZY_STYLING_LOOKAHEAD_LINES, LAZY_STYLING_SLICE_LINES, LAZY_STYLING_SLICE_MILLISECONDS
+)
+
+from utilities.scintilla_buffer import get_position_from_line
+
+import time
+
+
+class LazyStyler(QObject):
+    """
+    Styles the visible lines of a `PyQt5.Qsci.QsciScintilla` and a lookahead margin right away,
+    then fills in the rest of the document in idle-time slices. \\
+    Inherits `PyQt5.QtCore.QObject`.
+    """
+    def __init__(self, editor: QsciScintilla, lexer) -> None:
+        super(LazyStyler, self).__init__(editor)
+
+        self.editor = editor
+        self.lexer = lexer
+
+        self.LOOKAHEAD_LINES: int = LAZY_STYLING_LOOKAHEAD_LINES
+        self.SLICE_LINES: int = LAZY_STYLING_SLICE_LINES
+        self.SLICE_SECONDS: float = LAZY_STYLING_SLICE_MILLISECONDS / 1000
+
+        # A zero interval timer only fires once the event loop has nothing else to do.
+        self.fill_timer = QTimer(self)
+        self.fill_timer.setInterval(0)
+        self.fill_timer.timeout.connect(self.fill_next_slice)
+
+        self.editor.verticalScrollBar().valueChanged.connect(self.style_viewport)
+        self.editor.textChanged.connect(self.start_filling)
+        self.lexer.style_runs_applied.connect(self.start_filling)
+
+    @pyqtSlot()
+    def style_viewport(self):
+        """
+        Styles the visible lines plus the lookahead margin now,
+        ahead of the background fill.
+        """
+
+        first_visible_line = self.editor.SendScintilla(QsciScintilla.SCI_GETFIRSTVISIBLELINE)
+        lines_on_screen = self.editor.SendScintilla(QsciScintilla.SCI_LINESONSCREEN)
+
+        last_line = self.editor.SendScintilla(
+            QsciScintilla.SCI_DOCLINEFROMVISIBLE, first_visible_line + lines_on_screen
+        ) + self.LOOKAHEAD_LINES
+
+        end_of_viewport = get_position_from_line(self.editor, last_line + 1)
+        end_styled = self.editor.SendScintilla(QsciScintilla.SCI_GETENDSTYLED)
+
+        if end_styled < end_of_viewport:
+            self.editor.SendScintilla(QsciScintilla.SCI_COLOURISE, end_styled, end_of_viewport)
+
+        self.start_filling()
+
+    @pyqtSlot()
+    def start_filling(self):
+        if not self.fill_timer.isActive():
+            self.fill_timer.start()
+
+    @pyqtSlot()
+    def fill_next_slice(self):
+        """Styles slices of lines until the time budget of one idle tick runs out."""
+
+        deadline = time.perf_counter() + self.SLICE_SECONDS
+
+        while time.perf_counter() < deadline:
+            if not self.lexer.style_next_lines(self.SLICE_LINES):
+                self.fill_timer.stop()
+
+                return
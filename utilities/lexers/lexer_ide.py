@@ -1,27 +1,37 @@
-import re
-
-import keyword
-
 import logging
 
 from PyQt5.QtGui import QFont, QColor
-from PyQt5.QtCore import QObject
-
-from PyQt5.Qsci import QsciLexerCustom
+from PyQt5.QtCore import QObject, QThread, QCoreApplication, pyqtSignal, pyqtSlot
 
-from utilities.settings.essential_settings import DEBUGGING_MODE
+from PyQt5.Qsci import QsciLexerCustom, QsciScintilla
 
-import pkgutil
-import builtins
+from utilities.settings.essential_settings import (
+    LAZY_STYLING_ENABLED, LEXING_WORKER_ENABLED, 
+    LAZY_STYLING_LOOKAHEAD_LINES, LAZY_STYLING_MAXIMUM_SYNCHRONOUS_LINES, LEXER_VERIFICATION_SAMPLING_INTERVAL
+)
 
-logging.basicConfig(
-    level=logging.DEBUG, 
-    format="%(levelname)s on %(asctime)s in %(filename)s; %(message)s", 
-    datefmt="%d/%m/%Y, %I:%M:%S %p"
+from utilities.lexers.lexing_worker import LexingWorker
+from utilities.lexers.python_tokenizer import (
+    PythonTokenizer, DEFAULT_LINE_STATE, NO_INDENTATION,
+    REGULAR_STYLE_ID, KEYWORD_STYLE_ID, FUNCTION_STYLE_ID, COMMENT_STYLE_ID, 
+    OPERATOR_STYLE_ID, BRACKETS_STYLE_ID, MODULE_STYLE_ID, STRING_STYLE_ID
 )
 
+from utilities.lexers.outline import Outline
+from utilities.scintilla_buffer import read_bytes, get_position_from_line
+from utilities.module_index import get_module_index
+from utilities.instrumentation import get_instrumentation
+
+logger = logging.getLogger("pysee.lexing")
+
 
 class PythonLexer(QsciLexerCustom):
+    # Revision, first line, UTF-8 snapshot, line end offsets and the state before the first line.
+    style_runs_requested = pyqtSignal(int, int, object, object, int)
+    style_runs_applied = pyqtSignal()
+    outline_changed = pyqtSignal()
+    module_index_refreshed = pyqtSignal()
+
     def __init__(self, parent: QObject | None = ...) -> None:
         super(PythonLexer, self).__init__(parent)
 
@@ -29,27 +39,60 @@ class PythonLexer(QsciLexerCustom):
         self.setDefaultPaper(QColor("#f91d1c1c"))
         self.setDefaultFont(QFont("Consolas", 14))
 
-        self.REGULAR_STYLE_ID = 0
-        self.KEYWORD_STYLE_ID = 1
-        self.FUNCTION_STYLE_ID = 2
-        self.COMMENT_STYLE_ID = 3
-        self.OPERATOR_STYLE_ID = 4
-        self.BRACKETS_STYLE_ID = 5
-        self.MODULE_STYLE_ID = 6
+        self.REGULAR_STYLE_ID = REGULAR_STYLE_ID
+        self.KEYWORD_STYLE_ID = KEYWORD_STYLE_ID
+        self.FUNCTION_STYLE_ID = FUNCTION_STYLE_ID
+        self.COMMENT_STYLE_ID = COMMENT_STYLE_ID
+        self.OPERATOR_STYLE_ID = OPERATOR_STYLE_ID
+        self.BRACKETS_STYLE_ID = BRACKETS_STYLE_ID
+        self.MODULE_STYLE_ID = MODULE_STYLE_ID
+        self.STRING_STYLE_ID = STRING_STYLE_ID
+
+        self.module_index = get_module_index()
+
+        self.tokenizer = PythonTokenizer(self.module_index.modules)
+
+        self.module_index.add_listener(self.announce_module_index_refresh)
+        self.module_index_refreshed.connect(self.restyle_for_new_modules)
+
+        # Lines `[0, lexed_line_count)` hold trustworthy styles and line states, 
+        # except for the lines `[first edited line, dirty_line_limit)`.
+        self.lexed_line_count = 0
+        self.dirty_line_limit = 0
+
+        # Filled in with fold levels by every styling pass, for the lines it styles.
+        self.outline = Outline()
+
+        self.MAXIMUM_FOLD_INDENTATION = QsciScintilla.SC_FOLDLEVELNUMBERMASK - QsciScintilla.SC_FOLDLEVELBASE
+
+        self.lazy_styling_enabled = LAZY_STYLING_ENABLED
+
+        # Bumped on every insertion or deletion, so stale worker results can be told apart.
+        self.document_revision = 0
+        self.pending_style_request = None
+
+        self.lexing_worker_enabled = LEXING_WORKER_ENABLED
+
+        if self.lexing_worker_enabled:
+            self.lexing_thread = QThread(self)
+
+            self.lexing_worker = LexingWorker(self.tokenizer)
+            self.lexing_worker.moveToThread(self.lexing_thread)
 
-        self.ARITHMETIC_OPERATORS = ["+", "-", "*", "/", "//", "**", "%", "="]
-        self.BITWISE_OPERATORS = ["&", "|", "^", "~", "<<", ">>"]
-        self.CONDITIONAL_OPERATORS = ["==", "!=", "<=", ">="]
+            self.style_runs_requested.connect(self.lexing_worker.lex_snapshot)
+            self.lexing_worker.style_runs_ready.connect(self.apply_worker_style_runs)
 
-        self.BRACKETS = ["(", ")", "{", "}", "[", "]"]
+            self.lexing_thread.start()
 
-        self.ALL_OPERATIONS = self.ARITHMETIC_OPERATORS \
-        + self.CONDITIONAL_OPERATORS \
-        + self.BITWISE_OPERATORS
+            QCoreApplication.instance().aboutToQuit.connect(self.stop_lexing_worker)
 
-        self.MODULES_INSTALLED_ON_COMPUTER = [module.name for module in pkgutil.iter_modules()]
+        self.LAZY_STYLING_LOOKAHEAD_LINES = LAZY_STYLING_LOOKAHEAD_LINES
+        self.LAZY_STYLING_MAXIMUM_SYNCHRONOUS_LINES = LAZY_STYLING_MAXIMUM_SYNCHRONOUS_LINES
 
-        self.BUILT_IN_FUNCTIONS = dir(builtins)
+        self.instrumentation = get_instrumentation()
+
+        self.VERIFICATION_SAMPLING_INTERVAL = LEXER_VERIFICATION_SAMPLING_INTERVAL
+        self.number_of_styling_passes = 0
 
         self.setColor(QColor("#FFFFFF"), self.REGULAR_STYLE_ID)
         self.setColor(QColor("#0000FF"), self.KEYWORD_STYLE_ID)
@@ -58,6 +101,7 @@ class PythonLexer(QsciLexerCustom):
         self.setColor(QColor("#FF8000"), self.OPERATOR_STYLE_ID)
         self.setColor(QColor("#FF00FF"), self.BRACKETS_STYLE_ID)
         self.setColor(QColor("#FFBF00"), self.MODULE_STYLE_ID)
+        self.setColor(QColor("#00FFFF"), self.STRING_STYLE_ID)
 
         self.setFont(QFont("Consolas", 14, weight=QFont.Bold), self.REGULAR_STYLE_ID)
         self.setFont(QFont("Consolas", 14, weight=QFont.Bold), self.KEYWORD_STYLE_ID)
@@ -66,10 +110,10 @@ class PythonLexer(QsciLexerCustom):
         self.setFont(QFont("Consolas", 14, weight=QFont.Bold), self.OPERATOR_STYLE_ID)
         self.setFont(QFont("Consolas", 14, weight=QFont.Bold), self.BRACKETS_STYLE_ID)
         self.setFont(QFont("Consolas", 14, weight=QFont.Bold), self.MODULE_STYLE_ID)
+        self.setFont(QFont("Consolas", 14, weight=QFont.Bold), self.STRING_STYLE_ID)
 
-    def console_debug(self, message):
-        if DEBUGGING_MODE:
-            logging.debug(message)
+    def console_debug(self, message, *arguments):
+        logger.debug(message, *arguments)
 
     def description(self, style: int) -> str:
         if style == self.REGULAR_STYLE_ID:
@@ -86,56 +130,412 @@ class PythonLexer(QsciLexerCustom):
             return "brackets_style"
         elif style == self.MODULE_STYLE_ID:
             return "module_style"
+        elif style == self.STRING_STYLE_ID:
+            return "string_style"
         else:
             return ""
 
+    def setEditor(self, editor) -> None:
+        """
+        Attaches the lexer to `editor`, 
+        tracking its modifications to know which lines are dirty.
+        """
+
+        previous_editor = self.editor()
+
+        if previous_editor is not None:
+            previous_editor.SCN_MODIFIED.disconnect(self.track_modified_lines)
+
+        super(PythonLexer, self).setEditor(editor)
+
+        self.lexed_line_count = 0
+        self.dirty_line_limit = 0
+
+        if editor is not None:
+            editor.SCN_MODIFIED.connect(self.track_modified_lines)
+
+    def track_modified_lines(self, position, modification_type, text, length, lines_added, *_):
+        """
+        Shifts the lexed line bookkeeping when text is inserted or deleted, 
+        and marks the edited lines as dirty.
+        """
+
+        if not modification_type & (QsciScintilla.SC_MOD_INSERTTEXT | QsciScintilla.SC_MOD_DELETETEXT):
+            return
+
+        self.document_revision += 1
+
+        modified_line = self.editor().SendScintilla(QsciScintilla.SCI_LINEFROMPOSITION, position)
+
+        if lines_added:
+            outline_revision = self.outline.revision
+
+            # Lines inserted at the start of a line push its definition down along with it.
+            if lines_added > 0 and position == self.editor().SendScintilla(
+                QsciScintilla.SCI_POSITIONFROMLINE, modified_line
+            ):
+                self.outline.shift_lines(modified_line - 1, lines_added)
+            else:
+                self.outline.shift_lines(modified_line, lines_added)
+
+            if self.outline.revision != outline_revision:
+                self.outline_changed.emit()
+
+        if self.lexed_line_count > modified_line:
+            self.lexed_line_count = max(modified_line, self.lexed_line_count + lines_added)
+
+        if self.dirty_line_limit > modified_line:
+            self.dirty_line_limit = max(modified_line, self.dirty_line_limit + lines_added)
+
+        self.dirty_line_limit = max(self.dirty_line_limit, modified_line + max(lines_added, 0) + 1)
+
+    def get_document_state(self) -> tuple:
+        """Returns the bookkeeping of the shown document, to be restored when it is shown again."""
+
+        return (self.lexed_line_count, self.dirty_line_limit, self.outline)
+
+    def set_document_state(self, state: tuple) -> None:
+        """
+        Switches the bookkeeping to another document shown in the same editor, 
+        dropping the style runs still being lexed for the previous one.
+        """
+
+        self.lexed_line_count, self.dirty_line_limit, self.outline = state
+
+        self.document_revision += 1
+        self.pending_style_request = None
+
+        self.outline_changed.emit()
+
+    def announce_module_index_refresh(self) -> None:
+        # Refreshes happen on a background thread, the signal brings them back to this one.
+        self.module_index_refreshed.emit()
+
+    @pyqtSlot()
+    def restyle_for_new_modules(self):
+        """Rebuilds the name lookup table from the refreshed module index and restyles the document."""
+
+        self.tokenizer.set_module_names(self.module_index.modules)
+
+        editor = self.editor()
+
+        if editor is None:
+            return
+
+        self.lexed_line_count = 0
+        self.dirty_line_limit = 0
+
+        self.startStyling(0)
+        editor.viewport().update()
+
+    def get_line_state(self, line: int) -> int:
+        if line < 0:
+            return DEFAULT_LINE_STATE
+
+        return self.editor().SendScintilla(QsciScintilla.SCI_GETLINESTATE, line)
+
+    def set_line_state(self, line: int, state: int) -> None:
+        self.editor().SendScintilla(QsciScintilla.SCI_SETLINESTATE, line, state)
+
     def styleText(self, start: int, end: int) -> None:
-        self.startStyling(start)
-
-        # ! CHANGE IF ORIGINAL VARIABLE [code_editor.py] WAS CHANGED.
-        text = self.parent().document.text()[start:end]
-
-        regex_statement_for_syntax_highlighting = re.compile(r"\s+|\w+|\W")
-
-        # TODO Add regex statements for other statements.
-        # regex_statement_for_strings = re.compile("\".*\"")
-        # regex_statement_for_type_strings = re.compile(".+?\".*\"")
-
-        # regex_statement_for_functions = re.compile(r"def \w+\(\)")
-        # regex_statement_for_comments = re.compile(r"#.+")
-        # regex_statement_for_decorators = re.compile(r"@\w+")
-
-        tokens_for_syntax_highlighting = [
-            (token, len(bytearray(token, "utf-8"))) \
-            for token in regex_statement_for_syntax_highlighting.findall(text)
-        ]
-
-        for token in tokens_for_syntax_highlighting:
-            if token[0] in list(keyword.kwlist):
-                self.setStyling(token[1], self.KEYWORD_STYLE_ID)
-            elif token[0] in self.ALL_OPERATIONS:
-                self.setStyling(token[1], self.OPERATOR_STYLE_ID)
-            elif token[0] in self.BRACKETS:
-                self.setStyling(token[1], self.BRACKETS_STYLE_ID)
-            elif token[0] in self.MODULES_INSTALLED_ON_COMPUTER:
-                self.setStyling(token[1], self.MODULE_STYLE_ID)
-            elif token[0] in self.BUILT_IN_FUNCTIONS:
-                self.setStyling(token[1], self.FUNCTION_STYLE_ID)
-            elif re.search(r"#.+", token[0]):
-                self.setStyling(token[1], self.COMMENT_STYLE_ID)
+        """
+        Styles the lines covering `start` to `end`, starting from the line state 
+        saved for the previous line. Stops as soon as a line past the edited lines 
+        ends in the same state as before, since every line after it is still valid.
+        """
+
+        editor = self.editor()
+
+        if editor is None:
+            return
+
+        first_line = editor.SendScintilla(QsciScintilla.SCI_LINEFROMPOSITION, start)
+        last_line = editor.SendScintilla(QsciScintilla.SCI_LINEFROMPOSITION, max(start, end - 1))
+
+        if self.lazy_styling_enabled and last_line - first_line > self.LAZY_STYLING_MAXIMUM_SYNCHRONOUS_LINES:
+            # Jumped far past the lexed lines: only the viewport and its lookahead are styled now, 
+            # from a guessed state, and `utilities.lexers.lazy_styling.LazyStyler` fills in the rest.
+            lines_on_screen = editor.SendScintilla(QsciScintilla.SCI_LINESONSCREEN)
+
+            first_line = max(first_line, last_line - lines_on_screen - self.LAZY_STYLING_LOOKAHEAD_LINES)
+            last_line = min(last_line + self.LAZY_STYLING_LOOKAHEAD_LINES, editor.lines() - 1)
+
+            self.style_lines(first_line, last_line, DEFAULT_LINE_STATE)
+        else:
+            self.style_lines(first_line, last_line, self.get_line_state(first_line - 1))
+
+    def style_next_lines(self, number_of_lines: int) -> bool:
+        """
+        Styles up to `number_of_lines` lines past the ones that have already been lexed, 
+        without letting Scintilla forget about lines styled further down. \\
+        Returns `False` once the whole document has been lexed, 
+        or while the lexing worker is busy.
+        """
+
+        editor = self.editor()
+
+        if editor is None or self.pending_style_request is not None:
+            return False
+
+        end_styled = editor.SendScintilla(QsciScintilla.SCI_GETENDSTYLED)
+
+        if end_styled < get_position_from_line(editor, self.lexed_line_count):
+            # Edited lines come first, through the usual `styleText` path.
+            first_line = editor.SendScintilla(QsciScintilla.SCI_LINEFROMPOSITION, end_styled)
+            end_of_slice = get_position_from_line(editor, first_line + number_of_lines)
+
+            editor.SendScintilla(QsciScintilla.SCI_COLOURISE, end_styled, end_of_slice)
+
+            return True
+
+        if self.lexed_line_count >= editor.lines():
+            return False
+
+        first_line = self.lexed_line_count
+        last_line = min(first_line + number_of_lines, editor.lines()) - 1
+
+        self.style_lines(first_line, last_line, self.get_line_state(first_line - 1))
+
+        return True
+
+    def style_lines(self, first_line: int, last_line: int, state: int) -> None:
+        """
+        Styles the lines from `first_line` to `last_line`, starting from `state`, 
+        either right away or through the lexing worker.
+        """
+
+        editor = self.editor()
+
+        with self.instrumentation.span("lexer.style_lines", lines=last_line - first_line + 1):
+            start_of_range = get_position_from_line(editor, first_line)
+
+            line_ends = [
+                get_position_from_line(editor, line + 1) - start_of_range \
+                for line in range(first_line, last_line + 1)
+            ]
+
+            # Only the requested lines are read, as UTF-8 bytes, so run lengths need no re-encoding.
+            text = read_bytes(editor, start_of_range, start_of_range + line_ends[-1])
+
+            if self.lexing_worker_enabled:
+                self.request_style_runs(first_line, last_line, text, line_ends, state)
             else:
-                self.setStyling(token[1], self.REGULAR_STYLE_ID)
+                self.apply_style_runs(first_line, self.tokenizer.tokenize_lines(text, line_ends, state))
+
+    def request_style_runs(self, first_line, last_line, text, line_ends, state):
+        """Hands a snapshot of the lines to the lexing worker, unless it is already lexing them."""
+
+        request = (self.document_revision, first_line, last_line)
+
+        if self.pending_style_request == request:
+            return
+
+        self.pending_style_request = request
+        self.lexing_worker.latest_revision = self.document_revision
+
+        self.style_runs_requested.emit(self.document_revision, first_line, bytes(text), line_ends, state)
+
+    @pyqtSlot(int, int, object)
+    def apply_worker_style_runs(self, revision, first_line, lines):
+        """Applies the style runs of the lexing worker, unless the document changed since the snapshot."""
+
+        if self.pending_style_request is not None and self.pending_style_request[0] == revision:
+            self.pending_style_request = None
+
+        if revision != self.document_revision or self.editor() is None:
+            self.instrumentation.count("lexer.stale_style_runs")
+
+            return
+
+        with self.instrumentation.span("lexer.apply_style_runs", lines=len(lines)):
+            self.apply_style_runs(first_line, lines)
+
+        self.style_runs_applied.emit()
+
+    def apply_style_runs(self, first_line: int, lines) -> None:
+        """
+        Applies the `(runs, end state)` of consecutive lines from `first_line`, 
+        stopping early once the line states settle.
+        """
+
+        editor = self.editor()
+
+        end_styled = editor.SendScintilla(QsciScintilla.SCI_GETENDSTYLED)
+        start_of_range = get_position_from_line(editor, first_line)
+
+        self.startStyling(start_of_range)
+
+        self.number_of_styling_passes += 1
+
+        is_verified = bool(self.VERIFICATION_SAMPLING_INTERVAL) \
+        and self.number_of_styling_passes % self.VERIFICATION_SAMPLING_INTERVAL == 0
+
+        styled_length = 0
+
+        # Adjacent runs of the same style are merged, even across lines, into one `setStyling`.
+        pending_style = REGULAR_STYLE_ID
+        pending_length = 0
+
+        outline_revision = self.outline.revision
+
+        # The statement line before the styled ones, whose fold depends on the next statement.
+        statement_line, statement_indentation = self.get_previous_statement(first_line)
+
+        line = first_line - 1
+
+        for runs_of_line, state, indentation, definition in lines:
+            line += 1
+
+            if indentation != NO_INDENTATION:
+                indentation = min(indentation, self.MAXIMUM_FOLD_INDENTATION)
+
+                self.set_fold_levels(statement_line, statement_indentation, line, indentation, first_line, line)
+
+                # Made a header once the next statement is known to be indented deeper.
+                editor.SendScintilla(QsciScintilla.SCI_SETFOLDLEVEL, line, QsciScintilla.SC_FOLDLEVELBASE + indentation)
+
+                statement_line, statement_indentation = line, indentation
+
+            self.outline.set_line(line, indentation, definition)
+
+            for length, style in runs_of_line:
+                if style == pending_style:
+                    pending_length += length
+                else:
+                    if pending_length:
+                        self.setStyling(pending_length, pending_style)
+
+                    pending_style = style
+                    pending_length = length
+
+            if is_verified:
+                styled_length += sum(length for length, _ in runs_of_line)
+
+            previous_state = self.get_line_state(line)
+            self.set_line_state(line, state)
+
+            # `dirty_line_limit` is exclusive, the last edited line may already be the one that settles.
+            if line + 1 >= self.dirty_line_limit and line < self.lexed_line_count and state == previous_state:
+                if pending_length:
+                    self.setStyling(pending_length, pending_style)
+                    pending_length = 0
+
+                # Every line after this one still holds the styles of the last pass.
+                self.startStyling(get_position_from_line(editor, self.lexed_line_count))
+                self.dirty_line_limit = 0
+
+                break
+        else:
+            if first_line <= self.lexed_line_count:
+                self.lexed_line_count = max(self.lexed_line_count, line + 1)
+
+            # The empty line after a final newline is never styled, reaching the end of the text is enough.
+            if line + 1 >= self.dirty_line_limit or get_position_from_line(editor, line + 1) >= editor.length():
+                self.dirty_line_limit = 0
+
+            # Otherwise it keeps whatever definition was pushed down onto it when the text was replaced.
+            if line + 1 < editor.lines() and get_position_from_line(editor, line + 1) >= editor.length():
+                self.outline.set_line(line + 1, NO_INDENTATION, None)
+
+        if pending_length:
+            self.setStyling(pending_length, pending_style)
+
+        self.settle_fold_levels(statement_line, statement_indentation, first_line, line)
+
+        if self.outline.revision != outline_revision:
+            self.outline_changed.emit()
+
+        # Lines Scintilla already considered styled stay styled.
+        if editor.SendScintilla(QsciScintilla.SCI_GETENDSTYLED) < end_styled:
+            self.startStyling(end_styled)
+
+        self.instrumentation.count("lexer.lines_styled", line - first_line + 1)
+
+        if is_verified:
+            self.verify_styled_length(get_position_from_line(editor, line + 1) - start_of_range, styled_length)
+
+    def get_previous_statement(self, line: int) -> tuple:
+        """
+        Returns the last line before `line` that starts a statement and its indentation, read back from
+        the fold level an earlier pass gave it, or `(-1, 0)`.
+        """
+
+        statement_line = self.outline.find_previous_statement(line)
+
+        if statement_line < 0:
+            return -1, 0
+
+        return statement_line, self.get_fold_indentation(statement_line)
+
+    def get_fold_indentation(self, line: int) -> int:
+        level = self.editor().SendScintilla(QsciScintilla.SCI_GETFOLDLEVEL, line)
+
+        return (level & QsciScintilla.SC_FOLDLEVELNUMBERMASK) - QsciScintilla.SC_FOLDLEVELBASE
+
+    def set_fold_levels(
+        self, statement_line: int, indentation: int, next_statement_line: int, next_indentation: int,
+        first_styled_line: int, last_styled_line: int
+    ) -> None:
+        """
+        Sets the fold levels of a statement line and of the lines up to the next statement,
+        making it a fold header when the next statement is indented deeper. \\
+        The lines in between fold along with the deeper of the two statements. \\
+        Of those, the ones outside `[first_styled_line, last_styled_line]` were set together by an earlier pass,
+        they are only rewritten when their level changes.
+        """
+
+        editor = self.editor()
+
+        if statement_line >= 0:
+            level = QsciScintilla.SC_FOLDLEVELBASE + indentation
+
+            if next_indentation > indentation:
+                level |= QsciScintilla.SC_FOLDLEVELHEADERFLAG
+
+            editor.SendScintilla(QsciScintilla.SCI_SETFOLDLEVEL, statement_line, level)
+
+        level_in_between = \
+        (QsciScintilla.SC_FOLDLEVELBASE + max(indentation, next_indentation)) | QsciScintilla.SC_FOLDLEVELWHITEFLAG
+
+        first_line = statement_line + 1
+        first_styled_line = min(max(first_styled_line, first_line), next_statement_line)
+        last_styled_line = max(min(last_styled_line + 1, next_statement_line), first_styled_line)
+
+        for start, end in ((first_line, first_styled_line), (last_styled_line, next_statement_line)):
+            # A long docstring or bracket between two statements is not walked on every keystroke.
+            if start < end and editor.SendScintilla(QsciScintilla.SCI_GETFOLDLEVEL, start) != level_in_between:
+                for line in range(start, end):
+                    editor.SendScintilla(QsciScintilla.SCI_SETFOLDLEVEL, line, level_in_between)
+
+        for line in range(first_styled_line, last_styled_line):
+            editor.SendScintilla(QsciScintilla.SCI_SETFOLDLEVEL, line, level_in_between)
+
+    def settle_fold_levels(self, statement_line: int, indentation: int, first_line: int, last_line: int) -> None:
+        """
+        Folds the last statement of the pass that styled `[first_line, last_line]` against the next statement
+        after it, whose fold level is left as the pass that styled it set it.
+        """
+
+        next_statement_line = min(self.outline.find_next_statement(last_line), self.editor().lines())
+        next_indentation = 0
+
+        if next_statement_line < self.editor().lines():
+            next_indentation = self.get_fold_indentation(next_statement_line)
+
+        self.set_fold_levels(statement_line, indentation, next_statement_line, next_indentation, first_line, last_line)
 
-        self.assertion_check_for_syntax_highlighting(text, tokens_for_syntax_highlighting)
+    @pyqtSlot()
+    def stop_lexing_worker(self):
+        if self.lexing_worker_enabled:
+            self.lexing_thread.quit()
+            self.lexing_thread.wait()
 
-    def assertion_check_for_syntax_highlighting(self, text, tokens_for_syntax_highlighting):
-        length_of_byte_array_of_text = len(bytearray(text, encoding="utf-8"))
+    def verify_styled_length(self, length_of_styled_lines: int, styled_length: int) -> None:
+        """Checks, on sampled styling passes, that the runs covered every byte of the styled lines."""
 
-        sum_of_tokens = 0
+        self.instrumentation.count("lexer.verified_passes")
 
-        for token in tokens_for_syntax_highlighting:
-            sum_of_tokens += token[1]
+        if styled_length != length_of_styled_lines:
+            self.instrumentation.count("lexer.failed_verifications")
 
-        print(
-            f"Assertion: {length_of_byte_array_of_text == sum_of_tokens} ({length_of_byte_array_of_text} == {sum_of_tokens})"
-        )
+            logger.warning("STYLE RUNS COVER %d OF %d STYLED BYTES", styled_length, length_of_styled_lines)
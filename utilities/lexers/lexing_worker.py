@@ -0,0 +1,38 @@
+"""The lexing worker that runs `utilities.lexers.python_tokenizer.PythonTokenizer` off the GUI thread."""
+
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from utilities.lexers.python_tokenizer import PythonTokenizer
+from utilities.instrumentation import get_instrumentation
+
+
+class LexingWorker(QObject):
+    """
+    Tokenizes text snapshots of a document revision on its own `PyQt5.QtCore.QThread`. \\
+    Inherits `PyQt5.QtCore.QObject`.
+    """
+
+    # Revision, first line, and the `(runs, end state, indentation, definition)` of every line.
+    style_runs_ready = pyqtSignal(int, int, object)
+
+    def __init__(self, tokenizer: PythonTokenizer) -> None:
+        super(LexingWorker, self).__init__()
+
+        self.tokenizer = tokenizer
+
+        # Written by the GUI thread, so snapshots of older revisions can be skipped unlexed.
+        self.latest_revision = 0
+
+        self.instrumentation = get_instrumentation()
+
+    @pyqtSlot(int, int, object, object, int)
+    def lex_snapshot(self, revision, first_line, snapshot, line_ends, state):
+        if revision != self.latest_revision:
+            self.instrumentation.count("lexer.skipped_snapshots")
+
+            return
+
+        with self.instrumentation.span("lexer.tokenize", lines=len(line_ends), bytes=len(snapshot)):
+            lines = list(self.tokenizer.tokenize_lines(memoryview(snapshot), line_ends, state))
+
+        self.style_runs_ready.emit(revision, first_line, lines)
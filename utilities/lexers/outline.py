@@ -0,0 +1,129 @@
+"""
+The classes and functions of a document, filled in line by line by `utilities.lexers.lexer_ide.PythonLexer`
+as it styles, and kept free of `PyQt5`.
+"""
+
+from utilities.lexers.python_tokenizer import NO_INDENTATION, CLASS_DEFINITION, FUNCTION_DEFINITION
+
+METHOD_DEFINITION = "method"
+
+
+class OutlineEntry:
+    """
+    A class or function defined on a line. \\
+    Entries compare by identity, so one can be found again after the lines above it changed.
+    """
+
+    __slots__ = ("indentation", "kind", "name")
+
+    def __init__(self, indentation: int, kind: str, name: str) -> None:
+        self.indentation = indentation
+        self.kind = kind
+        self.name = name
+
+
+class Outline:
+    """
+    The `OutlineEntry` of every line, `None` for lines that define nothing,
+    shifted as lines are inserted or deleted so only restyled lines are read again. \\
+    Also flags the lines that start a statement, so the statements around a styled range
+    are found without walking the lines in between.
+    """
+    def __init__(self) -> None:
+        # A Scintilla document always has at least one line.
+        self.entry_of_line = [None]
+
+        # 1 for lines that start a statement or were never styled since they were inserted, 0 for the others.
+        self.statement_lines = bytearray(b"\1")
+
+        # Bumped whenever an entry is added, changed or removed.
+        self.revision = 0
+
+    def shift_lines(self, line: int, lines_added: int) -> None:
+        """Inserts `lines_added` empty lines after `line`, or deletes as many lines after it as were removed."""
+
+        if lines_added > 0:
+            self.entry_of_line[line + 1:line + 1] = [None] * lines_added
+            self.statement_lines[line + 1:line + 1] = b"\1" * lines_added
+        elif lines_added < 0:
+            removed_entries = self.entry_of_line[line + 1:line + 1 - lines_added]
+
+            del self.entry_of_line[line + 1:line + 1 - lines_added]
+            del self.statement_lines[line + 1:line + 1 - lines_added]
+
+            if any(removed_entries):
+                self.revision += 1
+
+    def set_line(self, line: int, indentation: int, definition) -> None:
+        """Records the `(kind, name)` defined on `line`, or `None`, keeping the entry if it didn't change."""
+
+        if line >= len(self.entry_of_line):
+            self.entry_of_line.extend([None] * (line + 1 - len(self.entry_of_line)))
+
+        if line >= len(self.statement_lines):
+            self.statement_lines.extend(b"\1" * (line + 1 - len(self.statement_lines)))
+
+        self.statement_lines[line] = indentation != NO_INDENTATION
+
+        entry = self.entry_of_line[line]
+
+        if definition is None:
+            if entry is not None:
+                self.entry_of_line[line] = None
+                self.revision += 1
+
+            return
+
+        kind, name = definition
+
+        if entry is not None and (entry.indentation, entry.kind, entry.name) == (indentation, kind, name):
+            return
+
+        self.entry_of_line[line] = OutlineEntry(indentation, kind, name)
+        self.revision += 1
+
+    def find_previous_statement(self, line: int) -> int:
+        """Returns the last line before `line` that starts a statement or was never styled, or -1."""
+
+        return self.statement_lines.rfind(1, 0, line)
+
+    def find_next_statement(self, line: int) -> int:
+        """
+        Returns the first line after `line` that starts a statement or was never styled,
+        lines past the last one recorded never were.
+        """
+
+        next_statement_line = self.statement_lines.find(1, line + 1)
+
+        return next_statement_line if next_statement_line >= 0 else max(line + 1, len(self.statement_lines))
+
+    def get_line(self, entry: OutlineEntry) -> int:
+        """Returns the line `entry` is on now, or -1 once it is gone."""
+
+        try:
+            return self.entry_of_line.index(entry)
+        except ValueError:
+            return -1
+
+    def get_symbols(self) -> list:
+        """
+        Returns `(entry, depth, kind)` for every entry in document order, nested by indentation,
+        with functions directly inside classes as methods.
+        """
+
+        symbols = []
+        enclosing_entries = []
+
+        for entry in filter(None, self.entry_of_line):
+            while enclosing_entries and enclosing_entries[-1].indentation >= entry.indentation:
+                enclosing_entries.pop()
+
+            kind = entry.kind
+
+            if kind == FUNCTION_DEFINITION and enclosing_entries and enclosing_entries[-1].kind == CLASS_DEFINITION:
+                kind = METHOD_DEFINITION
+
+            symbols.append((entry, len(enclosing_entries), kind))
+            enclosing_entries.append(entry)
+
+        return symbols
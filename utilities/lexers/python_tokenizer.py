@@ -0,0 +1,259 @@
+"""
+The single-pass tokenizer behind `utilities.lexers.lexer_ide.PythonLexer`,
+kept free of `PyQt5` so it can run anywhere.
+"""
+
+import re
+
+import keyword
+import builtins
+
+REGULAR_STYLE_ID = 0
+KEYWORD_STYLE_ID = 1
+FUNCTION_STYLE_ID = 2
+COMMENT_STYLE_ID = 3
+OPERATOR_STYLE_ID = 4
+BRACKETS_STYLE_ID = 5
+MODULE_STYLE_ID = 6
+STRING_STYLE_ID = 7
+
+# The state at the end of a line, saved through `SCI_SETLINESTATE`.
+# Bits 0-2: open triple-quoted string, or single-quoted string carried on by a backslash,
+# bit 3: backslash continuation, bits 4 and up: bracket depth.
+DEFAULT_LINE_STATE = 0
+TRIPLE_SINGLE_QUOTE_STATE = 1
+TRIPLE_DOUBLE_QUOTE_STATE = 2
+CONTINUED_SINGLE_QUOTE_STATE = 3
+CONTINUED_DOUBLE_QUOTE_STATE = 4
+STRING_STATE_MASK = 0b111
+CONTINUATION_STATE = 0b1000
+BRACKET_DEPTH_SHIFT = 4
+MAXIMUM_BRACKET_DEPTH = 0xFFFF
+
+# The indentation of a line that starts no statement: blank, only a comment, or carrying on the line before it.
+NO_INDENTATION = -1
+
+CLASS_DEFINITION = "class"
+FUNCTION_DEFINITION = "function"
+
+
+class PythonTokenizer:
+    """
+    Tokenizes the UTF-8 bytes of Python one line at a time with a single 
+    precompiled pattern, returning coalesced `(length in bytes, style)` runs.
+    """
+    def __init__(self, module_names=()) -> None:
+        self.MASTER_PATTERN = re.compile(
+            rb"""
+            (?P<comment>\#[^\r\n]*)
+            |(?P<triple>[rRbBuUfF]{0,2}(?:'''|\"\"\"))
+            |(?P<string>[rRbBuUfF]{0,2}(?:'(?:[^'\\\r\n]|\\.)*(?P<closing_single_quote>')?|"(?:[^"\\\r\n]|\\.)*(?P<closing_double_quote>")?))
+            |(?P<name>[\w\x80-\xff]+)
+            |(?P<operator>//=?|\*\*=?|<<=?|>>=?|[-+*/%&|^<>=!]=|[-+*/%&|^~<>=])
+            |(?P<bracket>[()\[\]{}])
+            |(?P<space>\s+)
+            |(?P<other>.)
+            """,
+            re.VERBOSE | re.DOTALL
+        )
+
+        self.END_OF_STRING = {
+            TRIPLE_SINGLE_QUOTE_STATE: re.compile(rb"(?:[^'\\]|\\.?|'(?!''))*(''')?", re.DOTALL),
+            TRIPLE_DOUBLE_QUOTE_STATE: re.compile(rb'(?:[^"\\]|\\.?|"(?!""))*(""")?', re.DOTALL),
+            CONTINUED_SINGLE_QUOTE_STATE: re.compile(rb"(?:[^'\\\r\n]|\\.)*(')?", re.DOTALL),
+            CONTINUED_DOUBLE_QUOTE_STATE: re.compile(rb'(?:[^"\\\r\n]|\\.)*(")?', re.DOTALL)
+        }
+
+        self.STYLE_OF_GROUP = {
+            "comment": COMMENT_STYLE_ID,
+            "triple": STRING_STYLE_ID,
+            "string": STRING_STYLE_ID,
+            "operator": OPERATOR_STYLE_ID,
+            "bracket": BRACKETS_STYLE_ID,
+            "space": REGULAR_STYLE_ID,
+            "other": REGULAR_STYLE_ID
+        }
+
+        self.OPENING_BRACKETS = frozenset(b"([{")
+        self.DOUBLE_QUOTE = ord('"')
+        self.BACKSLASH = ord("\\")
+        self.END_OF_LINE_CHARACTERS = frozenset(b"\r\n")
+
+        self.INDENTATION_PATTERN = re.compile(rb"[ \t]*")
+        self.DEFINITION_PATTERN = re.compile(rb"[ \t]*(?:async[ \t]+)?(def|class)[ \t]+([\w\x80-\xff]+)")
+        self.NOT_A_STATEMENT_CHARACTERS = frozenset(b"#\r\n")
+
+        self.set_module_names(module_names)
+
+    def set_module_names(self, module_names) -> None:
+        """
+        Rebuilds the name lookup table. \\
+        Keywords win over modules, which win over built-in functions.
+        """
+
+        style_of_name = dict.fromkeys((name.encode() for name in dir(builtins)), FUNCTION_STYLE_ID)
+        style_of_name.update(dict.fromkeys((name.encode() for name in module_names), MODULE_STYLE_ID))
+        style_of_name.update(dict.fromkeys((name.encode() for name in keyword.kwlist), KEYWORD_STYLE_ID))
+
+        self.style_of_name = style_of_name
+
+    def tokenize_line(self, text, state: int) -> tuple:
+        """
+        Tokenizes one line of UTF-8 bytes (`bytes` or a `memoryview`), 
+        starting from the state at the end of the line before it. \\
+        Returns the coalesced `(length in bytes, style)` runs and the state at the end of the line.
+        """
+
+        runs = []
+
+        string_state = state & STRING_STATE_MASK
+        bracket_depth = state >> BRACKET_DEPTH_SHIFT
+
+        run_style = STRING_STYLE_ID
+        run_start = 0
+
+        position = 0
+        length_of_text = len(text)
+
+        last_group = None
+
+        while position < length_of_text:
+            if string_state:
+                end_of_string = self.END_OF_STRING[string_state].match(text, position)
+
+                if string_state <= TRIPLE_DOUBLE_QUOTE_STATE:
+                    last_group = "triple"
+                else:
+                    last_group = "string"
+
+                    # Carried on by a backslash again, the end of line is part of the string too.
+                    if end_of_string.end() > self.get_end_of_content(text):
+                        position = length_of_text
+
+                        continue
+
+                    # Python ends an unterminated string at the end of its line.
+                    string_state = 0
+
+                if end_of_string.group(1):
+                    string_state = 0
+
+                position = end_of_string.end()
+
+                continue
+
+            match = self.MASTER_PATTERN.match(text, position)
+
+            group = match.lastgroup
+            style = self.STYLE_OF_GROUP.get(group)
+
+            # The end of line is whitespace too, and must not hide a comment from the continuation check.
+            if group != "space":
+                last_group = group
+
+            if group == "name":
+                style = self.style_of_name.get(match.group(), REGULAR_STYLE_ID)
+            elif group == "triple":
+                if text[match.end() - 1] == self.DOUBLE_QUOTE:
+                    string_state = TRIPLE_DOUBLE_QUOTE_STATE
+                else:
+                    string_state = TRIPLE_SINGLE_QUOTE_STATE
+            elif group == "string":
+                if match.group("closing_single_quote") or match.group("closing_double_quote"):
+                    pass
+                # Carried on to the next line by a backslash, like a triple-quoted string.
+                # Only a backslash and its end of line, not an escaped backslash, take the match past the content.
+                elif match.end() > self.get_end_of_content(text):
+                    if match.group().lstrip(b"rRbBuUfF")[0] == self.DOUBLE_QUOTE:
+                        string_state = CONTINUED_DOUBLE_QUOTE_STATE
+                    else:
+                        string_state = CONTINUED_SINGLE_QUOTE_STATE
+                # Python ends an unterminated string at the end of its line, as an error.
+                # The closing brackets it swallowed must not leave every later line inside brackets.
+                else:
+                    bracket_depth = state >> BRACKET_DEPTH_SHIFT
+            elif group == "bracket":
+                if text[position] in self.OPENING_BRACKETS:
+                    bracket_depth = min(bracket_depth + 1, MAXIMUM_BRACKET_DEPTH)
+                else:
+                    bracket_depth = max(bracket_depth - 1, 0)
+
+            if style != run_style:
+                if position > run_start:
+                    runs.append((position - run_start, run_style))
+
+                run_style = style
+                run_start = position
+
+            position = match.end()
+
+        if position > run_start:
+            runs.append((position - run_start, run_style))
+
+        end_state = string_state | (bracket_depth << BRACKET_DEPTH_SHIFT)
+
+        if not string_state and last_group != "comment":
+            end_of_content = self.get_end_of_content(text)
+
+            if end_of_content and text[end_of_content - 1] == self.BACKSLASH:
+                end_state |= CONTINUATION_STATE
+
+        return runs, end_state
+
+    def get_end_of_content(self, text) -> int:
+        """Returns the offset of the end of line characters that `text` ends with, or its length."""
+
+        end_of_content = len(text)
+
+        while end_of_content and text[end_of_content - 1] in self.END_OF_LINE_CHARACTERS:
+            end_of_content -= 1
+
+        return end_of_content
+
+    def get_line_structure(self, text, state: int) -> tuple:
+        """
+        Returns the indentation of one line, in columns with tab stops every 8 like Python counts them,
+        or `NO_INDENTATION` if it starts no statement, and the `(kind, name)` of the class or function
+        it defines, if any.
+        """
+
+        # Inside a string, brackets or a backslash continuation.
+        if state != DEFAULT_LINE_STATE:
+            return NO_INDENTATION, None
+
+        end_of_indentation = self.INDENTATION_PATTERN.match(text).end()
+
+        if end_of_indentation == len(text) or text[end_of_indentation] in self.NOT_A_STATEMENT_CHARACTERS:
+            return NO_INDENTATION, None
+
+        indentation = bytes(text[:end_of_indentation])
+
+        if b"\t" in indentation:
+            indentation = indentation.expandtabs(8)
+
+        definition = self.DEFINITION_PATTERN.match(text)
+
+        if definition is None:
+            return len(indentation), None
+
+        kind = CLASS_DEFINITION if definition.group(1) == b"class" else FUNCTION_DEFINITION
+
+        return len(indentation), (kind, definition.group(2).decode("utf-8", "replace"))
+
+    def tokenize_lines(self, text, line_ends, state: int):
+        """
+        Yields the runs, end state, indentation and definition of each line of `text`,
+        whose lines end at the offsets in `line_ends`.
+        """
+
+        start_of_line = 0
+
+        for end_of_line in line_ends:
+            line = text[start_of_line:end_of_line]
+
+            indentation, definition = self.get_line_structure(line, state)
+            runs, state = self.tokenize_line(line, state)
+
+            yield runs, state, indentation, definition
+
+            start_of_line = end_of_line
@@ -0,0 +1,103 @@
+"""
+The one logging setup of the application. \\
+Records only go into a queue on the thread that logs them; a listener thread formats them and writes them
+to a size-capped rotating file and the standard error, so logging never waits on I/O in the editor. \\
+Every subsystem logs to its own `pysee.*` logger, whose level comes from `LOG_LEVELS`.
+"""
+
+from utilities.settings.essential_settings import (
+    LOG_DIRECTORY, LOG_FILE_MAXIMUM_BYTES, LOG_FILE_BACKUP_COUNT, LOG_CONSOLE_LEVEL, LOG_LEVELS
+)
+
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+import logging
+
+import sys
+import queue
+import atexit
+
+_queue_listener = None
+
+LOG_FORMAT = "%(levelname)s on %(asctime)s in %(name)s (%(threadName)s); %(message)s"
+LOG_DATE_FORMAT = "%d/%m/%Y, %I:%M:%S %p"
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queues records as they are, leaving the formatting of their message and arguments to the listener thread. \\
+    Inherits `logging.handlers.QueueHandler`.
+    """
+    def prepare(self, record):
+        # The queue never leaves the process, so the record needs no pickling either.
+        return record
+
+
+def configure_logging(log_directory=LOG_DIRECTORY) -> None:
+    """Routes every `pysee.*` logger through the queue, once, and stops the listener at exit after draining it."""
+
+    global _queue_listener
+
+    if _queue_listener is not None:
+        return
+
+    formatter = logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
+
+    console_handler = logging.StreamHandler(sys.stderr)
+    console_handler.setLevel(LOG_CONSOLE_LEVEL)
+    console_handler.setFormatter(formatter)
+
+    handlers = [console_handler]
+
+    try:
+        log_directory.mkdir(parents=True, exist_ok=True)
+
+        file_handler = RotatingFileHandler(
+            log_directory / "pysee.log", maxBytes=LOG_FILE_MAXIMUM_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT, encoding="utf-8", delay=True
+        )
+        file_handler.setFormatter(formatter)
+
+        handlers.append(file_handler)
+    except OSError as error:
+        print(f"Logging to the standard error only, {log_directory} is not writable: {error}", file=sys.stderr)
+
+    log_queue = queue.SimpleQueue()
+
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+    application_logger = logging.getLogger("pysee")
+    application_logger.addHandler(DeferredQueueHandler(log_queue))
+
+    # Records stop at `pysee`, whatever a library does with the root logger.
+    application_logger.propagate = False
+
+    for name, level in LOG_LEVELS.items():
+        logging.getLogger(name).setLevel(level)
+
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """Detaches the queue, writes out every record already in it, then stops the listener thread."""
+
+    global _queue_listener
+
+    if _queue_listener is None:
+        return
+
+    application_logger = logging.getLogger("pysee")
+
+    for handler in list(application_logger.handlers):
+        if isinstance(handler, DeferredQueueHandler):
+            application_logger.removeHandler(handler)
+
+    application_logger.propagate = True
+
+    _queue_listener.stop()
+
+    for handler in _queue_listener.handlers:
+        handler.close()
+
+    _queue_listener = None
@@ -0,0 +1,144 @@
+"""
+The index of the modules installed on the computer,
+shared by the lexer and autocompletion and cached on disk between launches.
+"""
+
+from utilities.settings.essential_settings import ESSENTIAL_CACHE_DIRECTORY
+
+import logging
+
+import os
+import sys
+import json
+import hashlib
+import pkgutil
+import weakref
+import threading
+
+logger = logging.getLogger("pysee.completion")
+
+_module_index = None
+
+
+class ModuleIndex:
+    """
+    Holds the names of the installed modules as a `frozenset` for O(1) lookups. \\
+    The names are cached on disk and invalidated by the modification times of the
+    `sys.path` entries, then refreshed in the background.
+    """
+    def __init__(self, cache_path=ESSENTIAL_CACHE_DIRECTORY / "module_index.json") -> None:
+        self.cache_path = cache_path
+
+        self.modules: frozenset = frozenset()
+        self.fingerprint: str = ""
+
+        # Weak references to bound methods, each removing itself once its object is gone.
+        self.listeners = []
+
+        self.refresh_thread = None
+        self.refresh_lock = threading.Lock()
+
+    def console_debug(self, message, *arguments):
+        logger.debug(message, *arguments)
+
+    def add_listener(self, listener) -> None:
+        """
+        Calls the bound method `listener()` whenever a refresh changes the modules, for as long as its object lives,
+        the index doesn't keep the lexer of a closed window alive. \\
+        Listeners are called from the refresh thread.
+        """
+
+        self.listeners.append(weakref.WeakMethod(listener, self.listeners.remove))
+
+    def get_sys_path_fingerprint(self) -> str:
+        """
+        Hashes every `sys.path` entry together with its modification time,
+        except the directory of the running script, which changes whenever a file next to it is edited.
+        """
+
+        entries = []
+
+        for entry in sys.path[1:]:
+            try:
+                modification_time = os.stat(entry or os.curdir).st_mtime_ns
+            except OSError:
+                modification_time = None
+
+            entries.append([entry, modification_time])
+
+        return hashlib.sha1(json.dumps(entries).encode("utf-8")).hexdigest()
+
+    def load(self) -> bool:
+        """
+        Loads the cached index, even a stale one. \\
+        Returns `True` if it still matches `sys.path`.
+        """
+
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as file:
+                cache = json.load(file)
+
+            self.modules = frozenset(cache["modules"])
+            self.fingerprint = cache["fingerprint"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        return self.fingerprint == self.get_sys_path_fingerprint()
+
+    def save(self) -> None:
+        temporary_cache_path = self.cache_path.with_suffix(".tmp")
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(temporary_cache_path, "w", encoding="utf-8") as file:
+                json.dump({"fingerprint": self.fingerprint, "modules": sorted(self.modules)}, file)
+
+            os.replace(temporary_cache_path, self.cache_path)
+        except OSError as error:
+            logger.warning("MODULE INDEX NOT SAVED: %s", error)
+
+    def refresh(self) -> None:
+        """Walks `sys.path` for the installed modules, then saves and announces them if they changed."""
+
+        with self.refresh_lock:
+            fingerprint = self.get_sys_path_fingerprint()
+            modules = frozenset(module.name for module in pkgutil.iter_modules())
+
+            has_changed = modules != self.modules
+
+            self.modules = modules
+            self.fingerprint = fingerprint
+
+            self.save()
+
+        if has_changed:
+            for reference in tuple(self.listeners):
+                listener = reference()
+
+                if listener is not None:
+                    listener()
+
+    def refresh_in_background(self) -> None:
+        if self.refresh_thread is not None and self.refresh_thread.is_alive():
+            return
+
+        self.refresh_thread = threading.Thread(target=self.refresh, name="ModuleIndexRefresh", daemon=True)
+        self.refresh_thread.start()
+
+
+def get_module_index() -> ModuleIndex:
+    """
+    Returns the module index shared by every window,
+    loading it from disk and refreshing it in the background if it is stale.
+    """
+
+    global _module_index
+
+    if _module_index is None:
+        _module_index = ModuleIndex()
+
+        if not _module_index.load():
+            _module_index.refresh_in_background()
+
+    return _module_index
@@ -0,0 +1,107 @@
+"""The side panel listing the classes and functions of the document, powered by `PyQt5`."""
+
+from PyQt5.QtWidgets import QWidget, QTreeWidget, QTreeWidgetItem, QLabel, QPushButton, QHBoxLayout, QVBoxLayout
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
+
+from utilities.settings.essential_settings import OUTLINE_REFRESH_MILLISECONDS
+
+from utilities.lexers.outline import Outline, METHOD_DEFINITION
+from utilities.lexers.python_tokenizer import CLASS_DEFINITION, FUNCTION_DEFINITION
+
+
+class OutlinePanel(QWidget):
+    """
+    Shows a `utilities.lexers.outline.Outline` as a tree, rebuilt from the entries the lexer keeps
+    only when they change, and never while hidden. \\
+    Activating a symbol emits `symbol_activated` with its entry, whose line is looked up then. \\
+    Inherits `PyQt5.QtWidgets.QWidget`.
+    """
+
+    symbol_activated = pyqtSignal(object)
+    hide_requested = pyqtSignal()
+
+    def __init__(self, parent, font: QFont) -> None:
+        super(OutlinePanel, self).__init__(parent)
+
+        self.PREFIX_OF_KIND = {CLASS_DEFINITION: "class ", FUNCTION_DEFINITION: "def ", METHOD_DEFINITION: "def "}
+
+        self.outline = Outline()
+        self.shown_revision = None
+
+        # Edits come in bursts, the tree is rebuilt once they pause.
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(OUTLINE_REFRESH_MILLISECONDS)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+        self.title_label = QLabel("Outline", self)
+
+        self.hide_button = QPushButton("Hide", self)
+        self.hide_button.clicked.connect(self.hide_requested)
+
+        self.symbol_tree = QTreeWidget(self)
+        self.symbol_tree.setHeaderHidden(True)
+        self.symbol_tree.setFont(font)
+        self.symbol_tree.setUniformRowHeights(True)
+
+        self.symbol_tree.itemActivated.connect(self.activate_item)
+        self.symbol_tree.itemClicked.connect(self.activate_item)
+
+        header_layout = QHBoxLayout()
+        header_layout.addWidget(self.title_label, 1)
+        header_layout.addWidget(self.hide_button)
+
+        panel_layout = QVBoxLayout(self)
+        panel_layout.setContentsMargins(0, 0, 0, 0)
+        panel_layout.addLayout(header_layout)
+        panel_layout.addWidget(self.symbol_tree)
+
+    def set_outline(self, outline: Outline) -> None:
+        """Shows `outline` from now on, or refreshes the one shown if it is the same."""
+
+        if outline is not self.outline:
+            self.outline = outline
+            self.shown_revision = None
+
+        self.schedule_refresh()
+
+    @pyqtSlot()
+    def schedule_refresh(self):
+        if self.isVisible() and not self.refresh_timer.isActive():
+            self.refresh_timer.start()
+
+    def showEvent(self, event):
+        super(OutlinePanel, self).showEvent(event)
+
+        self.refresh()
+
+    @pyqtSlot()
+    def refresh(self):
+        """Rebuilds the tree if the outline changed since it was last shown."""
+
+        if self.outline.revision == self.shown_revision:
+            return
+
+        self.shown_revision = self.outline.revision
+
+        self.symbol_tree.setUpdatesEnabled(False)
+        self.symbol_tree.clear()
+
+        # The item of the latest symbol at each depth, the parent of deeper ones.
+        parents = [self.symbol_tree.invisibleRootItem()]
+
+        for entry, depth, kind in self.outline.get_symbols():
+            del parents[depth + 1:]
+
+            item = QTreeWidgetItem(parents[-1], [self.PREFIX_OF_KIND[kind] + entry.name])
+            item.setData(0, Qt.UserRole, entry)
+
+            parents.append(item)
+
+        self.symbol_tree.expandAll()
+        self.symbol_tree.setUpdatesEnabled(True)
+
+    @pyqtSlot(QTreeWidgetItem, int)
+    def activate_item(self, item, _):
+        self.symbol_activated.emit(item.data(0, Qt.UserRole))
@@ -0,0 +1,84 @@
+"""
+The fixed-capacity buffer between a running program and the output panel, kept free of `PyQt5`. \\
+Output is collected here between timed flushes, so the panel renders it in batches.
+"""
+
+from collections import deque
+from itertools import repeat
+
+import tempfile
+
+
+class OutputBuffer:
+    """
+    Keeps the latest `maximum_lines` lines of output in a ring buffer, counting the ones it drops. \\
+    If `spill_directory` is given, the full output is also written to a file there.
+    """
+    def __init__(self, maximum_lines: int, spill_directory=None) -> None:
+        self.MAXIMUM_LINES = maximum_lines
+
+        # `(line, is_error)` pairs, a line may be a fragment continued by the next one.
+        self.lines = deque(maxlen=maximum_lines)
+        self.dropped_lines = 0
+
+        self.spill_file = None
+
+        if spill_directory is not None:
+            spill_directory.mkdir(parents=True, exist_ok=True)
+
+            self.spill_file = tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", prefix="run_output_", suffix=".log", dir=spill_directory, delete=False
+            )
+
+    @property
+    def spill_path(self):
+        return None if self.spill_file is None else self.spill_file.name
+
+    def append(self, text: str, is_error: bool) -> None:
+        if self.spill_file is not None:
+            self.spill_file.write(text)
+
+        new_lines = text.splitlines(True)
+
+        # Lines that would be pushed out before the next flush are never stored.
+        if len(new_lines) >= self.MAXIMUM_LINES:
+            self.dropped_lines += len(self.lines) + len(new_lines) - self.MAXIMUM_LINES
+            self.lines.clear()
+
+            new_lines = new_lines[-self.MAXIMUM_LINES:]
+        else:
+            self.dropped_lines += max(0, len(self.lines) + len(new_lines) - self.MAXIMUM_LINES)
+
+        self.lines.extend(zip(new_lines, repeat(is_error)))
+
+    def take(self) -> tuple:
+        """
+        Empties the buffer. \\
+        Returns `(dropped_lines, runs)`, with consecutive lines of the same stream joined into `(text, is_error)` runs.
+        """
+
+        runs = []
+        run_lines = []
+        run_is_error = None
+
+        for line, is_error in self.lines:
+            if is_error != run_is_error and run_lines:
+                runs.append(("".join(run_lines), run_is_error))
+                run_lines = []
+
+            run_lines.append(line)
+            run_is_error = is_error
+
+        if run_lines:
+            runs.append(("".join(run_lines), run_is_error))
+
+        dropped_lines = self.dropped_lines
+
+        self.lines.clear()
+        self.dropped_lines = 0
+
+        return dropped_lines, runs
+
+    def close(self) -> None:
+        if self.spill_file is not None:
+            self.spill_file.close()
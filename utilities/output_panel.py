@@ -0,0 +1,143 @@
+"""The panel under the document that shows the output of running code, powered by `PyQt5`."""
+
+from PyQt5.QtWidgets import QWidget, QPlainTextEdit, QLabel, QPushButton, QHBoxLayout, QVBoxLayout
+from PyQt5.QtGui import QFont, QColor, QTextCharFormat, QTextCursor
+from PyQt5.QtCore import QTimer, pyqtSignal, pyqtSlot
+
+from utilities.settings.essential_settings import (
+    ESSENTIAL_CACHE_DIRECTORY, RUN_OUTPUT_MAXIMUM_LINES, RUN_OUTPUT_FLUSH_MILLISECONDS, RUN_OUTPUT_SPILL_TO_FILE
+)
+
+from utilities.output_buffer import OutputBuffer
+
+import os
+
+
+class OutputPanel(QWidget):
+    """
+    Streams the standard output and error of a run, with its status, exit code and time. \\
+    Output goes through a `utilities.output_buffer.OutputBuffer` and is rendered in timed batches,
+    keeping only the latest lines, so a flood of output never outpaces the event loop. \\
+    Inherits `PyQt5.QtWidgets.QWidget`.
+    """
+
+    stop_requested = pyqtSignal()
+    hide_requested = pyqtSignal()
+
+    def __init__(self, parent, font: QFont) -> None:
+        super(OutputPanel, self).__init__(parent)
+
+        self.MAXIMUM_LINES: int = RUN_OUTPUT_MAXIMUM_LINES
+
+        self.output_buffer = OutputBuffer(self.MAXIMUM_LINES)
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(RUN_OUTPUT_FLUSH_MILLISECONDS)
+        self.flush_timer.timeout.connect(self.flush_output)
+
+        self.status_label = QLabel("Ready", self)
+
+        self.stop_button = QPushButton("Stop", self)
+        self.stop_button.setEnabled(False)
+        self.stop_button.clicked.connect(self.stop_requested)
+
+        self.hide_button = QPushButton("Hide", self)
+        self.hide_button.clicked.connect(self.hide_requested)
+
+        self.output_view = QPlainTextEdit(self)
+        self.output_view.setReadOnly(True)
+        self.output_view.setFont(font)
+        self.output_view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.output_view.setUndoRedoEnabled(False)
+
+        # The oldest blocks are dropped by the view itself past the cap.
+        self.output_view.setMaximumBlockCount(self.MAXIMUM_LINES)
+
+        self.output_format = QTextCharFormat()
+
+        self.error_format = QTextCharFormat()
+        self.error_format.setForeground(QColor("#FF0000"))
+
+        self.notice_format = QTextCharFormat()
+        self.notice_format.setForeground(QColor("#808080"))
+
+        header_layout = QHBoxLayout()
+        header_layout.addWidget(self.status_label, 1)
+        header_layout.addWidget(self.stop_button)
+        header_layout.addWidget(self.hide_button)
+
+        panel_layout = QVBoxLayout(self)
+        panel_layout.setContentsMargins(0, 0, 0, 0)
+        panel_layout.addLayout(header_layout)
+        panel_layout.addWidget(self.output_view)
+
+    @pyqtSlot(str)
+    def start_run(self, file_name):
+        self.flush_timer.stop()
+        self.output_buffer.close()
+
+        # Only the output of the latest run is kept on disk.
+        if self.output_buffer.spill_path is not None:
+            try:
+                os.unlink(self.output_buffer.spill_path)
+            except OSError:
+                pass
+
+        self.output_buffer = OutputBuffer(
+            self.MAXIMUM_LINES, ESSENTIAL_CACHE_DIRECTORY if RUN_OUTPUT_SPILL_TO_FILE else None
+        )
+
+        self.output_view.clear()
+
+        self.status_label.setText(f"Running {file_name}...")
+        self.stop_button.setEnabled(True)
+
+    @pyqtSlot(str, bool)
+    def append_output(self, text, is_error):
+        self.output_buffer.append(text, is_error)
+
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    @pyqtSlot()
+    def flush_output(self):
+        """Renders everything buffered since the last flush in one edit of the view."""
+
+        dropped_lines, runs = self.output_buffer.take()
+
+        if not dropped_lines and not runs:
+            return
+
+        scroll_bar = self.output_view.verticalScrollBar()
+        following_output = scroll_bar.value() == scroll_bar.maximum()
+
+        cursor = self.output_view.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+
+        if dropped_lines:
+            cursor.insertText(f"[{dropped_lines} lines skipped]\n", self.notice_format)
+
+        for text, is_error in runs:
+            cursor.insertText(text, self.error_format if is_error else self.output_format)
+
+        cursor.endEditBlock()
+
+        # Only sticks to the bottom if the user hasn't scrolled up to read.
+        if following_output:
+            scroll_bar.setValue(scroll_bar.maximum())
+
+    @pyqtSlot(int, float, bool)
+    def finish_run(self, exit_code, elapsed_seconds, cancelled):
+        self.flush_output()
+        self.output_buffer.close()
+
+        outcome = "Stopped" if cancelled else f"Exited with code {exit_code}"
+        status = f"{outcome} after {elapsed_seconds:.2f} seconds"
+
+        if self.output_buffer.spill_path is not None:
+            status += f", full output in {self.output_buffer.spill_path}"
+
+        self.status_label.setText(status)
+        self.stop_button.setEnabled(False)
@@ -0,0 +1,412 @@
+"""
+The index of the files under the root directory of a project, kept free of `PyQt5`. \\
+The tree is walked once and the index saved to disk; from then on only the directories whose modification time
+changed are listed again, whether a watcher reports them or the saved index is checked on the next launch. \\
+Quick-open queries are answered by a `FileSearchTable`, rebuilt after every change.
+"""
+
+from utilities.settings.essential_settings import (
+    PROJECT_INDEX_DIRECTORY, PROJECT_INDEX_IGNORED_DIRECTORIES, PROJECT_INDEX_MAXIMUM_FILES,
+    PROJECT_INDEX_MAXIMUM_CANDIDATES
+)
+
+from itertools import accumulate
+from bisect import bisect_left, bisect_right
+
+import logging
+
+import os
+import re
+import sys
+import json
+import heapq
+import hashlib
+
+logger = logging.getLogger("pysee.project")
+
+PROJECT_INDEX_VERSION = 1
+
+
+class FileSearchTable:
+    """
+    The relative paths of an index laid out for fuzzy matching in C: the lowercase paths, and their file names,
+    each joined by newlines into one text scanned by a single regular expression,
+    and the lowercase file names sorted for prefix lookups. \\
+    Only the matches of the last query are kept besides, so a query typed on from it checks just those paths.
+    """
+    def __init__(self, paths) -> None:
+        self.paths = sorted(paths)
+        self.lowercase_paths = [path.lower() for path in self.paths]
+
+        lowercase_names = [path[path.rfind("/") + 1:] for path in self.lowercase_paths]
+
+        self.path_text = "\n".join(self.lowercase_paths)
+        self.path_starts = list(accumulate((len(path) + 1 for path in self.lowercase_paths[:-1]), initial=0))
+
+        self.name_text = "\n".join(lowercase_names)
+        self.name_starts = list(accumulate((len(name) + 1 for name in lowercase_names[:-1]), initial=0))
+
+        self.names = sorted((name, index) for index, name in enumerate(lowercase_names))
+
+        # The last query and every path it matched, or `None` when there were too many to keep.
+        self.last_query = None
+        self.last_matches = None
+
+        self.MAXIMUM_CANDIDATES: int = PROJECT_INDEX_MAXIMUM_CANDIDATES
+
+        # A possessive repeat gives nothing back when a match fails, from Python 3.11 on.
+        self.REPEAT = "*+" if sys.version_info >= (3, 11) else "*"
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def search(self, query: str, limit: int) -> list:
+        """
+        Returns up to `limit` paths holding the characters of `query` in order, case-insensitively, best first:
+        file names starting with it, then containing it, then matching it loosely, then whole paths doing so.
+        """
+
+        query = "".join(query.lower().split())
+
+        if not query:
+            return self.paths[:limit]
+
+        candidates = {}
+
+        # File names starting with the query are found wherever they sort among the paths.
+        index = bisect_left(self.names, (query,))
+
+        while index < len(self.names) and self.names[index][0].startswith(query) and len(candidates) < limit:
+            candidates[self.names[index][1]] = None
+            index += 1
+
+        # Starts on the first character, which the engine finds by a fast literal scan, and each later one
+        # skips everything up to it, so a failed match never backtracks. Its length tells how spread out it is.
+        characters = [re.escape(character) for character in query]
+        compact_pattern = re.compile(
+            characters[0] + "".join(f"[^\\n{character}]{self.REPEAT}{character}" for character in characters[1:])
+        )
+
+        if self.last_matches is not None and query.startswith(self.last_query):
+            self.last_matches = [
+                index for index in self.last_matches if compact_pattern.search(self.lowercase_paths[index])
+            ]
+            candidates.update(dict.fromkeys(self.last_matches))
+        else:
+            self.last_matches = None
+
+            # Paths matching only outside of their file name rank last, so they aren't needed once enough names match.
+            if self.scan(self.name_text, self.name_starts, compact_pattern, candidates) < limit:
+                matches = {}
+                number_of_matches = self.scan(self.path_text, self.path_starts, compact_pattern, matches)
+                is_complete = number_of_matches < self.MAXIMUM_CANDIDATES
+
+                candidates.update(matches)
+
+                if is_complete:
+                    self.last_matches = list(matches)
+
+        self.last_query = query
+
+        best_indexes = heapq.nsmallest(
+            limit, candidates, key=lambda index: self.get_score(index, query, compact_pattern)
+        )
+
+        return [self.paths[index] for index in best_indexes]
+
+    def scan(self, text: str, line_starts: list, compact_pattern, matches: dict) -> int:
+        """Adds each line of `text` matching `compact_pattern` to `matches`, until it holds `MAXIMUM_CANDIDATES`."""
+
+        position = 0
+
+        while len(matches) < self.MAXIMUM_CANDIDATES:
+            match = compact_pattern.search(text, position)
+
+            if match is None:
+                break
+
+            line = bisect_right(line_starts, match.start()) - 1
+            matches[line] = None
+
+            # One match per line is enough.
+            if line + 1 >= len(line_starts):
+                break
+
+            position = line_starts[line + 1]
+
+        return len(matches)
+
+    def get_score(self, index: int, query: str, compact_pattern) -> tuple:
+        path = self.lowercase_paths[index]
+        name = path[path.rfind("/") + 1:]
+
+        if name.startswith(query):
+            return (0, 0, len(path), path)
+
+        if query in name:
+            return (1, 0, len(path), path)
+
+        match = compact_pattern.search(name)
+
+        if match is not None:
+            return (2, match.end() - match.start(), len(path), path)
+
+        return (3 if query in path else 4, 0, len(path), path)
+
+
+class ProjectIndex:
+    """
+    Keeps, for every directory under `root` (by path relative to it, with `/` separators, `""` for the root),
+    its modification time and the names of its files and subdirectories. \\
+    Ignored directories and symbolic links to directories are skipped.
+    """
+    def __init__(self, root: str, cache_directory=PROJECT_INDEX_DIRECTORY) -> None:
+        self.root = os.path.abspath(root)
+
+        self.cache_path = cache_directory / f"{hashlib.sha1(self.root.encode('utf-8')).hexdigest()}.json"
+
+        self.IGNORED_DIRECTORIES = frozenset(PROJECT_INDEX_IGNORED_DIRECTORIES)
+        self.MAXIMUM_FILES: int = PROJECT_INDEX_MAXIMUM_FILES
+
+        # Relative directory to `(modification time, file names, subdirectory names)`.
+        self.directories = {}
+        self.number_of_files = 0
+
+        self.search_table = FileSearchTable(())
+
+        # Set by every change, cleared once saved.
+        self.has_unsaved_changes = False
+
+    def console_debug(self, message, *arguments):
+        logger.debug(message, *arguments)
+
+    def get_absolute_path(self, relative_path: str) -> str:
+        return os.path.join(self.root, *relative_path.split("/")) if relative_path else self.root
+
+    def get_relative_path(self, absolute_path: str):
+        """Returns the path of `absolute_path` relative to the root, or `None` if it is outside of it."""
+
+        relative_path = os.path.relpath(os.path.abspath(absolute_path), self.root)
+
+        if relative_path == os.curdir:
+            return ""
+
+        if relative_path == os.pardir or relative_path.startswith(os.pardir + os.sep):
+            return None
+
+        return relative_path.replace(os.sep, "/")
+
+    def load(self) -> bool:
+        """Loads the saved index of the root, returning `False` if there is none that can be read."""
+
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as file:
+                cache = json.load(file)
+
+            if cache["version"] != PROJECT_INDEX_VERSION or cache["root"] != self.root:
+                return False
+
+            self.directories = {
+                directory: (modification_time, tuple(file_names), tuple(subdirectory_names))
+                for directory, (modification_time, file_names, subdirectory_names) in cache["directories"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            self.directories = {}
+
+            return False
+
+        self.number_of_files = sum(len(file_names) for _, file_names, _ in self.directories.values())
+
+        return True
+
+    def save(self) -> None:
+        temporary_cache_path = self.cache_path.with_suffix(".tmp")
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(temporary_cache_path, "w", encoding="utf-8") as file:
+                json.dump(
+                    {"version": PROJECT_INDEX_VERSION, "root": self.root, "directories": self.directories}, file
+                )
+
+            os.replace(temporary_cache_path, self.cache_path)
+        except OSError as error:
+            logger.warning("PROJECT INDEX NOT SAVED: %s", error)
+
+            return
+
+        self.has_unsaved_changes = False
+
+    def list_directory(self, directory: str) -> list:
+        """
+        Lists one directory into the index and returns the subdirectories it holds now. \\
+        A directory that can no longer be listed is dropped, along with everything under it.
+        """
+
+        absolute_path = self.get_absolute_path(directory)
+
+        file_names = []
+        subdirectory_names = []
+
+        try:
+            # Taken first, so a change made while listing is picked up by the next check.
+            modification_time = os.stat(absolute_path).st_mtime_ns
+
+            with os.scandir(absolute_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.IGNORED_DIRECTORIES:
+                                subdirectory_names.append(entry.name)
+                        else:
+                            file_names.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError as error:
+            self.console_debug("COULD NOT LIST %s: %s", absolute_path, error)
+            self.remove_tree(directory)
+
+            return []
+
+        previous = self.directories.get(directory)
+
+        self.number_of_files += len(file_names) - (len(previous[1]) if previous else 0)
+        self.directories[directory] = (modification_time, tuple(file_names), tuple(subdirectory_names))
+
+        self.has_unsaved_changes = True
+
+        return self.get_subdirectories(directory, subdirectory_names)
+
+    def add_tree(self, directory: str) -> list:
+        """Lists `directory` and everything under it, up to `MAXIMUM_FILES`, returning the directories listed."""
+
+        added_directories = []
+        directories_to_list = [directory]
+
+        while directories_to_list:
+            if self.number_of_files >= self.MAXIMUM_FILES:
+                logger.warning("PROJECT INDEX STOPPED AT %d FILES UNDER %s", self.number_of_files, self.root)
+
+                break
+
+            directory = directories_to_list.pop()
+
+            directories_to_list.extend(self.list_directory(directory))
+
+            if directory in self.directories:
+                added_directories.append(directory)
+
+        return added_directories
+
+    def remove_tree(self, directory: str) -> list:
+        """Drops `directory` and everything under it, returning the directories dropped."""
+
+        prefix = f"{directory}/" if directory else ""
+
+        removed_directories = [
+            known_directory for known_directory in self.directories
+            if known_directory == directory or known_directory.startswith(prefix)
+        ]
+
+        for removed_directory in removed_directories:
+            self.number_of_files -= len(self.directories.pop(removed_directory)[1])
+
+        if removed_directories:
+            self.has_unsaved_changes = True
+
+        return removed_directories
+
+    def update_directory(self, directory: str) -> tuple:
+        """
+        Lists `directory` again, adding the trees of new subdirectories and dropping those of removed ones. \\
+        Returns the directories added and removed.
+        """
+
+        previous = self.directories.get(directory)
+
+        if previous is None:
+            return [], []
+
+        if not os.path.isdir(self.get_absolute_path(directory)):
+            return [], self.remove_tree(directory)
+
+        previous_subdirectories = set(self.get_subdirectories(directory, previous[2]))
+        subdirectories = self.list_directory(directory)
+
+        added_directories = []
+        removed_directories = []
+
+        for subdirectory in subdirectories:
+            if subdirectory not in previous_subdirectories:
+                added_directories.extend(self.add_tree(subdirectory))
+
+        for subdirectory in previous_subdirectories.difference(subdirectories):
+            removed_directories.extend(self.remove_tree(subdirectory))
+
+        return added_directories, removed_directories
+
+    def get_subdirectories(self, directory: str, subdirectory_names) -> list:
+        return [f"{directory}/{name}" if directory else name for name in subdirectory_names]
+
+    def scan(self) -> None:
+        """Walks the whole tree, replacing whatever the index held."""
+
+        self.directories = {}
+        self.number_of_files = 0
+
+        self.add_tree("")
+
+    def validate(self) -> tuple:
+        """
+        Lists again only the directories whose modification time changed since they were indexed,
+        which is when files are added, removed or renamed in them. \\
+        Returns the directories added and removed.
+        """
+
+        added_directories = []
+        removed_directories = []
+
+        for directory, (modification_time, _, _) in list(self.directories.items()):
+            if directory not in self.directories:
+                continue
+
+            try:
+                is_stale = os.stat(self.get_absolute_path(directory)).st_mtime_ns != modification_time
+            except OSError:
+                is_stale = True
+
+            if is_stale:
+                added, removed = self.update_directory(directory)
+
+                added_directories.extend(added)
+                removed_directories.extend(removed)
+
+        return added_directories, removed_directories
+
+    def rebuild_search_table(self) -> None:
+        self.search_table = FileSearchTable(
+            f"{directory}/{name}" if directory else name
+            for directory, (_, file_names, _) in self.directories.items() for name in file_names
+        )
+
+    def search(self, query: str, limit: int) -> list:
+        return self.search_table.search(query, limit)
+
+
+def read_last_project_root(cache_directory=PROJECT_INDEX_DIRECTORY):
+    """Returns the root of the project opened last, or `None`."""
+
+    try:
+        return (cache_directory / "last_project.txt").read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+
+def write_last_project_root(root: str, cache_directory=PROJECT_INDEX_DIRECTORY) -> None:
+    try:
+        cache_directory.mkdir(parents=True, exist_ok=True)
+
+        (cache_directory / "last_project.txt").write_text(root, encoding="utf-8")
+    except OSError as error:
+        logger.warning("LAST PROJECT NOT SAVED: %s", error)
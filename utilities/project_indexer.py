@@ -0,0 +1,284 @@
+"""
+The file index of the open project, built and kept current on a background thread
+from `utilities.project_index.ProjectIndex` and `PyQt5.QtCore.QFileSystemWatcher`.
+"""
+
+from PyQt5.QtCore import (
+    QObject, QThread, QTimer, QFileSystemWatcher, QCoreApplication, Qt, pyqtSignal, pyqtSlot
+)
+
+from utilities.settings.essential_settings import (
+    PROJECT_INDEX_MAXIMUM_WATCHED_DIRECTORIES, PROJECT_INDEX_UPDATE_DELAY_MILLISECONDS,
+    PROJECT_INDEX_SAVE_DELAY_MILLISECONDS
+)
+
+from utilities.project_index import (
+    ProjectIndex, FileSearchTable, read_last_project_root, write_last_project_root
+)
+from utilities.instrumentation import get_instrumentation
+
+import logging
+
+import os
+
+logger = logging.getLogger("pysee.project")
+
+_project_indexer = None
+
+
+class ProjectIndexWorker(QObject):
+    """
+    Owns the `ProjectIndex` of the open root on its own `PyQt5.QtCore.QThread`. \\
+    A saved index is announced as soon as it is loaded, then checked against the disk;
+    without one the tree is walked. \\
+    From then on the directories a watcher reports are listed again once changes pause,
+    and the index is saved a while after the last of them. \\
+    Inherits `PyQt5.QtCore.QObject`.
+    """
+
+    index_ready = pyqtSignal(str, object)
+
+    def __init__(self) -> None:
+        super(ProjectIndexWorker, self).__init__()
+
+        self.MAXIMUM_WATCHED_DIRECTORIES: int = PROJECT_INDEX_MAXIMUM_WATCHED_DIRECTORIES
+
+        self.index = None
+
+        # Created on the worker thread by the first root opened, so their events are delivered there.
+        self.watcher = None
+        self.update_timer = None
+        self.save_timer = None
+
+        self.pending_directories = set()
+
+        self.instrumentation = get_instrumentation()
+
+    def console_debug(self, message, *arguments):
+        logger.debug(message, *arguments)
+
+    def set_up_watcher(self) -> None:
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.queue_directory)
+
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(PROJECT_INDEX_UPDATE_DELAY_MILLISECONDS)
+        self.update_timer.timeout.connect(self.update_pending_directories)
+
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(PROJECT_INDEX_SAVE_DELAY_MILLISECONDS)
+        self.save_timer.timeout.connect(self.save)
+
+    @pyqtSlot(str)
+    def open_root(self, root):
+        if self.watcher is None:
+            self.set_up_watcher()
+
+        self.update_timer.stop()
+        self.pending_directories.clear()
+
+        watched_directories = self.watcher.directories()
+
+        if watched_directories:
+            self.watcher.removePaths(watched_directories)
+
+        self.save()
+
+        self.index = ProjectIndex(root)
+
+        if self.index.load():
+            self.console_debug("PROJECT INDEX OF %s LOADED WITH %d FILES", root, self.index.number_of_files)
+
+            self.announce_index()
+
+            with self.instrumentation.span("project_index.validate", directories=len(self.index.directories)):
+                self.index.validate()
+        else:
+            with self.instrumentation.span("project_index.scan"):
+                self.index.scan()
+
+            self.console_debug("PROJECT INDEX OF %s SCANNED WITH %d FILES", root, self.index.number_of_files)
+
+        self.watch_directories(list(self.index.directories))
+
+        if self.index.has_unsaved_changes:
+            self.announce_index()
+            self.save()
+
+    @pyqtSlot()
+    def validate(self):
+        """Catches up on changes the watcher missed, or happened in directories it couldn't watch."""
+
+        if self.index is None:
+            return
+
+        with self.instrumentation.span("project_index.validate", directories=len(self.index.directories)):
+            added_directories, removed_directories = self.index.validate()
+
+        self.unwatch_directories(removed_directories)
+        self.watch_directories(added_directories)
+
+        if self.index.has_unsaved_changes:
+            self.announce_index()
+            self.save_timer.start()
+
+    @pyqtSlot(str)
+    def queue_directory(self, path):
+        directory = self.index.get_relative_path(path)
+
+        if directory is not None:
+            self.pending_directories.add(directory)
+            self.update_timer.start()
+
+    @pyqtSlot()
+    def update_pending_directories(self):
+        pending_directories = self.pending_directories
+        self.pending_directories = set()
+
+        with self.instrumentation.span("project_index.update", directories=len(pending_directories)):
+            for directory in pending_directories:
+                added_directories, removed_directories = self.index.update_directory(directory)
+
+                self.unwatch_directories(removed_directories)
+                self.watch_directories(added_directories)
+
+        self.console_debug("PROJECT INDEX UPDATED %d DIRECTORIES", len(pending_directories))
+
+        if self.index.has_unsaved_changes:
+            self.announce_index()
+            self.save_timer.start()
+
+    def watch_directories(self, directories: list) -> None:
+        """Watches `directories`, as many as the limit leaves room for, the rest are only validated."""
+
+        room = self.MAXIMUM_WATCHED_DIRECTORIES - len(self.watcher.directories())
+
+        if room < len(directories):
+            self.console_debug("PROJECT INDEX WATCHES %d OF %d NEW DIRECTORIES", max(room, 0), len(directories))
+
+        if room > 0 and directories:
+            self.watcher.addPaths([self.index.get_absolute_path(directory) for directory in directories[:room]])
+
+    def unwatch_directories(self, directories: list) -> None:
+        # Directories that are gone stop being watched on their own.
+        watched_directories = [
+            path for path in map(self.index.get_absolute_path, directories) if os.path.isdir(path)
+        ]
+
+        if watched_directories:
+            self.watcher.removePaths(watched_directories)
+
+    def announce_index(self) -> None:
+        with self.instrumentation.span("project_index.rebuild", files=self.index.number_of_files):
+            self.index.rebuild_search_table()
+
+        self.index_ready.emit(self.index.root, self.index.search_table)
+
+    @pyqtSlot()
+    def save(self):
+        if self.index is not None and self.index.has_unsaved_changes:
+            self.index.save()
+
+
+class ProjectIndexer(QObject):
+    """
+    Runs a `ProjectIndexWorker` for the open project and answers quick-open queries
+    from the latest `utilities.project_index.FileSearchTable` it announced,
+    which no thread changes once announced. \\
+    The index is checked against the disk again whenever the application is activated. \\
+    Inherits `PyQt5.QtCore.QObject`.
+    """
+
+    index_changed = pyqtSignal()
+
+    root_requested = pyqtSignal(str)
+    validation_requested = pyqtSignal()
+
+    def __init__(self) -> None:
+        super(ProjectIndexer, self).__init__()
+
+        self.root = None
+        self.search_table = FileSearchTable(())
+
+        self.indexing_thread = QThread(self)
+
+        self.indexing_worker = ProjectIndexWorker()
+        self.indexing_worker.moveToThread(self.indexing_thread)
+
+        self.root_requested.connect(self.indexing_worker.open_root)
+        self.validation_requested.connect(self.indexing_worker.validate)
+        self.indexing_worker.index_ready.connect(self.set_search_table)
+
+        self.indexing_thread.start()
+
+        application = QCoreApplication.instance()
+
+        application.aboutToQuit.connect(self.stop_indexing_worker)
+
+        if hasattr(application, "applicationStateChanged"):
+            application.applicationStateChanged.connect(self.validate_on_activation)
+
+    def console_debug(self, message, *arguments):
+        logger.debug(message, *arguments)
+
+    def open_root(self, root: str) -> None:
+        """Makes `root` the open project, indexing it in the background and opening it again on the next launch."""
+
+        self.root = os.path.abspath(root)
+        self.search_table = FileSearchTable(())
+
+        write_last_project_root(self.root)
+
+        self.console_debug("OPENING PROJECT %s", self.root)
+
+        self.root_requested.emit(self.root)
+        self.index_changed.emit()
+
+    def get_absolute_path(self, relative_path: str) -> str:
+        return os.path.join(self.root, *relative_path.split("/"))
+
+    def search(self, query: str, limit: int) -> list:
+        """Returns up to `limit` paths relative to the root matching `query`, best first."""
+
+        return self.search_table.search(query, limit)
+
+    @pyqtSlot(str, object)
+    def set_search_table(self, root, search_table):
+        # A root opened since is indexed next.
+        if root != self.root:
+            return
+
+        self.search_table = search_table
+
+        self.index_changed.emit()
+
+    @pyqtSlot(Qt.ApplicationState)
+    def validate_on_activation(self, state):
+        if state == Qt.ApplicationActive and self.root is not None:
+            self.validation_requested.emit()
+
+    @pyqtSlot()
+    def stop_indexing_worker(self):
+        self.indexing_thread.quit()
+        self.indexing_thread.wait()
+
+        # Changes still waiting for the save timer.
+        self.indexing_worker.save()
+
+
+def get_project_indexer() -> ProjectIndexer:
+    """Returns the project indexer shared by every window, opening the project of the last session."""
+
+    global _project_indexer
+
+    if _project_indexer is None:
+        _project_indexer = ProjectIndexer()
+
+        last_root = read_last_project_root()
+
+        if last_root is not None and os.path.isdir(last_root):
+            _project_indexer.open_root(last_root)
+
+    return _project_indexer
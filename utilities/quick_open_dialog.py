@@ -0,0 +1,122 @@
+"""The quick-open dialog, matching what is typed against the files of the open project, powered by `PyQt5`."""
+
+from PyQt5.QtWidgets import QDialog, QLineEdit, QListWidget, QLabel, QVBoxLayout
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QEvent, pyqtSignal, pyqtSlot
+
+from utilities.settings.essential_settings import QUICK_OPEN_MAXIMUM_RESULTS
+
+from utilities.project_indexer import ProjectIndexer
+from utilities.instrumentation import get_instrumentation
+
+
+class QuickOpenDialog(QDialog):
+    """
+    Searches the `utilities.project_indexer.ProjectIndexer` on every keystroke,
+    and again whenever the index changes while shown. \\
+    Up and down move through the results from the query field, and choosing one emits `file_chosen`
+    with its absolute path. \\
+    Inherits `PyQt5.QtWidgets.QDialog`.
+    """
+
+    file_chosen = pyqtSignal(str)
+
+    def __init__(self, parent, font: QFont, project_indexer: ProjectIndexer) -> None:
+        super(QuickOpenDialog, self).__init__(parent)
+
+        self.DIALOG_WIDTH: int = 700
+        self.DIALOG_HEIGHT: int = 450
+
+        self.MAXIMUM_RESULTS: int = QUICK_OPEN_MAXIMUM_RESULTS
+        self.NAVIGATION_KEYS = frozenset((Qt.Key_Up, Qt.Key_Down, Qt.Key_PageUp, Qt.Key_PageDown))
+
+        self.project_indexer = project_indexer
+        self.instrumentation = get_instrumentation()
+
+        self.setWindowTitle("Quick Open")
+        self.resize(self.DIALOG_WIDTH, self.DIALOG_HEIGHT)
+
+        self.query_field = QLineEdit(self)
+        self.query_field.setFont(font)
+        self.query_field.setPlaceholderText("Type part of a file name or path")
+        self.query_field.textChanged.connect(self.search)
+        self.query_field.installEventFilter(self)
+
+        self.result_list = QListWidget(self)
+        self.result_list.setFont(font)
+        self.result_list.setUniformItemSizes(True)
+        self.result_list.itemActivated.connect(self.choose_current_result)
+
+        self.status_label = QLabel(self)
+
+        dialog_layout = QVBoxLayout(self)
+        dialog_layout.addWidget(self.query_field)
+        dialog_layout.addWidget(self.result_list)
+        dialog_layout.addWidget(self.status_label)
+
+        self.project_indexer.index_changed.connect(self.refresh)
+
+    def eventFilter(self, watched, event):
+        if watched is self.query_field and event.type() == QEvent.KeyPress:
+            if event.key() in self.NAVIGATION_KEYS:
+                self.result_list.keyPressEvent(event)
+
+                return True
+
+            if event.key() in (Qt.Key_Return, Qt.Key_Enter):
+                self.choose_current_result()
+
+                return True
+
+        return super(QuickOpenDialog, self).eventFilter(watched, event)
+
+    def open_dialog(self) -> None:
+        """Shows the dialog with the last query selected, so typing replaces it."""
+
+        self.search(self.query_field.text())
+        self.query_field.selectAll()
+        self.query_field.setFocus()
+
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
+    @pyqtSlot()
+    def refresh(self):
+        if self.isVisible():
+            self.search(self.query_field.text())
+
+    @pyqtSlot(str)
+    def search(self, query):
+        if self.project_indexer.root is None:
+            self.result_list.clear()
+            self.status_label.setText("Open a project from the File menu first.")
+
+            return
+
+        with self.instrumentation.span("project_index.search", characters=len(query)):
+            results = self.project_indexer.search(query, self.MAXIMUM_RESULTS)
+
+        self.result_list.setUpdatesEnabled(False)
+        self.result_list.clear()
+        self.result_list.addItems(results)
+        self.result_list.setCurrentRow(0)
+        self.result_list.setUpdatesEnabled(True)
+
+        number_of_files = len(self.project_indexer.search_table)
+
+        self.status_label.setText(
+            f"{len(results)} shown of {number_of_files} files in {self.project_indexer.root}"
+            if number_of_files else f"Indexing {self.project_indexer.root}..."
+        )
+
+    @pyqtSlot()
+    def choose_current_result(self):
+        item = self.result_list.currentItem()
+
+        if item is None:
+            return
+
+        self.hide()
+
+        self.file_chosen.emit(self.project_indexer.get_absolute_path(item.text()))
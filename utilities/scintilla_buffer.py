@@ -0,0 +1,44 @@
+"""Access to the UTF-8 bytes of a `PyQt5.Qsci.QsciScintilla` document without copying all of it."""
+
+from PyQt5.Qsci import QsciScintilla
+
+
+def read_bytes(editor: QsciScintilla, start: int, end: int) -> memoryview:
+    """
+    Copies only the bytes between the positions `start` and `end` out of
+    the document (through `SCI_GETTEXTRANGE`),
+    as a view that can be sliced without further copies.
+    """
+
+    if end <= start:
+        return memoryview(b"")
+
+    # `QsciScintilla.bytes` includes the terminating null byte.
+    return memoryview(editor.bytes(start, end).data())[:end - start]
+
+
+def get_position_from_line(editor: QsciScintilla, line: int) -> int:
+    """Returns the position of the start of `line`, or the document length past its last line."""
+
+    if line >= editor.lines():
+        return editor.length()
+
+    return editor.SendScintilla(QsciScintilla.SCI_POSITIONFROMLINE, line)
+
+
+def get_document_view(editor: QsciScintilla) -> memoryview:
+    """
+    Returns a view straight onto the whole document's storage (through `SCI_GETCHARACTERPOINTER`),
+    valid only until the document is next changed.
+    """
+
+    length = editor.length()
+
+    if not length:
+        return memoryview(b"")
+
+    # `SendScintillaPtrResult` keeps the full pointer, where `SendScintilla` returns a C `long`.
+    pointer = editor.SendScintillaPtrResult(QsciScintilla.SCI_GETCHARACTERPOINTER)
+    pointer.setsize(length)
+
+    return memoryview(pointer)
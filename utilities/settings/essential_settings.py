@@ -1,5 +1,101 @@
+from pathlib import Path
+
 ESSENTIAL_NAME = "PySee"
 ESSENTIAL_STAGE = "Beta"
 ESSENTIAL_VERSION = "2024.0.1"
 
 DEBUGGING_MODE = True
+
+# Resources are found from the source tree, whatever the working directory.
+ESSENTIAL_ROOT_DIRECTORY = Path(__file__).resolve().parents[2]
+ASSETS_DIRECTORY = ESSENTIAL_ROOT_DIRECTORY / "assets"
+STYLESHEETS_DIRECTORY = Path(__file__).resolve().parent / "stylesheets"
+
+ESSENTIAL_CACHE_DIRECTORY = Path.home() / ".pysee" / "cache"
+
+LAZY_STYLING_ENABLED = True
+LAZY_STYLING_LOOKAHEAD_LINES = 200
+LAZY_STYLING_MAXIMUM_SYNCHRONOUS_LINES = 2000
+LAZY_STYLING_SLICE_LINES = 500
+LAZY_STYLING_SLICE_MILLISECONDS = 8
+
+LEXING_WORKER_ENABLED = True
+
+INTROSPECTION_WORKER_COUNT = 2
+INTROSPECTION_TASKS_PER_WORKER = 25
+INTROSPECTION_CACHE_SIZE = 128
+# A module still importing after this long is given up on, and its worker killed.
+INTROSPECTION_TIMEOUT_MILLISECONDS = 5000
+
+DOCUMENT_LOADING_CHUNK_BYTES = 1 << 20
+DOCUMENT_LOADING_PROGRESS_DELAY_MILLISECONDS = 500
+# Files that declare no encoding and aren't valid UTF-8 are loaded as this one, which decodes any bytes.
+DOCUMENT_LOADING_FALLBACK_ENCODING = "latin-1"
+DOCUMENT_SAVING_CHUNK_BYTES = 4 << 20
+
+EDIT_JOURNAL_DIRECTORY = Path.home() / ".pysee" / "journals"
+EDIT_JOURNAL_FLUSH_MILLISECONDS = 1000
+EDIT_JOURNAL_COMPACTION_BYTES = 4 << 20
+
+RUN_CODE_TERMINATION_GRACE_MILLISECONDS = 2000
+RUN_OUTPUT_MAXIMUM_LINES = 10000
+RUN_OUTPUT_FLUSH_MILLISECONDS = 50
+RUN_OUTPUT_SPILL_TO_FILE = True
+
+INTERPRETER_POOL_ENABLED = True
+INTERPRETER_POOL_SIZE = 2
+# Imported by every idle interpreter, like ("numpy", "pandas"), each one holding their memory while it waits.
+INTERPRETER_POOL_PRELOADED_MODULES = ()
+# The address space of a warm interpreter, preloading and running its program, 0 for no limit.
+INTERPRETER_POOL_MEMORY_LIMIT_MEGABYTES = 4096
+
+STARTUP_TRACE_ENABLED = False
+STARTUP_TRACE_REPORTED_IMPORTS = 15
+
+INSTRUMENTATION_ENABLED = False
+INSTRUMENTATION_DIRECTORY = Path.home() / ".pysee" / "traces"
+INSTRUMENTATION_MAXIMUM_SPANS = 100000
+
+# Every nth styling pass checks that its runs cover the styled bytes, 0 never does.
+LEXER_VERIFICATION_SAMPLING_INTERVAL = 0
+
+OUTLINE_REFRESH_MILLISECONDS = 300
+
+PROJECT_INDEX_DIRECTORY = ESSENTIAL_CACHE_DIRECTORY / "projects"
+PROJECT_INDEX_IGNORED_DIRECTORIES = (
+    ".git", ".hg", ".svn", "__pycache__", ".mypy_cache", ".pytest_cache", ".tox", ".venv", "venv", "node_modules"
+)
+PROJECT_INDEX_MAXIMUM_FILES = 1000000
+PROJECT_INDEX_MAXIMUM_WATCHED_DIRECTORIES = 8192
+PROJECT_INDEX_UPDATE_DELAY_MILLISECONDS = 200
+PROJECT_INDEX_SAVE_DELAY_MILLISECONDS = 5000
+# Paths matched by a query that are ranked, the rest of a huge tree is left unscored.
+PROJECT_INDEX_MAXIMUM_CANDIDATES = 5000
+QUICK_OPEN_MAXIMUM_RESULTS = 50
+
+DIAGNOSTICS_ENABLED = True
+DIAGNOSTICS_DEBOUNCE_MILLISECONDS = 400
+DIAGNOSTICS_WORKER_COUNT = 1
+DIAGNOSTICS_BATCH_BYTES = 256 << 10
+DIAGNOSTICS_MAXIMUM_MERGED_BLOCKS = 8
+DIAGNOSTICS_MAXIMUM_REPORTED = 1000
+# A batch still analysed after this long is given up on, and the workers replaced.
+DIAGNOSTICS_TIMEOUT_MILLISECONDS = 10000
+
+LOG_DIRECTORY = Path.home() / ".pysee" / "logs"
+LOG_FILE_MAXIMUM_BYTES = 1 << 20
+LOG_FILE_BACKUP_COUNT = 3
+LOG_CONSOLE_LEVEL = "DEBUG" if DEBUGGING_MODE else "WARNING"
+
+# The level of each subsystem's logger, `pysee` covers those not listed.
+LOG_LEVELS = {
+    "pysee": "DEBUG" if DEBUGGING_MODE else "INFO",
+    "pysee.interface": "DEBUG" if DEBUGGING_MODE else "INFO",
+    "pysee.lexing": "INFO",
+    "pysee.completion": "DEBUG" if DEBUGGING_MODE else "INFO",
+    "pysee.documents": "DEBUG" if DEBUGGING_MODE else "INFO",
+    "pysee.running": "DEBUG" if DEBUGGING_MODE else "INFO",
+    "pysee.diagnostics": "INFO",
+    "pysee.project": "DEBUG" if DEBUGGING_MODE else "INFO",
+    "pysee.instrumentation": "INFO",
+}
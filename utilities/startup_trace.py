@@ -0,0 +1,142 @@
+"""
+A trace of where startup time goes: named phases, and every import timed through `sys.meta_path`. \\
+Kept free of `PyQt5` so it can be started before Qt is imported.
+"""
+
+from utilities.settings.essential_settings import STARTUP_TRACE_ENABLED, STARTUP_TRACE_REPORTED_IMPORTS
+
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder, Loader
+
+import os
+import sys
+import time
+
+_startup_trace = None
+
+
+class TimedLoader(Loader):
+    """Wraps the loader of a module to time its execution, everything else is delegated."""
+    def __init__(self, loader, trace) -> None:
+        self.loader = loader
+        self.trace = trace
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.trace.import_stack.append(0.0)
+
+        start = time.perf_counter()
+
+        try:
+            self.loader.exec_module(module)
+        finally:
+            cumulative_seconds = time.perf_counter() - start
+            nested_seconds = self.trace.import_stack.pop()
+
+            # The parent import excludes this one from its own time.
+            if self.trace.import_stack:
+                self.trace.import_stack[-1] += cumulative_seconds
+
+            self.trace.imports.append((module.__name__, cumulative_seconds - nested_seconds, cumulative_seconds))
+
+
+class ImportTimingFinder(MetaPathFinder):
+    """Sits first in `sys.meta_path`, finds modules through the other finders and times their loaders."""
+    def __init__(self, trace) -> None:
+        self.trace = trace
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+
+            spec = finder.find_spec(fullname, path, target)
+
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = TimedLoader(spec.loader, self.trace)
+
+                return spec
+
+        return None
+
+
+class StartupTrace:
+    """
+    Records named phases since the start of the process and, while started,
+    the self and cumulative time of every import. \\
+    Does nothing unless `STARTUP_TRACE_ENABLED` is set or the `PYSEE_STARTUP_TRACE` environment variable is.
+    """
+    def __init__(self) -> None:
+        self.enabled: bool = STARTUP_TRACE_ENABLED or bool(os.environ.get("PYSEE_STARTUP_TRACE"))
+
+        self.REPORTED_IMPORTS: int = STARTUP_TRACE_REPORTED_IMPORTS
+
+        self.start_time = time.perf_counter()
+
+        self.phases = []
+        self.imports = []
+        self.import_stack = []
+
+        self.import_timing_finder = None
+
+    def start(self) -> None:
+        if not self.enabled or self.import_timing_finder is not None:
+            return
+
+        self.import_timing_finder = ImportTimingFinder(self)
+        sys.meta_path.insert(0, self.import_timing_finder)
+
+    def stop(self) -> None:
+        if self.import_timing_finder is not None:
+            sys.meta_path.remove(self.import_timing_finder)
+            self.import_timing_finder = None
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            if self.enabled:
+                self.phases.append((name, start - self.start_time, time.perf_counter() - start))
+
+    def mark(self, name: str) -> None:
+        """Records an instant, like the first window being shown."""
+
+        if self.enabled:
+            self.phases.append((name, time.perf_counter() - self.start_time, 0.0))
+
+    def get_report(self) -> str:
+        lines = ["STARTUP TRACE", "phase                                      at (ms)   took (ms)"]
+
+        for name, offset, duration in self.phases:
+            lines.append(f"{name:<40} {offset * 1000:>9.1f} {duration * 1000:>11.1f}")
+
+        lines.append(f"slowest {self.REPORTED_IMPORTS} of {len(self.imports)} imports     self (ms)   cumulative (ms)")
+
+        for name, self_seconds, cumulative_seconds in sorted(self.imports, key=lambda item: item[1], reverse=True)[:self.REPORTED_IMPORTS]:
+            lines.append(f"{name:<40} {self_seconds * 1000:>9.1f} {cumulative_seconds * 1000:>17.1f}")
+
+        return "\n".join(lines)
+
+    def report(self) -> None:
+        """Writes the trace so far to the standard error, whatever the logging level."""
+
+        if self.enabled:
+            print(self.get_report(), file=sys.stderr)
+
+
+def get_startup_trace() -> StartupTrace:
+    global _startup_trace
+
+    if _startup_trace is None:
+        _startup_trace = StartupTrace()
+
+    return _startup_trace
@@ -0,0 +1,96 @@
+"""
+The bootstrap of a warm interpreter, started by `utilities.interpreter_pool.InterpreterPool`. \\
+Usage: `python -u warm_interpreter.py <comma separated modules> <memory limit in megabytes>`. \\
+Caps its memory, imports the modules ahead of time, then waits for one JSON line on standard input
+naming the file to run, its working directory and the directory to import from first,
+runs it as `__main__` under the same cap and exits.
+"""
+
+import os
+import sys
+import json
+import runpy
+import traceback
+import importlib
+
+
+def limit_memory(megabytes: int) -> None:
+    """
+    Caps the address space of this interpreter and the program it runs, where the platform allows it. \\
+    Only the soft limit is lowered, a program that needs more can raise it with `resource.setrlimit`.
+    """
+
+    if megabytes <= 0:
+        return
+
+    try:
+        import resource
+    except ImportError:
+        return
+
+    limit = megabytes * 1024 * 1024
+
+    try:
+        previous_limits = resource.getrlimit(resource.RLIMIT_AS)
+
+        if previous_limits[1] != resource.RLIM_INFINITY:
+            limit = min(limit, previous_limits[1])
+
+        resource.setrlimit(resource.RLIMIT_AS, (limit, previous_limits[1]))
+    except (ValueError, OSError):
+        pass
+
+
+def preload(module_names: list) -> None:
+    for module_name in module_names:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            pass
+
+
+def run(file_name: str) -> None:
+    try:
+        runpy.run_path(file_name, run_name="__main__")
+    except SystemExit:
+        raise
+    except BaseException:
+        error_type, error, error_traceback = sys.exc_info()
+
+        # Hides the frames of this bootstrap and `runpy`, as a plain `python file.py` would.
+        while error_traceback is not None and error_traceback.tb_frame.f_code.co_filename != file_name:
+            error_traceback = error_traceback.tb_next
+
+        traceback.print_exception(error_type, error, error_traceback)
+
+        sys.exit(1)
+
+
+def main() -> None:
+    module_names = [module_name for module_name in sys.argv[1].split(",") if module_name]
+
+    # Set before the preload, so neither a runaway import nor the program can exhaust memory.
+    limit_memory(int(sys.argv[2]))
+
+    preload(module_names)
+
+    request_line = sys.stdin.readline()
+
+    if not request_line:
+        return
+
+    request = json.loads(request_line)
+
+    file_name = os.path.abspath(request["file_name"])
+
+    os.chdir(request["working_directory"])
+
+    sys.argv = [file_name]
+    # A scratch copy of a modified file imports the modules next to the file.
+    sys.path[0] = request.get("script_directory") or os.path.dirname(file_name)
+
+    run(file_name)
+
+
+if __name__ == "__main__":
+    main()